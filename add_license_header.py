@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
+import argparse
+import fnmatch
 import os
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 LICENSE_HEADER_FILE = "LICENSE_HEADER.txt"
+HEADER_MARKER = "Starship Agentic License Header"
 TARGET_EXTENSIONS = [".py"]
+# Only this much of each file is read to look for the header; it sits at the top
+HEADER_PROBE_BYTES = 4096
+# Never descended into, in addition to the patterns in .gitignore / .licenseignore
+DEFAULT_IGNORES = [".git/", ".hg/", ".svn/", "__pycache__/", ".venv/", "venv/", "env/", ".tox/", ".nox/",
+                   "build/", "dist/", "*.egg-info/", ".eggs/", "node_modules/", ".mypy_cache/",
+                   ".pytest_cache/", ".ruff_cache/"]
+IGNORE_FILES = [".gitignore", ".licenseignore"]
 
 def get_license_header():
     """Read and return the license header from LICENSE_HEADER.txt."""
@@ -14,41 +27,136 @@ def get_license_header():
         print(f"Error: {LICENSE_HEADER_FILE} not found.")
         sys.exit(1)
 
-def insert_license_header(file_path, header):
-    """Insert the license header into a file if not already present."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        contents = f.read()
+def load_ignore_patterns(root_dir):
+    """Return the default ignores plus the patterns from .gitignore and .licenseignore in root_dir."""
+    patterns = list(DEFAULT_IGNORES)
+    for name in IGNORE_FILES:
+        try:
+            with open(os.path.join(root_dir, name), "r", encoding="utf-8") as f:
+                patterns.extend(line.strip() for line in f
+                                if line.strip() and not line.startswith("#") and not line.startswith("!"))
+        except OSError:
+            continue
+    return patterns
+
+def is_ignored(rel_path, is_dir, patterns):
+    """
+    Match a path (relative to the root, '/'-separated) against .gitignore-style patterns:
+    a trailing '/' only matches directories, a pattern containing '/' is anchored at
+    the root, and any other pattern matches the name at any depth.
+    """
+    name = rel_path.rsplit("/", 1)[-1]
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            if not is_dir:
+                continue
+            pattern = pattern.rstrip("/")
+        if "/" in pattern:
+            if fnmatch.fnmatch(rel_path, pattern.lstrip("/")):
+                return True
+        elif fnmatch.fnmatch(name, pattern):
+            return True
+    return False
+
+def has_license_header(file_path):
+    """Check for the header marker in the first HEADER_PROBE_BYTES of a file."""
+    with open(file_path, "rb") as f:
+        return HEADER_MARKER.encode("utf-8") in f.read(HEADER_PROBE_BYTES)
+
+def atomic_write(file_path, contents):
+    """Replace a file's contents via a temporary file and rename, keeping its permissions."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".license-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(contents)
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
+def insert_license_header(file_path, header, check=False):
+    """
+    Insert the license header into a file if not already present.
+    Returns "present", "missing" (check mode) or "added".
+    """
     # Skip files that already include the header (using a unique identifier)
-    if "Starship Agentic License Header" in contents:
-        print(f"Skipping {file_path}: header already present.")
-        return
+    if has_license_header(file_path):
+        return "present"
+    if check:
+        return "missing"
+
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        contents = f.read()
 
     lines = contents.splitlines(keepends=True)
-    new_contents = ""
+    # Match the file's line endings
+    newline = "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+    header = header.replace("\n", newline) + newline
     if lines and lines[0].startswith("#!"):
         # Preserve shebang line and insert header after it
-        new_contents = lines[0] + header + "\n" + "".join(lines[1:])
+        new_contents = lines[0] + header + "".join(lines[1:])
     else:
-        new_contents = header + "\n" + "".join(lines)
-    
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(new_contents)
-    print(f"Added header to {file_path}")
-
-def process_directory(root_dir, header):
-    """Recursively process all Python files in the given directory."""
-    for dirpath, _, filenames in os.walk(root_dir):
-        for filename in filenames:
-            if any(filename.endswith(ext) for ext in TARGET_EXTENSIONS):
-                file_path = os.path.join(dirpath, filename)
-                insert_license_header(file_path, header)
+        new_contents = header + "".join(lines)
+
+    atomic_write(file_path, new_contents)
+    return "added"
+
+def find_target_files(root_dir, patterns):
+    """Yield the target files under root_dir, pruning ignored directories instead of walking them."""
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        rel_dir = os.path.relpath(dirpath, root_dir).replace(os.sep, "/")
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        dirnames[:] = sorted(d for d in dirnames if not is_ignored(prefix + d, True, patterns))
+        for filename in sorted(filenames):
+            if any(filename.endswith(ext) for ext in TARGET_EXTENSIONS) and \
+                    not is_ignored(prefix + filename, False, patterns):
+                yield os.path.join(dirpath, filename)
+
+def process_directory(root_dir, header, check=False, jobs=None):
+    """
+    Process all Python files in the given directory on a thread pool.
+    Returns a {file path: status} mapping.
+    """
+    patterns = load_ignore_patterns(root_dir)
+
+    def process(file_path):
+        try:
+            return insert_license_header(file_path, header, check=check)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error processing {file_path}: {e}")
+            return "error"
+
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) * 4)) as pool:
+        files = list(find_target_files(root_dir, patterns))
+        return dict(zip(files, pool.map(process, files)))
 
 def main():
+    parser = argparse.ArgumentParser(description="Add the license header to Python files that lack it")
+    parser.add_argument("paths", nargs="*", default=["."], help="Directories to process (default: .)")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report files missing the header; exit 1 if any (writes nothing)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker threads")
+    args = parser.parse_args()
+
     header = get_license_header()
-    target_dirs = ["."]
-    for d in target_dirs:
-        process_directory(d, header)
+    results = {}
+    for d in args.paths:
+        results.update(process_directory(d, header, check=args.check, jobs=args.jobs))
+
+    for file_path, status in results.items():
+        if status == "added":
+            print(f"Added header to {file_path}")
+        elif status == "missing":
+            print(f"Missing header: {file_path}")
+    counts = {status: sum(1 for s in results.values() if s == status)
+              for status in ("present", "added", "missing", "error")}
+    print(f"{len(results)} files: {counts['present']} with header, {counts['added']} added, "
+          f"{counts['missing']} missing, {counts['error']} errors")
+    if counts["error"] or (args.check and counts["missing"]):
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -1,15 +1,32 @@
 #!/usr/bin/env python3
 """
 PyPI Teleport - A utility script to build and upload packages to PyPI.
+
+Builds are cached: dist/.teleport-manifest.json records a content hash of the
+package sources, pyproject.toml and the other files that go into the sdist, taken
+after the version bump. When nothing changed since the last build, the sdist and
+wheel in dist/ are reused as they are, without bumping the version again.
 """
 
 import os
 import sys
+import shutil
+import hashlib
 import subprocess
 import getpass
 import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+BUILD_MANIFEST = Path('dist') / '.teleport-manifest.json'
+BUILD_MANIFEST_VERSION = 1
+# Files outside src/ that go into the sdist
+SOURCE_FILES = ['pyproject.toml', 'README.md', 'LICENSE.md', 'MANIFEST.in', 'setup.cfg', 'setup.py']
+IGNORED_PARTS = {'__pycache__', '.pytest_cache'}
+IGNORED_SUFFIXES = {'.pyc', '.pyo'}
+
 def check_dependencies():
     """Check if required dependencies are installed and install them if needed."""
     required = ['build', 'twine']
@@ -76,22 +93,104 @@ def clean_dist():
     else:
         dist_dir.mkdir()
 
-def build_package():
-    """Build the package using the build module."""
-    print("\n=== Building package ===")
+def source_files():
+    """Return the sorted files the sdist and wheel are built from."""
+    files = [Path(name) for name in SOURCE_FILES if Path(name).is_file()]
+    for path in Path('src').rglob('*'):
+        if path.is_file() and path.suffix not in IGNORED_SUFFIXES and \
+                not any(part in IGNORED_PARTS or part.endswith('.egg-info') for part in path.parts):
+            files.append(path)
+    return sorted(files)
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def compute_source_hash(files=None):
+    """Hash the build inputs: every source file's path and contents."""
+    digest = hashlib.sha256()
+    for path in files if files is not None else source_files():
+        digest.update(path.as_posix().encode('utf-8') + b'\0')
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+def load_build_manifest():
+    """Return the manifest of the last build, or None."""
+    try:
+        with open(BUILD_MANIFEST, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('version') == BUILD_MANIFEST_VERSION else None
+
+def write_build_manifest(manifest):
+    """Write the build manifest via a temporary file and rename."""
+    tmp_path = BUILD_MANIFEST.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, BUILD_MANIFEST)
+
+def cached_build(source_hash):
+    """
+    Return the last build's manifest if it was built from the same sources and its
+    sdist and wheel are still in dist/ unchanged, else None.
+    """
+    manifest = load_build_manifest()
+    if not manifest or manifest.get('source_hash') != source_hash:
+        return None
+    files = manifest.get('files', {})
+    kinds = {'sdist' if name.endswith('.tar.gz') else 'wheel' for name in files}
+    if kinds != {'sdist', 'wheel'}:
+        return None
+    for name, digest in files.items():
+        path = Path('dist') / name
+        if not path.is_file() or hash_file(path) != digest:
+            return None
+    return manifest
+
+def run_build(kind, cwd, outdir):
+    """Run one `python -m build --<kind>` and return (kind, seconds, result)."""
+    started = time.perf_counter()
     result = subprocess.run(
-        [sys.executable, '-m', 'build'], 
+        [sys.executable, '-m', 'build', f'--{kind}', '--outdir', str(outdir)],
+        cwd=cwd,
         capture_output=True,
         text=True,
         check=False
     )
+    return kind, time.perf_counter() - started, result
+
+def build_package():
+    """
+    Build the sdist and wheel concurrently using the build module.
+    The wheel is built from a snapshot of the source files so the two builds do not
+    share setuptools' build/ and egg-info directories. Returns {kind: seconds}.
+    """
+    print("\n=== Building package (sdist and wheel in parallel) ===")
+    outdir = Path('dist').resolve()
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='teleport-') as snapshot:
+        for path in source_files():
+            target = Path(snapshot) / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, target)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            builds = list(pool.map(lambda args: run_build(*args),
+                                   [('sdist', '.', outdir), ('wheel', snapshot, outdir)]))
     
-    if result.returncode != 0:
-        print("Error building package:")
-        print(result.stderr)
-        sys.exit(1)
+    timings = {}
+    for kind, seconds, result in builds:
+        if result.returncode != 0:
+            print(f"Error building {kind}:")
+            print(result.stderr)
+            sys.exit(1)
+        timings[kind] = seconds
+    timings['total'] = time.perf_counter() - started
     
     print("Package built successfully!")
+    print(f"  sdist: {timings['sdist']:.1f}s, wheel: {timings['wheel']:.1f}s, "
+          f"total: {timings['total']:.1f}s")
     
     # List the built files
     dist_files = list(Path('dist').glob('*'))
@@ -102,6 +201,7 @@ def build_package():
     else:
         print("No files were built. Check for errors.")
         sys.exit(1)
+    return timings
 
 def get_stored_token(test=False):
     """Get stored token from ~/.pypi-keys.json file."""
@@ -280,11 +380,27 @@ def upload_to_pypi(test=False):
 def main():
     """Main function."""
     print("🚀 PyPI Teleport - Build and upload packages to PyPI 🚀")
+    rebuild = '--rebuild' in sys.argv[1:]
     
     try:
         # Check for required dependencies
         check_dependencies()
         
+        # Reuse the last build if the sources have not changed since
+        source_hash = compute_source_hash()
+        manifest = None if rebuild else cached_build(source_hash)
+        if manifest:
+            saved = manifest.get('timings', {}).get('total', 0)
+            if manifest.get('uploaded'):
+                print(f"\nNothing changed since version {manifest['package_version']} was built and uploaded.")
+                print("Edit the sources, or run with --rebuild to build a new version anyway.")
+                return
+            print(f"\nSources unchanged since version {manifest['package_version']} was built; "
+                  f"reusing dist/ (saved ~{saved:.1f}s of build time).")
+            upload_to_pypi()
+            write_build_manifest(dict(manifest, uploaded=True))
+            return
+        
         # Automatically increment version
         current_version = get_package_version()
         if current_version:
@@ -302,10 +418,22 @@ def main():
         clean_dist()
         
         # Build the package
-        build_package()
+        timings = build_package()
+        manifest = {
+            'version': BUILD_MANIFEST_VERSION,
+            # Taken after the version bump, so an unchanged tree matches next time
+            'source_hash': compute_source_hash(),
+            'package_version': get_package_version(),
+            'files': {path.name: hash_file(path) for path in Path('dist').glob('*')
+                      if path.name.endswith(('.tar.gz', '.whl'))},
+            'timings': timings,
+            'uploaded': False,
+        }
+        write_build_manifest(manifest)
         
         # Upload directly to PyPI
         upload_to_pypi()
+        write_build_manifest(dict(manifest, uploaded=True))
         
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
@@ -12,23 +12,34 @@ Starship Agentic CLI - Static Content
 This file contains the static parts of the CLI that don't change during generation.
 """
 
+from starshipagentic.utils import profiling
+profiling.begin("import")
+
+import logging
+
 import click
-from rich.console import Console
-from rich.panel import Panel
+from starshipagentic.utils import catalog, help_cache, interactive, output
+from starshipagentic.utils.completion import SHELLS, completion_script, script_names
+from starshipagentic.utils.suggest import search_rows
+from starshipagentic.utils.lazy_group import LazyGroup
+from starshipagentic.utils.log import LOG_LEVELS, configure_logging
+from starshipagentic.utils.output import console
+from starshipagentic.utils.sequence import load_sequence, load_sequence_answers, run_command_sequence
 
-console = Console()
+logger = logging.getLogger(__name__)
 
 def enhance_group_help(group, name):
     """Enhance a command group with better help text and rich formatting."""
-    from rich.table import Table
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.text import Text
     from starshipagentic.utils.command_registry import CommandRegistry
     
-    def display_rich_help(ctx):
-        """Display rich formatted help for the command group."""
-        console = Console()
+    def render_rich_help(width, color):
+        """Render the group's help screen for a terminal of the given width and colour support."""
+        from io import StringIO
+        from rich.table import Table
+        from rich.console import Console
+        from rich.panel import Panel
+        
+        console = Console(file=StringIO(), width=width, color_system=color, force_terminal=color is not None)
         
         # Get group info from registry
         registry = CommandRegistry()
@@ -55,8 +66,8 @@ def enhance_group_help(group, name):
         
         # Add rows for each command
         commands = registry.get_all_commands(name)
-        console.print(f"[bold blue]DEBUG:[/bold blue] Group name: {name}")
-        console.print(f"[bold blue]DEBUG:[/bold blue] Commands found: {commands}")
+        logger.debug("Rendering help for group %s with commands %s", name, list(commands),
+                     extra={"group": name})
         
         if not commands:
             console.print("[italic red]No commands found for this group.[/italic red]")
@@ -64,9 +75,9 @@ def enhance_group_help(group, name):
             all_groups = registry.get_all_groups()
             console.print(f"{all_groups}")
         else:
+            group_aliases = registry.aliases_for_group(name)
             for cmd_name, cmd_info in commands.items():
-                aliases = registry.get_aliases_for_command(name, cmd_name)
-                console.print(f"[bold blue]DEBUG:[/bold blue] Aliases for {cmd_name}: {aliases}")
+                aliases = group_aliases.get(cmd_name, [])
                 alias_str = ", ".join(aliases) if aliases else ""
                 description = cmd_info.get("description", "")
                 table.add_row(cmd_name, alias_str, description)
@@ -75,6 +86,51 @@ def enhance_group_help(group, name):
         
         console.print("\n[bold green]Usage:[/bold green] [italic]<command> [OPTIONS] [ARGS][/italic]")
         console.print("[bold green]Help:[/bold green] [italic]<command> --help[/italic] for detailed information about a specific command.\n")
+        return console.file.getvalue()
+    
+    def render_plain_help():
+        """Render the group's help screen as unstyled text, without importing rich."""
+        registry = CommandRegistry()
+        replacement = name.replace('_', ' ')
+        description = registry.get_group_info(name).get('description', f'Commands for {replacement}')
+        lines = [f"{name.upper()}: {description}", ""]
+        
+        commands = registry.get_all_commands(name)
+        if not commands:
+            lines.append("No commands found for this group.")
+            lines.append(f"Available groups in registry: {', '.join(registry.get_all_groups())}")
+        else:
+            group_aliases = registry.aliases_for_group(name)
+            width = max(len(cmd_name) for cmd_name in commands)
+            lines.append("Commands:")
+            for cmd_name, cmd_info in commands.items():
+                aliases = group_aliases.get(cmd_name, [])
+                alias_str = f" (aliases: {', '.join(aliases)})" if aliases else ""
+                lines.append(f"  {cmd_name:<{width}}  {cmd_info.get('description', '')}{alias_str}")
+        
+        lines.append("")
+        lines.append("Usage: <command> [OPTIONS] [ARGS]")
+        lines.append("Help: <command> --help for detailed information about a specific command.")
+        return "\n".join(lines) + "\n"
+    
+    def display_rich_help(ctx):
+        """Display rich formatted help for the command group, pre-rendered when cached."""
+        import sys
+        
+        if output.is_plain():
+            # --plain / STARSHIPAGENTIC_PLAIN / piped output: no styling, no rich
+            width, _color = help_cache.terminal_profile()
+            text = help_cache.cached(f"plain:{name}", (width, None), __file__, render_plain_help)
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+        
+        profile = help_cache.terminal_profile()
+        text = help_cache.cached(f"rich:{name}", profile, __file__, lambda: render_rich_help(*profile))
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
+    display_rich_help = profiling.timer.timed("output", display_rich_help)
     
     # Override the help formatting for the group
     group.format_help = lambda ctx, formatter: None
@@ -93,6 +149,17 @@ def enhance_group_help(group, name):
             param.callback = custom_help_callback
             break
     
+    # Newer click builds the help option on demand instead of listing it in params
+    original_get_help_option = group.get_help_option
+    
+    def get_help_option(ctx):
+        option = original_get_help_option(ctx)
+        if option is not None:
+            option.callback = custom_help_callback
+        return option
+    
+    group.get_help_option = get_help_option
+    
     # Store the original callback
     original_callback = group.callback
     
@@ -112,155 +179,260 @@ def enhance_group_help(group, name):
     # Replace the group's callback
     group.callback = new_callback
     group.invoke_without_command = True
+    group.no_args_is_help = False
     
     # Set a basic help text for when --help isn't used
     group.help = f"[{name.upper()}] Commands for {name.replace('_', ' ')}"
     
     return group
 
-@click.group(invoke_without_command=True)
+def command_resolver(group_name=None):
+    """Return a resolver mapping a token to subcommand names, top-level or within a group."""
+    from starshipagentic.utils.command_registry import CommandRegistry
+
+    def resolve(token):
+        # Top-level prefixes must also see the commands defined on main itself (find, completion)
+        builtins = () if group_name else list(main.commands)
+        path = CommandRegistry().resolve_command_path(token, group_name, builtins=builtins)
+        if path and group_name:
+            # Inside a group only the command name is left to dispatch
+            return path[1:]
+        return path
+    return resolve
+
+def command_suggester(group_name=None):
+    """Return a suggester mapping an unknown token to the closest names, top-level or within a group."""
+    from starshipagentic.utils.command_registry import CommandRegistry
+
+    def suggest(token):
+        builtins = () if group_name else list(main.commands)
+        return CommandRegistry().suggest(token, group_name, builtins=builtins)
+    return suggest
+
+def load_command_group(name, group):
+    """Attach a group's commands lazily and enhance its help on first dispatch."""
+    from starshipagentic.utils.command_registry import CommandRegistry
+
+    if isinstance(group, LazyGroup):
+        registry = CommandRegistry()
+        for cmd_name in registry.get_all_commands(name):
+            if cmd_name not in group.commands:
+                group.add_lazy_command(cmd_name, registry.get_command_import_path(name, cmd_name))
+        group.resolver = command_resolver(name)
+        group.suggester = command_suggester(name)
+    return enhance_group_help(group, name)
+
+def logging_option(ctx, param, value):
+    """Apply --log-level/--log-file as soon as they are parsed."""
+    options = ctx.meta.setdefault("starshipagentic.logging", {})
+    options[param.name] = value
+    try:
+        configure_logging(level=options.get("log_level"), log_file=options.get("log_file"))
+    except (OSError, ValueError) as e:
+        raise click.BadParameter(str(e), ctx=ctx, param=param)
+    return value
+
+def plain_option(ctx, param, value):
+    """Switch to plain, unstyled output as soon as --plain is parsed."""
+    if value:
+        output.set_plain(True)
+    return value
+
+def interactive_option(ctx, param, value):
+    """Apply --answers/--non-interactive as soon as they are parsed."""
+    if param.name == "answers_file" and value:
+        interactive.configure(answers_file=value)
+    elif param.name == "non_interactive" and value:
+        interactive.configure(strict=True)
+    return value
+
+def profile_option(ctx, param, value):
+    """Start reporting per-phase timings once --profile or --profile-output is seen."""
+    options = ctx.meta.setdefault("starshipagentic.profile", {})
+    options[param.name] = value
+    if value and not options.get("enabled"):
+        options["enabled"] = True
+        profiling.enable()
+        ctx.call_on_close(lambda: profiling.report(options.get("profile_output")))
+    if param.name == "profile_output" and value:
+        profiling.collect_stats()
+    return value
+
+@click.group(cls=LazyGroup, invoke_without_command=True, on_load=load_command_group,
+             resolver=command_resolver(), suggester=command_suggester())
 @click.option("--all-commands", is_flag=True, help="Display all available commands")
 @click.option("--commands-list", is_flag=True, help="Display commands from commands-list.yml")
+@click.option("--format", "output_format", type=click.Choice(catalog.FORMATS), default="text", show_default=True,
+              help="Output format for --all-commands and --commands-list")
+@click.option("--sequence", "sequence_file", is_flag=False, flag_value="", default=None, metavar="[FILE]",
+              help="Run the command sequence from FILE (default: starshipagentic.yml)")
+@click.option("--continue-on-error", is_flag=True, help="Keep running a sequence after a step fails")
+@click.option("--report", "report_path", type=click.Path(dir_okay=False), help="Write a JSON sequence run report")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Run up to N independent sequence steps at once")
+@click.option("--log-level", type=click.Choice(LOG_LEVELS, case_sensitive=False), is_eager=True,
+              expose_value=False, callback=logging_option,
+              help="Logging level (default: $STARSHIPAGENTIC_LOG_LEVEL or WARNING)")
+@click.option("--log-file", type=click.Path(dir_okay=False), is_eager=True, expose_value=False,
+              callback=logging_option, help="Also write JSON-lines log records to FILE ('-' for stderr)")
+@click.option("--answers", "answers_file", type=click.Path(exists=True, dir_okay=False), is_eager=True,
+              expose_value=False, callback=interactive_option,
+              help="YAML/JSON file answering parameters that would be prompted for")
+@click.option("--non-interactive", is_flag=True, is_eager=True, expose_value=False, callback=interactive_option,
+              help="Never prompt; fail when a parameter has no value or default")
+@click.option("--plain", is_flag=True, is_eager=True, expose_value=False, callback=plain_option,
+              help="Plain, unstyled output (default when stdout is not a terminal)")
+@click.option("--profile", is_flag=True, is_eager=True, expose_value=False, callback=profile_option,
+              help="Report the time spent per phase on stderr")
+@click.option("--profile-output", type=click.Path(dir_okay=False), is_eager=True, expose_value=False,
+              callback=profile_option,
+              help="Profile the command body to FILE (pstats) and FILE.collapsed; implies --profile")
 @click.pass_context
-def main(ctx, all_commands, commands_list):
+def main(ctx, all_commands, commands_list, output_format, sequence_file, continue_on_error, report_path, jobs):
     """Starship Agentic CLI - Your AI-powered command center."""
     import sys
     
-    # Debug the command line arguments
-    console.print(f"[bold blue]DEBUG: sys.argv: {sys.argv}[/bold blue]")
+    logger.debug("Invoked with argv %s", sys.argv, extra={"argv": sys.argv, "subcommand": ctx.invoked_subcommand})
     
     if ctx.invoked_subcommand is None:
-        console.print(Panel("Welcome to Starship Agentic", title="🚀"))
+        if sequence_file is not None:
+            try:
+                report = run_command_sequence(load_sequence(sequence_file or None), cli=ctx.command,
+                                              stop_on_failure=not continue_on_error,
+                                              report_path=report_path, jobs=jobs,
+                                              answers=load_sequence_answers(sequence_file or None))
+            except ValueError as e:
+                raise click.UsageError(f"Invalid sequence: {e}")
+            ctx.exit(0 if report["ok"] else 1)
         if all_commands:
-            console.print("All commands would be displayed here")
+            catalog.write_catalog(catalog.registry_rows(), output_format)
         elif commands_list:
-            console.print("Commands from commands-list.yml would be displayed here")
+            catalog.write_catalog(catalog.commands_list_rows(), output_format)
+        elif output.is_plain():
+            console.print("Welcome to Starship Agentic")
+            console.print("Use --help for more information")
         else:
+            from rich.panel import Panel
+            console.print(Panel("Welcome to Starship Agentic", title="🚀"))
             console.print("Use --help for more information")
     else:
-        console.print(f"[bold red]DEBUG: Delegating control to subcommand: {ctx.invoked_subcommand}[/bold red]")
-        
-        # Get the subcommand
-        sub_cmd = ctx.command.get_command(ctx, ctx.invoked_subcommand)
-        if sub_cmd:
-            # Special handling for nested commands
-            if hasattr(sub_cmd, 'commands') and len(sys.argv) > 3:
-                # The format is: starshipagentic group_name command_name [options]
-                # So sys.argv[2] should be the command name
-                nested_cmd_name = sys.argv[2]
-                console.print(f"[bold blue]DEBUG: Looking for nested command: {nested_cmd_name}[/bold blue]")
-                
-                # Try to get the nested command from the group
-                nested_cmd = sub_cmd.get_command(ctx, nested_cmd_name)
-                if nested_cmd:
-                    console.print(f"[bold green]DEBUG: Found nested command: {nested_cmd_name}[/bold green]")
-                    
-                    # If --help is in the arguments, we need to show help for the nested command
-                    if '--help' in sys.argv:
-                        console.print(f"[bold green]DEBUG: Showing help for nested command: {nested_cmd_name}[/bold green]")
-                        help_ctx = click.Context(nested_cmd, parent=ctx, info_name=nested_cmd_name)
-                        click.echo(nested_cmd.get_help(help_ctx))
-                        return ctx.exit()
-                    
-                    # Otherwise, invoke the nested command with the remaining args
-                    # Remove the first 3 arguments (starshipagentic, group_name, command_name)
-                    remaining_args = sys.argv[3:]
-                    console.print(f"[bold blue]DEBUG: Remaining args for nested command: {remaining_args}[/bold blue]")
-                    
-                    # Create a new context for the nested command
-                    nested_ctx = click.Context(nested_cmd, parent=ctx, info_name=nested_cmd_name)
-                    
-                    # Invoke the nested command directly
-                    return nested_cmd.main(remaining_args, standalone_mode=False)
-            
-            # Otherwise, invoke the subcommand normally
-            return ctx.invoke(sub_cmd)
-        else:
-            console.print(f"[bold red]DEBUG: Subcommand {ctx.invoked_subcommand} not found.[/bold red]")
-            ctx.exit()
+        # Click dispatches to the (lazily loaded) group and command itself
+        logger.debug("Delegating control to subcommand %s", ctx.invoked_subcommand)
+
+@main.command("completion")
+@click.argument("shell", type=click.Choice(SHELLS))
+def completion_command(shell):
+    """Print the completion script for SHELL (bash, zsh or fish).
+
+    For example: eval "$(starshipagentic completion bash)"
+    """
+    click.echo(completion_script(shell, script_names()), nl=False)
+
+@main.command("find")
+@click.argument("text", nargs=-1, required=True)
+@click.option("--format", "output_format", type=click.Choice(catalog.FORMATS), default="text", show_default=True,
+              help="Output format")
+@click.option("--limit", type=click.IntRange(min=1), default=10, show_default=True, help="Maximum number of results")
+def find_command(text, output_format, limit):
+    """Search command names, aliases and descriptions for TEXT (typos allowed)."""
+    rows = search_rows(catalog.registry_rows(), " ".join(text), limit=limit)
+    if not catalog.write_catalog(rows, output_format) and output_format == "text":
+        click.echo(f"No commands match '{' '.join(text)}'", err=True)
 
 #!/usr/bin/env python3
 """
 AUTO-GENERATED FILE – DO NOT EDIT MANUALLY.
 This file is generated by the sync2_aliases.py tool.
-It contains all dynamic imports, group themes/icons, and group help registration code.
+It contains the lazy command import table, group themes/icons, and group registration code.
 """
 
 # [AUTO-GENERATED COMMAND IMPORTS START]
-from starshipagentic.commands.fleet_commander import run_group as fleet_commander
-from starshipagentic.commands.number_two import run_group as number_two
-from starshipagentic.commands.engineering_officer import run_group as engineering_officer
-from starshipagentic.commands.navigation_officer import run_group as navigation_officer
-from starshipagentic.commands.communications_officer import run_group as communications_officer
-from starshipagentic.commands.insterstellar_officer import run_group as insterstellar_officer
-from starshipagentic.commands.captains_orders import run_group as captains_orders
-from starshipagentic.commands.tactical_officer import run_group as tactical_officer
-from starshipagentic.commands.maintenance_officer import run_group as maintenance_officer
-from starshipagentic.commands.red_buttons import run_group as red_buttons
-from starshipagentic.commands.gitmaster import run_group as gitmaster
-from starshipagentic.commands.mcars import run_group as mcars
-from starshipagentic.commands.droids import run_group as droids
-from starshipagentic.commands.fleet_commander.tour_ship.cli import tour_ship_command as tour_ship
-from starshipagentic.commands.fleet_commander.tour_ship.cli import tour_ship_command as tour
-from starshipagentic.commands.fleet_commander.commission_ship.cli import commission_ship_command as commission_ship
-from starshipagentic.commands.fleet_commander.commission_ship.cli import commission_ship_command as commission
-from starshipagentic.commands.fleet_commander.visualize_ship.cli import visualize_ship_command as visualize_ship
-from starshipagentic.commands.fleet_commander.visualize_ship.cli import visualize_ship_command as visualize
-from starshipagentic.commands.fleet_commander.visualize_ship.cli import visualize_ship_command as ships
-from starshipagentic.commands.fleet_commander.visualize_ship.cli import visualize_ship_command as fleet
-from starshipagentic.commands.number_two.mission_brief.cli import mission_brief_command as mission_brief
-from starshipagentic.commands.number_two.mission_brief.cli import mission_brief_command as mission
-from starshipagentic.commands.number_two.expand_mission.cli import expand_mission_command as expand_mission
-from starshipagentic.commands.number_two.expand_mission.cli import expand_mission_command as expand
-from starshipagentic.commands.engineering_officer.review_schematics.cli import review_schematics_command as review_schematics
-from starshipagentic.commands.engineering_officer.review_schematics.cli import review_schematics_command as schematics
-from starshipagentic.commands.engineering_officer.calibrate_technology.cli import calibrate_technology_command as calibrate_technology
-from starshipagentic.commands.engineering_officer.calibrate_technology.cli import calibrate_technology_command as calibrate
-from starshipagentic.commands.navigation_officer.plot_navigation.cli import plot_navigation_command as plot_navigation
-from starshipagentic.commands.navigation_officer.plot_navigation.cli import plot_navigation_command as navigation
-from starshipagentic.commands.navigation_officer.set_waypoints.cli import set_waypoints_command as set_waypoints
-from starshipagentic.commands.navigation_officer.set_waypoints.cli import set_waypoints_command as waypoints
-from starshipagentic.commands.communications_officer.authorize_codes.cli import authorize_codes_command as authorize_codes
-from starshipagentic.commands.communications_officer.authorize_codes.cli import authorize_codes_command as authorize
-from starshipagentic.commands.communications_officer.scan_sector.cli import scan_sector_command as scan_sector
-from starshipagentic.commands.communications_officer.scan_sector.cli import scan_sector_command as scan
-from starshipagentic.commands.communications_officer.receive_transmission.cli import receive_transmission_command as receive_transmission
-from starshipagentic.commands.communications_officer.receive_transmission.cli import receive_transmission_command as transmission
-from starshipagentic.commands.insterstellar_officer.map_planet.cli import map_planet_command as map_planet
-from starshipagentic.commands.insterstellar_officer.map_planet.cli import map_planet_command as map
-from starshipagentic.commands.insterstellar_officer.build_landing_zone.cli import build_landing_zone_command as build_landing_zone
-from starshipagentic.commands.insterstellar_officer.build_landing_zone.cli import build_landing_zone_command as buildlz
-from starshipagentic.commands.insterstellar_officer.fabricate_infrastructure.cli import fabricate_infrastructure_command as fabricate_infrastructure
-from starshipagentic.commands.insterstellar_officer.fabricate_infrastructure.cli import fabricate_infrastructure_command as fabricate
-from starshipagentic.commands.captains_orders.warp_speed.cli import warp_speed_command as warp_speed
-from starshipagentic.commands.captains_orders.warp_speed.cli import warp_speed_command as warp
-from starshipagentic.commands.captains_orders.trycoder.cli import trycoder_command as trycoder
-from starshipagentic.commands.captains_orders.engage.cli import engage_command as engage
-from starshipagentic.commands.tactical_officer.fire_photons.cli import fire_photons_command as fire_photons
-from starshipagentic.commands.tactical_officer.fire_photons.cli import fire_photons_command as photons
-from starshipagentic.commands.tactical_officer.aim_lasers.cli import aim_lasers_command as aim_lasers
-from starshipagentic.commands.tactical_officer.aim_lasers.cli import aim_lasers_command as lasers
-from starshipagentic.commands.tactical_officer.shields_up.cli import shields_up_command as shields_up
-from starshipagentic.commands.tactical_officer.shields_up.cli import shields_up_command as shields
-from starshipagentic.commands.maintenance_officer.create_checkpoint.cli import create_checkpoint_command as create_checkpoint
-from starshipagentic.commands.maintenance_officer.create_checkpoint.cli import create_checkpoint_command as checkpoint
-from starshipagentic.commands.maintenance_officer.restore_checkpoint.cli import restore_checkpoint_command as restore_checkpoint
-from starshipagentic.commands.maintenance_officer.restore_checkpoint.cli import restore_checkpoint_command as restore
-from starshipagentic.commands.maintenance_officer.inspect_vessel.cli import inspect_vessel_command as inspect_vessel
-from starshipagentic.commands.maintenance_officer.inspect_vessel.cli import inspect_vessel_command as inspect
-from starshipagentic.commands.maintenance_officer.complexity_report.cli import complexity_report_command as complexity_report
-from starshipagentic.commands.maintenance_officer.complexity_report.cli import complexity_report_command as complexity
-from starshipagentic.commands.red_buttons.supernova.cli import supernova_command as supernova
-from starshipagentic.commands.gitmaster.teleport.cli import teleport_command as teleport
-from starshipagentic.commands.mcars.search.cli import search_command as search
-from starshipagentic.commands.mcars.transport.cli import transport_command as transport
-from starshipagentic.commands.droids.droid_splain.cli import droid_splain_command as droid_splain
-from starshipagentic.commands.droids.droid_splain.cli import droid_splain_command as droid
-from starshipagentic.commands.droids.man_splain.cli import man_splain_command as man_splain
-from starshipagentic.commands.droids.man_splain.cli import man_splain_command as splain
+COMMAND_IMPORTS = {
+    "fleet_commander": "starshipagentic.commands.fleet_commander:run_group",
+    "number_two": "starshipagentic.commands.number_two:run_group",
+    "engineering_officer": "starshipagentic.commands.engineering_officer:run_group",
+    "navigation_officer": "starshipagentic.commands.navigation_officer:run_group",
+    "communications_officer": "starshipagentic.commands.communications_officer:run_group",
+    "insterstellar_officer": "starshipagentic.commands.insterstellar_officer:run_group",
+    "captains_orders": "starshipagentic.commands.captains_orders:run_group",
+    "tactical_officer": "starshipagentic.commands.tactical_officer:run_group",
+    "maintenance_officer": "starshipagentic.commands.maintenance_officer:run_group",
+    "red_buttons": "starshipagentic.commands.red_buttons:run_group",
+    "gitmaster": "starshipagentic.commands.gitmaster:run_group",
+    "mcars": "starshipagentic.commands.mcars:run_group",
+    "droids": "starshipagentic.commands.droids:run_group",
+    "tour_ship": "starshipagentic.commands.fleet_commander.tour_ship.cli:tour_ship_command",
+    "tour": "starshipagentic.commands.fleet_commander.tour_ship.cli:tour_ship_command",
+    "commission_ship": "starshipagentic.commands.fleet_commander.commission_ship.cli:commission_ship_command",
+    "commission": "starshipagentic.commands.fleet_commander.commission_ship.cli:commission_ship_command",
+    "visualize_ship": "starshipagentic.commands.fleet_commander.visualize_ship.cli:visualize_ship_command",
+    "visualize": "starshipagentic.commands.fleet_commander.visualize_ship.cli:visualize_ship_command",
+    "ships": "starshipagentic.commands.fleet_commander.visualize_ship.cli:visualize_ship_command",
+    "fleet": "starshipagentic.commands.fleet_commander.visualize_ship.cli:visualize_ship_command",
+    "mission_brief": "starshipagentic.commands.number_two.mission_brief.cli:mission_brief_command",
+    "mission": "starshipagentic.commands.number_two.mission_brief.cli:mission_brief_command",
+    "expand_mission": "starshipagentic.commands.number_two.expand_mission.cli:expand_mission_command",
+    "expand": "starshipagentic.commands.number_two.expand_mission.cli:expand_mission_command",
+    "review_schematics": "starshipagentic.commands.engineering_officer.review_schematics.cli:review_schematics_command",
+    "schematics": "starshipagentic.commands.engineering_officer.review_schematics.cli:review_schematics_command",
+    "calibrate_technology": "starshipagentic.commands.engineering_officer.calibrate_technology.cli:calibrate_technology_command",
+    "calibrate": "starshipagentic.commands.engineering_officer.calibrate_technology.cli:calibrate_technology_command",
+    "plot_navigation": "starshipagentic.commands.navigation_officer.plot_navigation.cli:plot_navigation_command",
+    "navigation": "starshipagentic.commands.navigation_officer.plot_navigation.cli:plot_navigation_command",
+    "set_waypoints": "starshipagentic.commands.navigation_officer.set_waypoints.cli:set_waypoints_command",
+    "waypoints": "starshipagentic.commands.navigation_officer.set_waypoints.cli:set_waypoints_command",
+    "authorize_codes": "starshipagentic.commands.communications_officer.authorize_codes.cli:authorize_codes_command",
+    "authorize": "starshipagentic.commands.communications_officer.authorize_codes.cli:authorize_codes_command",
+    "scan_sector": "starshipagentic.commands.communications_officer.scan_sector.cli:scan_sector_command",
+    "scan": "starshipagentic.commands.communications_officer.scan_sector.cli:scan_sector_command",
+    "receive_transmission": "starshipagentic.commands.communications_officer.receive_transmission.cli:receive_transmission_command",
+    "transmission": "starshipagentic.commands.communications_officer.receive_transmission.cli:receive_transmission_command",
+    "map_planet": "starshipagentic.commands.insterstellar_officer.map_planet.cli:map_planet_command",
+    "map": "starshipagentic.commands.insterstellar_officer.map_planet.cli:map_planet_command",
+    "build_landing_zone": "starshipagentic.commands.insterstellar_officer.build_landing_zone.cli:build_landing_zone_command",
+    "buildlz": "starshipagentic.commands.insterstellar_officer.build_landing_zone.cli:build_landing_zone_command",
+    "fabricate_infrastructure": "starshipagentic.commands.insterstellar_officer.fabricate_infrastructure.cli:fabricate_infrastructure_command",
+    "fabricate": "starshipagentic.commands.insterstellar_officer.fabricate_infrastructure.cli:fabricate_infrastructure_command",
+    "warp_speed": "starshipagentic.commands.captains_orders.warp_speed.cli:warp_speed_command",
+    "warp": "starshipagentic.commands.captains_orders.warp_speed.cli:warp_speed_command",
+    "trycoder": "starshipagentic.commands.captains_orders.trycoder.cli:trycoder_command",
+    "engage": "starshipagentic.commands.captains_orders.engage.cli:engage_command",
+    "fire_photons": "starshipagentic.commands.tactical_officer.fire_photons.cli:fire_photons_command",
+    "photons": "starshipagentic.commands.tactical_officer.fire_photons.cli:fire_photons_command",
+    "aim_lasers": "starshipagentic.commands.tactical_officer.aim_lasers.cli:aim_lasers_command",
+    "lasers": "starshipagentic.commands.tactical_officer.aim_lasers.cli:aim_lasers_command",
+    "shields_up": "starshipagentic.commands.tactical_officer.shields_up.cli:shields_up_command",
+    "shields": "starshipagentic.commands.tactical_officer.shields_up.cli:shields_up_command",
+    "create_checkpoint": "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command",
+    "checkpoint": "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command",
+    "restore_checkpoint": "starshipagentic.commands.maintenance_officer.restore_checkpoint.cli:restore_checkpoint_command",
+    "restore": "starshipagentic.commands.maintenance_officer.restore_checkpoint.cli:restore_checkpoint_command",
+    "inspect_vessel": "starshipagentic.commands.maintenance_officer.inspect_vessel.cli:inspect_vessel_command",
+    "inspect": "starshipagentic.commands.maintenance_officer.inspect_vessel.cli:inspect_vessel_command",
+    "complexity_report": "starshipagentic.commands.maintenance_officer.complexity_report.cli:complexity_report_command",
+    "complexity": "starshipagentic.commands.maintenance_officer.complexity_report.cli:complexity_report_command",
+    "supernova": "starshipagentic.commands.red_buttons.supernova.cli:supernova_command",
+    "teleport": "starshipagentic.commands.gitmaster.teleport.cli:teleport_command",
+    "search": "starshipagentic.commands.mcars.search.cli:search_command",
+    "transport": "starshipagentic.commands.mcars.transport.cli:transport_command",
+    "droid_splain": "starshipagentic.commands.droids.droid_splain.cli:droid_splain_command",
+    "droid": "starshipagentic.commands.droids.droid_splain.cli:droid_splain_command",
+    "man_splain": "starshipagentic.commands.droids.man_splain.cli:man_splain_command",
+    "splain": "starshipagentic.commands.droids.man_splain.cli:man_splain_command",
+}
 # [AUTO-GENERATED COMMAND IMPORTS END]
 
 
+def __getattr__(name):
+    """Import an aliased command from COMMAND_IMPORTS on first attribute access."""
+    import_path = COMMAND_IMPORTS.get(name)
+    if import_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module_name, attr_name = import_path.split(":", 1)
+    return getattr(importlib.import_module(module_name), attr_name)
+
+
 # [AUTO-GENERATED GROUP THEMES AND ICONS START]
 GROUP_THEMES = {
     "fleet_commander": "white",
@@ -298,21 +470,21 @@ GROUP_ICONS = {
 
 
 def register_dynamic_groups():
-    """Register all dynamic command groups with the main CLI."""
-    from starshipagentic.cli import main, enhance_group_help
-    import importlib
+    """Register all dynamic command groups with the main CLI.
+
+    Groups are registered by import path only; a group package and its
+    commands are imported the first time click dispatches to them.
+    """
+    from starshipagentic.cli import main
     GROUP_NAMES = ['fleet_commander', 'number_two', 'engineering_officer', 'navigation_officer', 'communications_officer', 'insterstellar_officer', 'captains_orders', 'tactical_officer', 'maintenance_officer', 'red_buttons', 'gitmaster', 'mcars', 'droids']
     for group in GROUP_NAMES:
-        mod = importlib.import_module(f'starshipagentic.commands.{group}')
-        group_obj = getattr(mod, f'{group}_group', None)
-        if group_obj is None:
-            continue
-        enhanced = enhance_group_help(group_obj, group)
-        main.add_command(enhanced, group)
+        main.add_lazy_command(group, f'starshipagentic.commands.{group}:{group}_group')
 
 
 from starshipagentic.cli_generated import register_dynamic_groups
-register_dynamic_groups()
+with profiling.phase("register"):
+    register_dynamic_groups()
+profiling.end("import")
 
 
 if __name__ == "__main__":
@@ -2,84 +2,96 @@
 """
 AUTO-GENERATED FILE – DO NOT EDIT MANUALLY.
 This file is generated by the sync2_aliases.py tool.
-It contains all dynamic imports, group themes/icons, and group help registration code.
+It contains the lazy command import table, group themes/icons, and group registration code.
 """
 
 # [AUTO-GENERATED COMMAND IMPORTS START]
-from starshipagentic.commands.fleet_commander import run_group as fleet_commander
-from starshipagentic.commands.number_two import run_group as number_two
-from starshipagentic.commands.engineering_officer import run_group as engineering_officer
-from starshipagentic.commands.navigation_officer import run_group as navigation_officer
-from starshipagentic.commands.communications_officer import run_group as communications_officer
-from starshipagentic.commands.insterstellar_officer import run_group as insterstellar_officer
-from starshipagentic.commands.captains_orders import run_group as captains_orders
-from starshipagentic.commands.tactical_officer import run_group as tactical_officer
-from starshipagentic.commands.maintenance_officer import run_group as maintenance_officer
-from starshipagentic.commands.red_buttons import run_group as red_buttons
-from starshipagentic.commands.gitmaster import run_group as gitmaster
-from starshipagentic.commands.mcars import run_group as mcars
-from starshipagentic.commands.droids import run_group as droids
-from starshipagentic.commands.fleet_commander.tour_ship.cli import tour_ship_command as tour_ship
-from starshipagentic.commands.fleet_commander.tour_ship.cli import tour_ship_command as tour
-from starshipagentic.commands.fleet_commander.commission_ship.cli import commission_ship_command as commission_ship
-from starshipagentic.commands.fleet_commander.commission_ship.cli import commission_ship_command as commission
-from starshipagentic.commands.fleet_commander.visualize_ship.cli import visualize_ship_command as visualize_ship
-from starshipagentic.commands.fleet_commander.visualize_ship.cli import visualize_ship_command as visualize
-from starshipagentic.commands.fleet_commander.visualize_ship.cli import visualize_ship_command as ships
-from starshipagentic.commands.fleet_commander.visualize_ship.cli import visualize_ship_command as fleet
-from starshipagentic.commands.number_two.mission_brief.cli import mission_brief_command as mission_brief
-from starshipagentic.commands.number_two.mission_brief.cli import mission_brief_command as mission
-from starshipagentic.commands.number_two.expand_mission.cli import expand_mission_command as expand_mission
-from starshipagentic.commands.number_two.expand_mission.cli import expand_mission_command as expand
-from starshipagentic.commands.engineering_officer.review_schematics.cli import review_schematics_command as review_schematics
-from starshipagentic.commands.engineering_officer.review_schematics.cli import review_schematics_command as schematics
-from starshipagentic.commands.engineering_officer.calibrate_technology.cli import calibrate_technology_command as calibrate_technology
-from starshipagentic.commands.engineering_officer.calibrate_technology.cli import calibrate_technology_command as calibrate
-from starshipagentic.commands.navigation_officer.plot_navigation.cli import plot_navigation_command as plot_navigation
-from starshipagentic.commands.navigation_officer.plot_navigation.cli import plot_navigation_command as navigation
-from starshipagentic.commands.navigation_officer.set_waypoints.cli import set_waypoints_command as set_waypoints
-from starshipagentic.commands.navigation_officer.set_waypoints.cli import set_waypoints_command as waypoints
-from starshipagentic.commands.communications_officer.authorize_codes.cli import authorize_codes_command as authorize_codes
-from starshipagentic.commands.communications_officer.authorize_codes.cli import authorize_codes_command as authorize
-from starshipagentic.commands.communications_officer.scan_sector.cli import scan_sector_command as scan_sector
-from starshipagentic.commands.communications_officer.scan_sector.cli import scan_sector_command as scan
-from starshipagentic.commands.communications_officer.receive_transmission.cli import receive_transmission_command as receive_transmission
-from starshipagentic.commands.communications_officer.receive_transmission.cli import receive_transmission_command as transmission
-from starshipagentic.commands.insterstellar_officer.map_planet.cli import map_planet_command as map_planet
-from starshipagentic.commands.insterstellar_officer.map_planet.cli import map_planet_command as map
-from starshipagentic.commands.insterstellar_officer.build_landing_zone.cli import build_landing_zone_command as build_landing_zone
-from starshipagentic.commands.insterstellar_officer.build_landing_zone.cli import build_landing_zone_command as buildlz
-from starshipagentic.commands.insterstellar_officer.fabricate_infrastructure.cli import fabricate_infrastructure_command as fabricate_infrastructure
-from starshipagentic.commands.insterstellar_officer.fabricate_infrastructure.cli import fabricate_infrastructure_command as fabricate
-from starshipagentic.commands.captains_orders.warp_speed.cli import warp_speed_command as warp_speed
-from starshipagentic.commands.captains_orders.warp_speed.cli import warp_speed_command as warp
-from starshipagentic.commands.captains_orders.trycoder.cli import trycoder_command as trycoder
-from starshipagentic.commands.captains_orders.engage.cli import engage_command as engage
-from starshipagentic.commands.tactical_officer.fire_photons.cli import fire_photons_command as fire_photons
-from starshipagentic.commands.tactical_officer.fire_photons.cli import fire_photons_command as photons
-from starshipagentic.commands.tactical_officer.aim_lasers.cli import aim_lasers_command as aim_lasers
-from starshipagentic.commands.tactical_officer.aim_lasers.cli import aim_lasers_command as lasers
-from starshipagentic.commands.tactical_officer.shields_up.cli import shields_up_command as shields_up
-from starshipagentic.commands.tactical_officer.shields_up.cli import shields_up_command as shields
-from starshipagentic.commands.maintenance_officer.create_checkpoint.cli import create_checkpoint_command as create_checkpoint
-from starshipagentic.commands.maintenance_officer.create_checkpoint.cli import create_checkpoint_command as checkpoint
-from starshipagentic.commands.maintenance_officer.restore_checkpoint.cli import restore_checkpoint_command as restore_checkpoint
-from starshipagentic.commands.maintenance_officer.restore_checkpoint.cli import restore_checkpoint_command as restore
-from starshipagentic.commands.maintenance_officer.inspect_vessel.cli import inspect_vessel_command as inspect_vessel
-from starshipagentic.commands.maintenance_officer.inspect_vessel.cli import inspect_vessel_command as inspect
-from starshipagentic.commands.maintenance_officer.complexity_report.cli import complexity_report_command as complexity_report
-from starshipagentic.commands.maintenance_officer.complexity_report.cli import complexity_report_command as complexity
-from starshipagentic.commands.red_buttons.supernova.cli import supernova_command as supernova
-from starshipagentic.commands.gitmaster.teleport.cli import teleport_command as teleport
-from starshipagentic.commands.mcars.search.cli import search_command as search
-from starshipagentic.commands.mcars.transport.cli import transport_command as transport
-from starshipagentic.commands.droids.droid_splain.cli import droid_splain_command as droid_splain
-from starshipagentic.commands.droids.droid_splain.cli import droid_splain_command as droid
-from starshipagentic.commands.droids.man_splain.cli import man_splain_command as man_splain
-from starshipagentic.commands.droids.man_splain.cli import man_splain_command as splain
+COMMAND_IMPORTS = {
+    "fleet_commander": "starshipagentic.commands.fleet_commander:run_group",
+    "number_two": "starshipagentic.commands.number_two:run_group",
+    "engineering_officer": "starshipagentic.commands.engineering_officer:run_group",
+    "navigation_officer": "starshipagentic.commands.navigation_officer:run_group",
+    "communications_officer": "starshipagentic.commands.communications_officer:run_group",
+    "insterstellar_officer": "starshipagentic.commands.insterstellar_officer:run_group",
+    "captains_orders": "starshipagentic.commands.captains_orders:run_group",
+    "tactical_officer": "starshipagentic.commands.tactical_officer:run_group",
+    "maintenance_officer": "starshipagentic.commands.maintenance_officer:run_group",
+    "red_buttons": "starshipagentic.commands.red_buttons:run_group",
+    "gitmaster": "starshipagentic.commands.gitmaster:run_group",
+    "mcars": "starshipagentic.commands.mcars:run_group",
+    "droids": "starshipagentic.commands.droids:run_group",
+    "tour_ship": "starshipagentic.commands.fleet_commander.tour_ship.cli:tour_ship_command",
+    "tour": "starshipagentic.commands.fleet_commander.tour_ship.cli:tour_ship_command",
+    "commission_ship": "starshipagentic.commands.fleet_commander.commission_ship.cli:commission_ship_command",
+    "commission": "starshipagentic.commands.fleet_commander.commission_ship.cli:commission_ship_command",
+    "visualize_ship": "starshipagentic.commands.fleet_commander.visualize_ship.cli:visualize_ship_command",
+    "visualize": "starshipagentic.commands.fleet_commander.visualize_ship.cli:visualize_ship_command",
+    "ships": "starshipagentic.commands.fleet_commander.visualize_ship.cli:visualize_ship_command",
+    "fleet": "starshipagentic.commands.fleet_commander.visualize_ship.cli:visualize_ship_command",
+    "mission_brief": "starshipagentic.commands.number_two.mission_brief.cli:mission_brief_command",
+    "mission": "starshipagentic.commands.number_two.mission_brief.cli:mission_brief_command",
+    "expand_mission": "starshipagentic.commands.number_two.expand_mission.cli:expand_mission_command",
+    "expand": "starshipagentic.commands.number_two.expand_mission.cli:expand_mission_command",
+    "review_schematics": "starshipagentic.commands.engineering_officer.review_schematics.cli:review_schematics_command",
+    "schematics": "starshipagentic.commands.engineering_officer.review_schematics.cli:review_schematics_command",
+    "calibrate_technology": "starshipagentic.commands.engineering_officer.calibrate_technology.cli:calibrate_technology_command",
+    "calibrate": "starshipagentic.commands.engineering_officer.calibrate_technology.cli:calibrate_technology_command",
+    "plot_navigation": "starshipagentic.commands.navigation_officer.plot_navigation.cli:plot_navigation_command",
+    "navigation": "starshipagentic.commands.navigation_officer.plot_navigation.cli:plot_navigation_command",
+    "set_waypoints": "starshipagentic.commands.navigation_officer.set_waypoints.cli:set_waypoints_command",
+    "waypoints": "starshipagentic.commands.navigation_officer.set_waypoints.cli:set_waypoints_command",
+    "authorize_codes": "starshipagentic.commands.communications_officer.authorize_codes.cli:authorize_codes_command",
+    "authorize": "starshipagentic.commands.communications_officer.authorize_codes.cli:authorize_codes_command",
+    "scan_sector": "starshipagentic.commands.communications_officer.scan_sector.cli:scan_sector_command",
+    "scan": "starshipagentic.commands.communications_officer.scan_sector.cli:scan_sector_command",
+    "receive_transmission": "starshipagentic.commands.communications_officer.receive_transmission.cli:receive_transmission_command",
+    "transmission": "starshipagentic.commands.communications_officer.receive_transmission.cli:receive_transmission_command",
+    "map_planet": "starshipagentic.commands.insterstellar_officer.map_planet.cli:map_planet_command",
+    "map": "starshipagentic.commands.insterstellar_officer.map_planet.cli:map_planet_command",
+    "build_landing_zone": "starshipagentic.commands.insterstellar_officer.build_landing_zone.cli:build_landing_zone_command",
+    "buildlz": "starshipagentic.commands.insterstellar_officer.build_landing_zone.cli:build_landing_zone_command",
+    "fabricate_infrastructure": "starshipagentic.commands.insterstellar_officer.fabricate_infrastructure.cli:fabricate_infrastructure_command",
+    "fabricate": "starshipagentic.commands.insterstellar_officer.fabricate_infrastructure.cli:fabricate_infrastructure_command",
+    "warp_speed": "starshipagentic.commands.captains_orders.warp_speed.cli:warp_speed_command",
+    "warp": "starshipagentic.commands.captains_orders.warp_speed.cli:warp_speed_command",
+    "trycoder": "starshipagentic.commands.captains_orders.trycoder.cli:trycoder_command",
+    "engage": "starshipagentic.commands.captains_orders.engage.cli:engage_command",
+    "fire_photons": "starshipagentic.commands.tactical_officer.fire_photons.cli:fire_photons_command",
+    "photons": "starshipagentic.commands.tactical_officer.fire_photons.cli:fire_photons_command",
+    "aim_lasers": "starshipagentic.commands.tactical_officer.aim_lasers.cli:aim_lasers_command",
+    "lasers": "starshipagentic.commands.tactical_officer.aim_lasers.cli:aim_lasers_command",
+    "shields_up": "starshipagentic.commands.tactical_officer.shields_up.cli:shields_up_command",
+    "shields": "starshipagentic.commands.tactical_officer.shields_up.cli:shields_up_command",
+    "create_checkpoint": "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command",
+    "checkpoint": "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command",
+    "restore_checkpoint": "starshipagentic.commands.maintenance_officer.restore_checkpoint.cli:restore_checkpoint_command",
+    "restore": "starshipagentic.commands.maintenance_officer.restore_checkpoint.cli:restore_checkpoint_command",
+    "inspect_vessel": "starshipagentic.commands.maintenance_officer.inspect_vessel.cli:inspect_vessel_command",
+    "inspect": "starshipagentic.commands.maintenance_officer.inspect_vessel.cli:inspect_vessel_command",
+    "complexity_report": "starshipagentic.commands.maintenance_officer.complexity_report.cli:complexity_report_command",
+    "complexity": "starshipagentic.commands.maintenance_officer.complexity_report.cli:complexity_report_command",
+    "supernova": "starshipagentic.commands.red_buttons.supernova.cli:supernova_command",
+    "teleport": "starshipagentic.commands.gitmaster.teleport.cli:teleport_command",
+    "search": "starshipagentic.commands.mcars.search.cli:search_command",
+    "transport": "starshipagentic.commands.mcars.transport.cli:transport_command",
+    "droid_splain": "starshipagentic.commands.droids.droid_splain.cli:droid_splain_command",
+    "droid": "starshipagentic.commands.droids.droid_splain.cli:droid_splain_command",
+    "man_splain": "starshipagentic.commands.droids.man_splain.cli:man_splain_command",
+    "splain": "starshipagentic.commands.droids.man_splain.cli:man_splain_command",
+}
 # [AUTO-GENERATED COMMAND IMPORTS END]
 
 
+def __getattr__(name):
+    """Import an aliased command from COMMAND_IMPORTS on first attribute access."""
+    import_path = COMMAND_IMPORTS.get(name)
+    if import_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module_name, attr_name = import_path.split(":", 1)
+    return getattr(importlib.import_module(module_name), attr_name)
+
+
 # [AUTO-GENERATED GROUP THEMES AND ICONS START]
 GROUP_THEMES = {
     "fleet_commander": "white",
@@ -117,14 +129,12 @@ GROUP_ICONS = {
 
 
 def register_dynamic_groups():
-    """Register all dynamic command groups with the main CLI."""
-    from starshipagentic.cli import main, enhance_group_help
-    import importlib
+    """Register all dynamic command groups with the main CLI.
+
+    Groups are registered by import path only; a group package and its
+    commands are imported the first time click dispatches to them.
+    """
+    from starshipagentic.cli import main
     GROUP_NAMES = ['fleet_commander', 'number_two', 'engineering_officer', 'navigation_officer', 'communications_officer', 'insterstellar_officer', 'captains_orders', 'tactical_officer', 'maintenance_officer', 'red_buttons', 'gitmaster', 'mcars', 'droids']
     for group in GROUP_NAMES:
-        mod = importlib.import_module(f'starshipagentic.commands.{group}')
-        group_obj = getattr(mod, f'{group}_group', None)
-        if group_obj is None:
-            continue
-        enhanced = enhance_group_help(group_obj, group)
-        main.add_command(enhanced, group)
+        main.add_lazy_command(group, f'starshipagentic.commands.{group}:{group}_group')
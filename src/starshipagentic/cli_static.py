@@ -12,23 +12,34 @@ Starship Agentic CLI - Static Content
 This file contains the static parts of the CLI that don't change during generation.
 """
 
+from starshipagentic.utils import profiling
+profiling.begin("import")
+
+import logging
+
 import click
-from rich.console import Console
-from rich.panel import Panel
+from starshipagentic.utils import catalog, help_cache, interactive, output
+from starshipagentic.utils.completion import SHELLS, completion_script, script_names
+from starshipagentic.utils.suggest import search_rows
+from starshipagentic.utils.lazy_group import LazyGroup
+from starshipagentic.utils.log import LOG_LEVELS, configure_logging
+from starshipagentic.utils.output import console
+from starshipagentic.utils.sequence import load_sequence, load_sequence_answers, run_command_sequence
 
-console = Console()
+logger = logging.getLogger(__name__)
 
 def enhance_group_help(group, name):
     """Enhance a command group with better help text and rich formatting."""
-    from rich.table import Table
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.text import Text
     from starshipagentic.utils.command_registry import CommandRegistry
     
-    def display_rich_help(ctx):
-        """Display rich formatted help for the command group."""
-        console = Console()
+    def render_rich_help(width, color):
+        """Render the group's help screen for a terminal of the given width and colour support."""
+        from io import StringIO
+        from rich.table import Table
+        from rich.console import Console
+        from rich.panel import Panel
+        
+        console = Console(file=StringIO(), width=width, color_system=color, force_terminal=color is not None)
         
         # Get group info from registry
         registry = CommandRegistry()
@@ -55,8 +66,8 @@ def enhance_group_help(group, name):
         
         # Add rows for each command
         commands = registry.get_all_commands(name)
-        console.print(f"[bold blue]DEBUG:[/bold blue] Group name: {name}")
-        console.print(f"[bold blue]DEBUG:[/bold blue] Commands found: {commands}")
+        logger.debug("Rendering help for group %s with commands %s", name, list(commands),
+                     extra={"group": name})
         
         if not commands:
             console.print("[italic red]No commands found for this group.[/italic red]")
@@ -64,9 +75,9 @@ def enhance_group_help(group, name):
             all_groups = registry.get_all_groups()
             console.print(f"{all_groups}")
         else:
+            group_aliases = registry.aliases_for_group(name)
             for cmd_name, cmd_info in commands.items():
-                aliases = registry.get_aliases_for_command(name, cmd_name)
-                console.print(f"[bold blue]DEBUG:[/bold blue] Aliases for {cmd_name}: {aliases}")
+                aliases = group_aliases.get(cmd_name, [])
                 alias_str = ", ".join(aliases) if aliases else ""
                 description = cmd_info.get("description", "")
                 table.add_row(cmd_name, alias_str, description)
@@ -75,6 +86,51 @@ def enhance_group_help(group, name):
         
         console.print("\n[bold green]Usage:[/bold green] [italic]<command> [OPTIONS] [ARGS][/italic]")
         console.print("[bold green]Help:[/bold green] [italic]<command> --help[/italic] for detailed information about a specific command.\n")
+        return console.file.getvalue()
+    
+    def render_plain_help():
+        """Render the group's help screen as unstyled text, without importing rich."""
+        registry = CommandRegistry()
+        replacement = name.replace('_', ' ')
+        description = registry.get_group_info(name).get('description', f'Commands for {replacement}')
+        lines = [f"{name.upper()}: {description}", ""]
+        
+        commands = registry.get_all_commands(name)
+        if not commands:
+            lines.append("No commands found for this group.")
+            lines.append(f"Available groups in registry: {', '.join(registry.get_all_groups())}")
+        else:
+            group_aliases = registry.aliases_for_group(name)
+            width = max(len(cmd_name) for cmd_name in commands)
+            lines.append("Commands:")
+            for cmd_name, cmd_info in commands.items():
+                aliases = group_aliases.get(cmd_name, [])
+                alias_str = f" (aliases: {', '.join(aliases)})" if aliases else ""
+                lines.append(f"  {cmd_name:<{width}}  {cmd_info.get('description', '')}{alias_str}")
+        
+        lines.append("")
+        lines.append("Usage: <command> [OPTIONS] [ARGS]")
+        lines.append("Help: <command> --help for detailed information about a specific command.")
+        return "\n".join(lines) + "\n"
+    
+    def display_rich_help(ctx):
+        """Display rich formatted help for the command group, pre-rendered when cached."""
+        import sys
+        
+        if output.is_plain():
+            # --plain / STARSHIPAGENTIC_PLAIN / piped output: no styling, no rich
+            width, _color = help_cache.terminal_profile()
+            text = help_cache.cached(f"plain:{name}", (width, None), __file__, render_plain_help)
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+        
+        profile = help_cache.terminal_profile()
+        text = help_cache.cached(f"rich:{name}", profile, __file__, lambda: render_rich_help(*profile))
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
+    display_rich_help = profiling.timer.timed("output", display_rich_help)
     
     # Override the help formatting for the group
     group.format_help = lambda ctx, formatter: None
@@ -93,6 +149,17 @@ def enhance_group_help(group, name):
             param.callback = custom_help_callback
             break
     
+    # Newer click builds the help option on demand instead of listing it in params
+    original_get_help_option = group.get_help_option
+    
+    def get_help_option(ctx):
+        option = original_get_help_option(ctx)
+        if option is not None:
+            option.callback = custom_help_callback
+        return option
+    
+    group.get_help_option = get_help_option
+    
     # Store the original callback
     original_callback = group.callback
     
@@ -112,72 +179,165 @@ def enhance_group_help(group, name):
     # Replace the group's callback
     group.callback = new_callback
     group.invoke_without_command = True
+    group.no_args_is_help = False
     
     # Set a basic help text for when --help isn't used
     group.help = f"[{name.upper()}] Commands for {name.replace('_', ' ')}"
     
     return group
 
-@click.group(invoke_without_command=True)
+def command_resolver(group_name=None):
+    """Return a resolver mapping a token to subcommand names, top-level or within a group."""
+    from starshipagentic.utils.command_registry import CommandRegistry
+
+    def resolve(token):
+        # Top-level prefixes must also see the commands defined on main itself (find, completion)
+        builtins = () if group_name else list(main.commands)
+        path = CommandRegistry().resolve_command_path(token, group_name, builtins=builtins)
+        if path and group_name:
+            # Inside a group only the command name is left to dispatch
+            return path[1:]
+        return path
+    return resolve
+
+def command_suggester(group_name=None):
+    """Return a suggester mapping an unknown token to the closest names, top-level or within a group."""
+    from starshipagentic.utils.command_registry import CommandRegistry
+
+    def suggest(token):
+        builtins = () if group_name else list(main.commands)
+        return CommandRegistry().suggest(token, group_name, builtins=builtins)
+    return suggest
+
+def load_command_group(name, group):
+    """Attach a group's commands lazily and enhance its help on first dispatch."""
+    from starshipagentic.utils.command_registry import CommandRegistry
+
+    if isinstance(group, LazyGroup):
+        registry = CommandRegistry()
+        for cmd_name in registry.get_all_commands(name):
+            if cmd_name not in group.commands:
+                group.add_lazy_command(cmd_name, registry.get_command_import_path(name, cmd_name))
+        group.resolver = command_resolver(name)
+        group.suggester = command_suggester(name)
+    return enhance_group_help(group, name)
+
+def logging_option(ctx, param, value):
+    """Apply --log-level/--log-file as soon as they are parsed."""
+    options = ctx.meta.setdefault("starshipagentic.logging", {})
+    options[param.name] = value
+    try:
+        configure_logging(level=options.get("log_level"), log_file=options.get("log_file"))
+    except (OSError, ValueError) as e:
+        raise click.BadParameter(str(e), ctx=ctx, param=param)
+    return value
+
+def plain_option(ctx, param, value):
+    """Switch to plain, unstyled output as soon as --plain is parsed."""
+    if value:
+        output.set_plain(True)
+    return value
+
+def interactive_option(ctx, param, value):
+    """Apply --answers/--non-interactive as soon as they are parsed."""
+    if param.name == "answers_file" and value:
+        interactive.configure(answers_file=value)
+    elif param.name == "non_interactive" and value:
+        interactive.configure(strict=True)
+    return value
+
+def profile_option(ctx, param, value):
+    """Start reporting per-phase timings once --profile or --profile-output is seen."""
+    options = ctx.meta.setdefault("starshipagentic.profile", {})
+    options[param.name] = value
+    if value and not options.get("enabled"):
+        options["enabled"] = True
+        profiling.enable()
+        ctx.call_on_close(lambda: profiling.report(options.get("profile_output")))
+    if param.name == "profile_output" and value:
+        profiling.collect_stats()
+    return value
+
+@click.group(cls=LazyGroup, invoke_without_command=True, on_load=load_command_group,
+             resolver=command_resolver(), suggester=command_suggester())
 @click.option("--all-commands", is_flag=True, help="Display all available commands")
 @click.option("--commands-list", is_flag=True, help="Display commands from commands-list.yml")
+@click.option("--format", "output_format", type=click.Choice(catalog.FORMATS), default="text", show_default=True,
+              help="Output format for --all-commands and --commands-list")
+@click.option("--sequence", "sequence_file", is_flag=False, flag_value="", default=None, metavar="[FILE]",
+              help="Run the command sequence from FILE (default: starshipagentic.yml)")
+@click.option("--continue-on-error", is_flag=True, help="Keep running a sequence after a step fails")
+@click.option("--report", "report_path", type=click.Path(dir_okay=False), help="Write a JSON sequence run report")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Run up to N independent sequence steps at once")
+@click.option("--log-level", type=click.Choice(LOG_LEVELS, case_sensitive=False), is_eager=True,
+              expose_value=False, callback=logging_option,
+              help="Logging level (default: $STARSHIPAGENTIC_LOG_LEVEL or WARNING)")
+@click.option("--log-file", type=click.Path(dir_okay=False), is_eager=True, expose_value=False,
+              callback=logging_option, help="Also write JSON-lines log records to FILE ('-' for stderr)")
+@click.option("--answers", "answers_file", type=click.Path(exists=True, dir_okay=False), is_eager=True,
+              expose_value=False, callback=interactive_option,
+              help="YAML/JSON file answering parameters that would be prompted for")
+@click.option("--non-interactive", is_flag=True, is_eager=True, expose_value=False, callback=interactive_option,
+              help="Never prompt; fail when a parameter has no value or default")
+@click.option("--plain", is_flag=True, is_eager=True, expose_value=False, callback=plain_option,
+              help="Plain, unstyled output (default when stdout is not a terminal)")
+@click.option("--profile", is_flag=True, is_eager=True, expose_value=False, callback=profile_option,
+              help="Report the time spent per phase on stderr")
+@click.option("--profile-output", type=click.Path(dir_okay=False), is_eager=True, expose_value=False,
+              callback=profile_option,
+              help="Profile the command body to FILE (pstats) and FILE.collapsed; implies --profile")
 @click.pass_context
-def main(ctx, all_commands, commands_list):
+def main(ctx, all_commands, commands_list, output_format, sequence_file, continue_on_error, report_path, jobs):
     """Starship Agentic CLI - Your AI-powered command center."""
     import sys
     
-    # Debug the command line arguments
-    console.print(f"[bold blue]DEBUG: sys.argv: {sys.argv}[/bold blue]")
+    logger.debug("Invoked with argv %s", sys.argv, extra={"argv": sys.argv, "subcommand": ctx.invoked_subcommand})
     
     if ctx.invoked_subcommand is None:
-        console.print(Panel("Welcome to Starship Agentic", title="🚀"))
+        if sequence_file is not None:
+            try:
+                report = run_command_sequence(load_sequence(sequence_file or None), cli=ctx.command,
+                                              stop_on_failure=not continue_on_error,
+                                              report_path=report_path, jobs=jobs,
+                                              answers=load_sequence_answers(sequence_file or None))
+            except ValueError as e:
+                raise click.UsageError(f"Invalid sequence: {e}")
+            ctx.exit(0 if report["ok"] else 1)
         if all_commands:
-            console.print("All commands would be displayed here")
+            catalog.write_catalog(catalog.registry_rows(), output_format)
         elif commands_list:
-            console.print("Commands from commands-list.yml would be displayed here")
+            catalog.write_catalog(catalog.commands_list_rows(), output_format)
+        elif output.is_plain():
+            console.print("Welcome to Starship Agentic")
+            console.print("Use --help for more information")
         else:
+            from rich.panel import Panel
+            console.print(Panel("Welcome to Starship Agentic", title="🚀"))
             console.print("Use --help for more information")
     else:
-        console.print(f"[bold red]DEBUG: Delegating control to subcommand: {ctx.invoked_subcommand}[/bold red]")
-        
-        # Get the subcommand
-        sub_cmd = ctx.command.get_command(ctx, ctx.invoked_subcommand)
-        if sub_cmd:
-            # Special handling for nested commands
-            if hasattr(sub_cmd, 'commands') and len(sys.argv) > 3:
-                # The format is: starshipagentic group_name command_name [options]
-                # So sys.argv[2] should be the command name
-                nested_cmd_name = sys.argv[2]
-                console.print(f"[bold blue]DEBUG: Looking for nested command: {nested_cmd_name}[/bold blue]")
-                
-                # Try to get the nested command from the group
-                nested_cmd = sub_cmd.get_command(ctx, nested_cmd_name)
-                if nested_cmd:
-                    console.print(f"[bold green]DEBUG: Found nested command: {nested_cmd_name}[/bold green]")
-                    
-                    # If --help is in the arguments, we need to show help for the nested command
-                    if '--help' in sys.argv:
-                        console.print(f"[bold green]DEBUG: Showing help for nested command: {nested_cmd_name}[/bold green]")
-                        help_ctx = click.Context(nested_cmd, parent=ctx, info_name=nested_cmd_name)
-                        click.echo(nested_cmd.get_help(help_ctx))
-                        return ctx.exit()
-                    
-                    # Otherwise, invoke the nested command with the remaining args
-                    # Remove the first 3 arguments (starshipagentic, group_name, command_name)
-                    remaining_args = sys.argv[3:]
-                    console.print(f"[bold blue]DEBUG: Remaining args for nested command: {remaining_args}[/bold blue]")
-                    
-                    # Create a new context for the nested command
-                    nested_ctx = click.Context(nested_cmd, parent=ctx, info_name=nested_cmd_name)
-                    
-                    # Invoke the nested command directly
-                    return nested_cmd.main(remaining_args, standalone_mode=False)
-            
-            # Otherwise, invoke the subcommand normally
-            return ctx.invoke(sub_cmd)
-        else:
-            console.print(f"[bold red]DEBUG: Subcommand {ctx.invoked_subcommand} not found.[/bold red]")
-            ctx.exit()
+        # Click dispatches to the (lazily loaded) group and command itself
+        logger.debug("Delegating control to subcommand %s", ctx.invoked_subcommand)
+
+@main.command("completion")
+@click.argument("shell", type=click.Choice(SHELLS))
+def completion_command(shell):
+    """Print the completion script for SHELL (bash, zsh or fish).
+
+    For example: eval "$(starshipagentic completion bash)"
+    """
+    click.echo(completion_script(shell, script_names()), nl=False)
+
+@main.command("find")
+@click.argument("text", nargs=-1, required=True)
+@click.option("--format", "output_format", type=click.Choice(catalog.FORMATS), default="text", show_default=True,
+              help="Output format")
+@click.option("--limit", type=click.IntRange(min=1), default=10, show_default=True, help="Maximum number of results")
+def find_command(text, output_format, limit):
+    """Search command names, aliases and descriptions for TEXT (typos allowed)."""
+    rows = search_rows(catalog.registry_rows(), " ".join(text), limit=limit)
+    if not catalog.write_catalog(rows, output_format) and output_format == "text":
+        click.echo(f"No commands match '{' '.join(text)}'", err=True)
 
 if __name__ == "__main__":
     main()
@@ -16,16 +16,10 @@ __all__ = [
     "tactical_officer",
 ]
 
-from . import captains_orders
-from . import communications_officer
-from . import droids
-from . import engineering_officer
-from . import fleet_commander
-from . import gitmaster
-from . import insterstellar_officer
-from . import maintenance_officer
-from . import mcars
-from . import navigation_officer
-from . import number_two
-from . import red_buttons
-from . import tactical_officer
+
+def __getattr__(name):
+    """Import a command group package on first attribute access."""
+    if name in __all__:
+        import importlib
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
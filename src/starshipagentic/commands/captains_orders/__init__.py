@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the captains_orders group."""
 
-import click
-captains_orders_group = click.Group(name="captains_orders")
+from starshipagentic.utils.lazy_group import LazyGroup
+captains_orders_group = LazyGroup(name="captains_orders")
 
 __all__ = [
     "engage",
@@ -19,5 +19,4 @@ def run_group():
     """Entry point for running the captains_orders command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'captains_orders']
-    cli_main()
+    cli_main(args=['captains_orders'] + sys.argv[1:], prog_name='starshipagentic')
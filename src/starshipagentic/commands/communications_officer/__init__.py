@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the communications_officer group."""
 
-import click
-communications_officer_group = click.Group(name="communications_officer")
+from starshipagentic.utils.lazy_group import LazyGroup
+communications_officer_group = LazyGroup(name="communications_officer")
 
 __all__ = [
     "authorize_codes",
@@ -19,5 +19,4 @@ def run_group():
     """Entry point for running the communications_officer command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'communications_officer']
-    cli_main()
+    cli_main(args=['communications_officer'] + sys.argv[1:], prog_name='starshipagentic')
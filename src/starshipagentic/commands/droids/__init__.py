@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the droids group."""
 
-import click
-droids_group = click.Group(name="droids")
+from starshipagentic.utils.lazy_group import LazyGroup
+droids_group = LazyGroup(name="droids")
 
 __all__ = [
     "droid_splain",
@@ -17,5 +17,4 @@ def run_group():
     """Entry point for running the droids command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'droids']
-    cli_main()
+    cli_main(args=['droids'] + sys.argv[1:], prog_name='starshipagentic')
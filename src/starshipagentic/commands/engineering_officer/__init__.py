@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the engineering_officer group."""
 
-import click
-engineering_officer_group = click.Group(name="engineering_officer")
+from starshipagentic.utils.lazy_group import LazyGroup
+engineering_officer_group = LazyGroup(name="engineering_officer")
 
 __all__ = [
     "calibrate_technology",
@@ -17,5 +17,4 @@ def run_group():
     """Entry point for running the engineering_officer command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'engineering_officer']
-    cli_main()
+    cli_main(args=['engineering_officer'] + sys.argv[1:], prog_name='starshipagentic')
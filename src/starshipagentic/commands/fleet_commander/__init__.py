@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the fleet_commander group."""
 
-import click
-fleet_commander_group = click.Group(name="fleet_commander")
+from starshipagentic.utils.lazy_group import LazyGroup
+fleet_commander_group = LazyGroup(name="fleet_commander")
 
 __all__ = [
     "commission_ship",
@@ -19,5 +19,4 @@ def run_group():
     """Entry point for running the fleet_commander command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'fleet_commander']
-    cli_main()
+    cli_main(args=['fleet_commander'] + sys.argv[1:], prog_name='starshipagentic')
@@ -1,17 +1,16 @@
+import logging
+
 import click
-from starshipagentic.visualization.pygame_display import display_ship_visualization
+
+logger = logging.getLogger(__name__)
 
 @click.command()
 @click.option('--ship', default='scout', help='Ship to visualize (scout, django, flask, react)')
 def visualize_ship_command(ship=None):
     """Launch a Pygame visualization of the specified ship."""
+    import os
     import sys
-    from rich.console import Console
-    console = Console()
-    
-    # Debug information
-    console.print(f"[bold blue]DEBUG: visualize_ship_command called with ship={ship}[/bold blue]")
-    console.print(f"[bold blue]DEBUG: sys.argv: {sys.argv}[/bold blue]")
+    logger.debug("visualize_ship_command called with ship=%s, argv %s", ship, sys.argv)
     
     if not ship:
         ship = 'scout'  # Default ship
@@ -20,7 +19,13 @@ def visualize_ship_command(ship=None):
     if '--help' in sys.argv:
         return
     
-    # Launch the pygame visualization
+    # Headless, pygame would open an invisible window and never return
+    if sys.platform.startswith('linux') and not any(
+            os.environ.get(var) for var in ('DISPLAY', 'WAYLAND_DISPLAY', 'SDL_VIDEODRIVER')):
+        raise click.ClickException("No display available to launch the visualization")
+    
+    # Launch the pygame visualization (pygame is only imported when actually needed)
+    from starshipagentic.visualization.pygame_display import display_ship_visualization
     display_ship_visualization(ship)
     
     return f"Visualization of {ship} completed."
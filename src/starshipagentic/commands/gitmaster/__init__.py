@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the gitmaster group."""
 
-import click
-gitmaster_group = click.Group(name="gitmaster")
+from starshipagentic.utils.lazy_group import LazyGroup
+gitmaster_group = LazyGroup(name="gitmaster")
 
 __all__ = [
     "teleport",
@@ -15,5 +15,4 @@ def run_group():
     """Entry point for running the gitmaster command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'gitmaster']
-    cli_main()
+    cli_main(args=['gitmaster'] + sys.argv[1:], prog_name='starshipagentic')
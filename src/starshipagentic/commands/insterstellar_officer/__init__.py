@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the insterstellar_officer group."""
 
-import click
-insterstellar_officer_group = click.Group(name="insterstellar_officer")
+from starshipagentic.utils.lazy_group import LazyGroup
+insterstellar_officer_group = LazyGroup(name="insterstellar_officer")
 
 __all__ = [
     "build_landing_zone",
@@ -19,5 +19,4 @@ def run_group():
     """Entry point for running the insterstellar_officer command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'insterstellar_officer']
-    cli_main()
+    cli_main(args=['insterstellar_officer'] + sys.argv[1:], prog_name='starshipagentic')
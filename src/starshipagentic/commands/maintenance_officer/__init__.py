@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the maintenance_officer group."""
 
-import click
-maintenance_officer_group = click.Group(name="maintenance_officer")
+from starshipagentic.utils.lazy_group import LazyGroup
+maintenance_officer_group = LazyGroup(name="maintenance_officer")
 
 __all__ = [
     "complexity_report",
@@ -21,5 +21,4 @@ def run_group():
     """Entry point for running the maintenance_officer command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'maintenance_officer']
-    cli_main()
+    cli_main(args=['maintenance_officer'] + sys.argv[1:], prog_name='starshipagentic')
@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the mcars group."""
 
-import click
-mcars_group = click.Group(name="mcars")
+from starshipagentic.utils.lazy_group import LazyGroup
+mcars_group = LazyGroup(name="mcars")
 
 __all__ = [
     "search",
@@ -17,5 +17,4 @@ def run_group():
     """Entry point for running the mcars command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'mcars']
-    cli_main()
+    cli_main(args=['mcars'] + sys.argv[1:], prog_name='starshipagentic')
@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the navigation_officer group."""
 
-import click
-navigation_officer_group = click.Group(name="navigation_officer")
+from starshipagentic.utils.lazy_group import LazyGroup
+navigation_officer_group = LazyGroup(name="navigation_officer")
 
 __all__ = [
     "plot_navigation",
@@ -17,5 +17,4 @@ def run_group():
     """Entry point for running the navigation_officer command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'navigation_officer']
-    cli_main()
+    cli_main(args=['navigation_officer'] + sys.argv[1:], prog_name='starshipagentic')
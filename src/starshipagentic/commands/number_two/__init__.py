@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the number_two group."""
 
-import click
-number_two_group = click.Group(name="number_two")
+from starshipagentic.utils.lazy_group import LazyGroup
+number_two_group = LazyGroup(name="number_two")
 
 __all__ = [
     "expand_mission",
@@ -17,5 +17,4 @@ def run_group():
     """Entry point for running the number_two command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'number_two']
-    cli_main()
+    cli_main(args=['number_two'] + sys.argv[1:], prog_name='starshipagentic')
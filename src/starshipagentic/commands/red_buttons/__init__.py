@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the red_buttons group."""
 
-import click
-red_buttons_group = click.Group(name="red_buttons")
+from starshipagentic.utils.lazy_group import LazyGroup
+red_buttons_group = LazyGroup(name="red_buttons")
 
 __all__ = [
     "supernova",
@@ -15,5 +15,4 @@ def run_group():
     """Entry point for running the red_buttons command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'red_buttons']
-    cli_main()
+    cli_main(args=['red_buttons'] + sys.argv[1:], prog_name='starshipagentic')
@@ -1,8 +1,6 @@
 import subprocess
 import os
-from rich.console import Console
-
-console = Console()
+from starshipagentic.utils.output import console
 
 def supernova_service(input):
     """
@@ -1,7 +1,7 @@
 """Auto-generated __init__.py for the tactical_officer group."""
 
-import click
-tactical_officer_group = click.Group(name="tactical_officer")
+from starshipagentic.utils.lazy_group import LazyGroup
+tactical_officer_group = LazyGroup(name="tactical_officer")
 
 __all__ = [
     "aim_lasers",
@@ -19,5 +19,4 @@ def run_group():
     """Entry point for running the tactical_officer command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', 'tactical_officer']
-    cli_main()
+    cli_main(args=['tactical_officer'] + sys.argv[1:], prog_name='starshipagentic')
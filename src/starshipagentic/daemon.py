@@ -0,0 +1,293 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Warm-process daemon for Starship Agentic.
+
+The daemon imports the CLI once, registers and resolves every command group,
+and then serves invocations forwarded by :mod:`starshipagentic.shim` over a
+Unix domain socket. Each invocation runs in a process forked from the warm
+parent, attached to the client's own stdin/stdout/stderr, so output streams
+straight to the caller's terminal and the exit code is reported back.
+
+Usage:
+    starshipagentic-daemon start      # background
+    starshipagentic-daemon status
+    starshipagentic-daemon stop
+"""
+
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import time
+import traceback
+
+import click
+
+from starshipagentic.shim import check_socket_dir, connect, default_socket_path, peer_uid, run_in_process
+from starshipagentic.utils import profiling
+
+MAX_HEADER_SIZE = 16 * 1024 * 1024
+
+def warm_up():
+    """Import the CLI and resolve every group and command ahead of time."""
+    from starshipagentic.cli import main
+    from starshipagentic.utils.command_registry import CommandRegistry
+
+    CommandRegistry().get_aliases_map()
+    ctx = click.Context(main, info_name="starshipagentic")
+    for group_name in main.list_commands(ctx):
+        group = main.get_command(ctx, group_name)
+        if isinstance(group, click.Group):
+            group_ctx = click.Context(group, parent=ctx, info_name=group_name)
+            for cmd_name in group.list_commands(group_ctx):
+                group.get_command(group_ctx, cmd_name)
+
+def _send(conn, message):
+    """Send one newline-delimited JSON message to the client."""
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+def _recv_request(conn):
+    """Receive a request header and the file descriptors sent alongside it."""
+    data, fds, _flags, _addr = socket.recv_fds(conn, 65536, 3)
+    while not data.endswith(b"\n"):
+        if len(data) > MAX_HEADER_SIZE:
+            raise ValueError("request header too large")
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data), fds
+
+def _attach_stdio(fds):
+    """Make the client's stdin/stdout/stderr this process's standard streams."""
+    for target, fd in zip((0, 1, 2), fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    def reopen(fd, mode):
+        buffered = io.open(fd, mode + "b", closefd=False)
+        line_buffering = mode == "w" and os.isatty(fd)
+        return io.TextIOWrapper(buffered, encoding="utf-8", errors="backslashreplace",
+                                line_buffering=line_buffering, write_through=fd == 2)
+
+    sys.stdin = reopen(0, "r")
+    sys.stdout = reopen(1, "w")
+    sys.stderr = reopen(2, "w")
+
+def _run_forwarded(conn, request, fds):
+    """Run one forwarded invocation in a freshly forked child; return its exit code."""
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    _send(conn, {"pid": os.getpid()})
+
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    _attach_stdio(fds)
+    sys.argv = [request["prog"]] + list(request["args"])
+    # --profile should report this invocation, not the daemon's warm-up
+    profiling.timer.reset()
+
+    try:
+        run_in_process(request["prog"], request["args"])
+        exit_code = 0
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except KeyboardInterrupt:
+        exit_code = 130
+    except Exception:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return exit_code
+
+class DaemonRequestHandler(socketserver.BaseRequestHandler):
+    """Handle one client connection."""
+
+    def handle(self):
+        conn = self.request
+        uid = peer_uid(conn)
+        if uid is not None and uid != os.getuid():
+            return
+
+        try:
+            request, fds = _recv_request(conn)
+        except (OSError, ValueError):
+            return
+
+        op = request.get("op")
+        if op == "ping":
+            _send(conn, {"ok": True, "pid": os.getpid()})
+        elif op == "stop":
+            _send(conn, {"ok": True})
+            self.server.stopping = True
+        elif op == "run":
+            self.server.fork_request(conn, request, fds)
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server that runs each invocation in a forked child."""
+
+    def __init__(self, socket_path):
+        self.children = set()
+        self.stopping = False
+        super().__init__(socket_path, DaemonRequestHandler)
+
+    def fork_request(self, conn, request, fds):
+        """Fork a child to run a request; the parent returns immediately."""
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self.socket.close()
+                exit_code = _run_forwarded(conn, request, fds)
+                _send(conn, {"exit": exit_code})
+            except BaseException:
+                pass
+            finally:
+                os._exit(exit_code)
+        self.children.add(pid)
+
+    def shutdown_request(self, request):
+        """Close our end only; a forked child may still be writing to the client."""
+        self.close_request(request)
+
+    def reap_children(self):
+        """Reap children that have finished running their request."""
+        for pid in list(self.children):
+            try:
+                done, _status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done = pid
+            if done:
+                self.children.discard(pid)
+
+def request(op, socket_path=None, timeout=2.0):
+    """Send a control request (ping/stop) to the daemon; return its reply or None."""
+    sock = connect(socket_path or default_socket_path(), timeout=timeout)
+    if sock is None:
+        return None
+    try:
+        sock.sendall(json.dumps({"op": op}).encode() + b"\n")
+        with sock.makefile("rb") as reply:
+            line = reply.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+def serve(socket_path=None):
+    """Warm up and serve forwarded invocations until stopped."""
+    path = socket_path or default_socket_path()
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.mkdir(directory, 0o700)
+        os.chmod(directory, 0o700)
+    except FileExistsError:
+        pass
+    try:
+        # Refuse a directory someone else created first (or swapped for a symlink)
+        check_socket_dir(directory)
+    except OSError as e:
+        raise click.ClickException(f"Unsafe socket directory: {e}")
+    if os.path.lexists(path):
+        if request("ping", path) is not None:
+            raise click.ClickException(f"A daemon is already listening on {path}")
+        os.unlink(path)
+
+    warm_up()
+    old_umask = os.umask(0o177)
+    try:
+        server = DaemonServer(path)
+    finally:
+        os.umask(old_umask)
+    signal.signal(signal.SIGTERM, lambda *_: setattr(server, "stopping", True))
+    server.timeout = 0.2
+    try:
+        while not server.stopping:
+            server.handle_request()
+            server.reap_children()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+@click.group()
+@click.option("--socket", "socket_path", default=None, help="Daemon socket path")
+@click.pass_context
+def daemon_cli(ctx, socket_path):
+    """Manage the warm Starship Agentic daemon."""
+    ctx.obj = socket_path or default_socket_path()
+
+@daemon_cli.command()
+@click.option("--foreground", is_flag=True, help="Run in the foreground instead of detaching")
+@click.pass_obj
+def start(socket_path, foreground):
+    """Start the daemon."""
+    if foreground:
+        serve(socket_path)
+        return
+
+    if request("ping", socket_path) is not None:
+        click.echo(f"Daemon already running on {socket_path}")
+        return
+    subprocess.Popen(
+        [sys.executable, "-m", "starshipagentic.daemon", "--socket", socket_path, "start", "--foreground"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        reply = request("ping", socket_path)
+        if reply is not None:
+            click.echo(f"Daemon started (pid {reply['pid']}) on {socket_path}")
+            return
+        time.sleep(0.05)
+    raise click.ClickException("Daemon did not start within 10 seconds")
+
+@daemon_cli.command()
+@click.pass_obj
+def stop(socket_path):
+    """Stop the daemon."""
+    if request("stop", socket_path) is None:
+        click.echo("Daemon is not running")
+    else:
+        click.echo("Daemon stopped")
+
+@daemon_cli.command()
+@click.pass_obj
+def status(socket_path):
+    """Show whether the daemon is running."""
+    reply = request("ping", socket_path)
+    if reply is None:
+        click.echo("Daemon is not running")
+        sys.exit(1)
+    click.echo(f"Daemon running (pid {reply['pid']}) on {socket_path}")
+
+if __name__ == "__main__":
+    daemon_cli()
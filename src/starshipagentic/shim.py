@@ -0,0 +1,201 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Entry-point shim for Starship Agentic.
+
+Every console script in pyproject.toml points at :func:`main`. If a warm
+daemon (see :mod:`starshipagentic.daemon`) is listening, the invocation is
+forwarded to it together with our stdin/stdout/stderr, environment and
+working directory; otherwise the command runs in this process. This module
+deliberately imports nothing beyond the standard library so forwarding
+stays cheap.
+"""
+
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+
+MAIN_PROG = "starshipagentic"
+SOCKET_ENV = "STARSHIPAGENTIC_DAEMON_SOCKET"
+NO_DAEMON_ENV = "STARSHIPAGENTIC_NO_DAEMON"
+COMPLETE_ENV = "STARSHIPAGENTIC_COMPLETE"
+
+def default_socket_path():
+    """Return the daemon socket path for the current user."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "starshipagentic", "daemon.sock")
+    return os.path.join("/tmp", f"starshipagentic-{os.getuid()}", "daemon.sock")
+
+def check_socket_dir(directory):
+    """
+    Make sure a socket directory can only have been populated by us.
+
+    Raises:
+        PermissionError: If the directory is a symlink, not a directory, not
+            owned by the current user, or accessible to anyone else
+    """
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+        raise PermissionError(f"{directory} must be a directory owned by uid {os.getuid()} with mode 0700")
+
+def peer_uid(sock):
+    """Return the uid of the process on the other end of a Unix socket, or None if unknown."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid
+
+def connect(path, timeout=None):
+    """
+    Connect to a daemon socket after checking that it belongs to the current user.
+
+    The socket's directory must pass check_socket_dir(), the socket must be
+    owned by us, and (where the platform reports it) the listening process
+    must run as us, so nothing is ever sent to another user's server.
+
+    Returns:
+        socket.socket or None: The connected socket, or None if there is no
+        trustworthy daemon at path
+    """
+    try:
+        check_socket_dir(os.path.dirname(os.path.abspath(path)))
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        uid = peer_uid(sock)
+    except OSError:
+        sock.close()
+        return None
+    if uid is not None and uid != os.getuid():
+        sock.close()
+        return None
+    return sock
+
+def prog_name(argv0):
+    """Return the invoked script name (e.g. ``warp``) from argv[0]."""
+    name = os.path.basename(argv0)
+    if name.endswith(".exe"):
+        name = name[:-4]
+    return name
+
+def entry_point_args(prog, args):
+    """
+    Translate an entry-point invocation into arguments for the main CLI.
+
+    Args:
+        prog (str): Invoked script name (main CLI, group name, or command alias)
+        args (list): Arguments passed to the script
+
+    Returns:
+        list: Arguments for ``starshipagentic``
+    """
+    args = list(args)
+    if prog == MAIN_PROG:
+        return args
+
+    from starshipagentic.utils.command_registry import CommandRegistry
+
+    registry = CommandRegistry()
+    if prog in registry.get_all_groups():
+        return [prog] + args
+    target = registry.get_command_for_alias(prog)
+    if target is not None:
+        return list(target) + args
+    return args
+
+def run_in_process(prog, args):
+    """Run an entry-point invocation in this process (exits via SystemExit)."""
+    if prog != MAIN_PROG:
+        # Command aliases run their command directly, without the main CLI
+        from starshipagentic.utils.alias_launcher import launch
+
+        launch(prog, args)
+
+    from starshipagentic.cli import main as cli_main
+
+    return cli_main.main(args=entry_point_args(prog, args), prog_name=MAIN_PROG)
+
+def forward(prog, args, socket_path=None):
+    """
+    Forward an invocation to a running daemon.
+
+    Args:
+        prog (str): Invoked script name
+        args (list): Arguments passed to the script
+        socket_path (str, optional): Daemon socket; defaults to default_socket_path()
+
+    Returns:
+        int or None: The command's exit code, or None if no daemon could take it
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not hasattr(socket, "send_fds"):
+        return None
+    sock = connect(socket_path or default_socket_path())
+    if sock is None:
+        return None
+
+    try:
+        header = {
+            "op": "run",
+            "prog": prog,
+            "args": list(args),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        }
+        socket.send_fds(sock, [json.dumps(header).encode() + b"\n"], [0, 1, 2])
+    except OSError:
+        sock.close()
+        return None
+
+    with sock, sock.makefile("rb") as reply:
+        child_pid = None
+        while True:
+            try:
+                line = reply.readline()
+            except KeyboardInterrupt:
+                # Relay Ctrl-C to the process actually running the command
+                if child_pid:
+                    os.kill(child_pid, signal.SIGINT)
+                continue
+            if not line:
+                # Daemon went away without reporting an exit code
+                return 1
+            message = json.loads(line)
+            if "pid" in message:
+                child_pid = message["pid"]
+            elif "exit" in message:
+                return message["exit"]
+
+def main():
+    """Console-script entry point for the CLI, its groups and command aliases."""
+    prog = prog_name(sys.argv[0])
+    if os.environ.get(COMPLETE_ENV):
+        # Shell completion is answered from cached indexes, without the CLI
+        from starshipagentic.utils.completion import complete
+
+        sys.exit(complete(prog))
+    args = sys.argv[1:]
+    exit_code = forward(prog, args)
+    if exit_code is None:
+        run_in_process(prog, args)
+    else:
+        sys.exit(exit_code)
@@ -0,0 +1,157 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Alias analysis shared by the sync tool, the command registry and the validators.
+
+One pass over commands-list.yml data builds the alias index: every name that
+becomes a console script (group names, command names, explicit aliases and
+``[project.scripts]`` entries that target a command module directly) mapped
+to the groups and commands that claim it, and to the target resolution picks.
+The command manifest, and through it the command registry, the alias
+launcher and completion, take their alias table from this index, so the
+conflicts it reports are exactly the names resolution has to arbitrate.
+Conflicts are names claimed by more than one group or command, names
+reserved in ``no-go-alias.txt``, and names already taken on ``$PATH`` by an
+executable this package did not install.
+"""
+
+import logging
+import os
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+PYPROJECT_PATH = PROJECT_ROOT / "pyproject.toml"
+RESERVED_PATH = PROJECT_ROOT / "no-go-alias.txt"
+
+logger = logging.getLogger(__name__)
+
+def command_import_path(group, cmd):
+    """Return the ``module:attribute`` of a command's click object."""
+    package = cmd.replace("-", "_")
+    return f"starshipagentic.commands.{group}.{package}.cli:{package}_command"
+
+def load_pyproject_scripts(path=PYPROJECT_PATH):
+    """Return the [project.scripts] table from pyproject.toml, or {} if unavailable."""
+    try:
+        import tomllib as tomli
+    except ImportError:
+        try:
+            import tomli
+        except ImportError:
+            return {}
+
+    if not Path(path).exists():
+        return {}
+    try:
+        with open(path, "rb") as f:
+            pyproject = tomli.load(f)
+    except Exception as e:
+        # Log the error but continue with the YAML aliases
+        logger.warning("Error reading pyproject.toml: %s", e)
+        return {}
+    return pyproject.get("project", {}).get("scripts", {})
+
+def load_reserved(path=RESERVED_PATH):
+    """Return the names reserved in no-go-alias.txt (one per line), or an empty set."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip()}
+    except OSError:
+        return set()
+
+def path_executables(path_env=None):
+    """
+    Map every executable name on $PATH to the first file providing it.
+
+    Args:
+        path_env (str, optional): PATH-style directory list (default: ``$PATH``)
+
+    Returns:
+        dict: name -> path, earlier directories winning as they do in a shell
+    """
+    found = {}
+    for directory in os.get_exec_path({"PATH": path_env} if path_env is not None else None):
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name not in found and entry.is_file() and os.access(entry.path, os.X_OK):
+                    found[entry.name] = entry.path
+    return found
+
+def is_own_script(path):
+    """Return whether an executable is a console script installed for this package."""
+    try:
+        with open(path, "rb") as f:
+            return b"starshipagentic" in f.read(4096)
+    except OSError:
+        return False
+
+def analyze(commands_data, scripts=None, reserved=None, executables=None):
+    """
+    Build the alias conflict index in one pass.
+
+    Args:
+        commands_data (dict): Parsed commands-list.yml
+        scripts (dict, optional): The [project.scripts] table; its names are
+            checked against $PATH along with the group and command names, and
+            entries targeting a command module claim that command
+        reserved (set, optional): Reserved names (see load_reserved())
+        executables (dict, optional): name -> path of executables on $PATH
+            (see path_executables()); skip the $PATH check when None
+
+    Returns:
+        dict: ``sources`` (name -> list of ``("group", group, None)`` or
+        ``("command", group, command)`` claims, in sync order), ``targets``
+        (name -> ``(group,)`` or ``(group, command)`` for unambiguous names),
+        ``resolved`` (name -> the target resolution picks for every name: a
+        group wins, otherwise the last command claim) and ``conflicts`` (list
+        of ``{alias, kind, message}`` where kind is ``ambiguous``,
+        ``reserved`` or ``path``)
+    """
+    sources, import_paths = {}, {}
+    for group in commands_data:
+        sources.setdefault(group, []).append(("group", group, None))
+    for group, data in commands_data.items():
+        for cmd, cmd_data in ((data or {}).get("commands") or {}).items():
+            import_paths[command_import_path(group, cmd)] = (group, cmd)
+            for alias in [cmd.replace("_", "-")] + list((cmd_data or {}).get("aliases") or []):
+                sources.setdefault(alias, []).append(("command", group, cmd))
+    # Hand-written entry points that run a command module directly
+    for alias, target in (scripts or {}).items():
+        if target in import_paths:
+            sources.setdefault(alias, []).append(("command",) + import_paths[target])
+
+    reserved = reserved or set()
+    own_scripts = set(scripts or {})
+    targets, resolved, conflicts = {}, {}, []
+    for alias, claims in sources.items():
+        unique = list(dict.fromkeys(claims))
+        kind, group, cmd = next((claim for claim in claims if claim[0] == "group"), claims[-1])
+        resolved[alias] = (group,) if kind == "group" else (group, cmd)
+        if len(unique) > 1:
+            details = [f"group {group}" if kind == "group" else f"command {group}:{cmd}"
+                       for kind, group, cmd in claims]
+            conflicts.append({"alias": alias, "kind": "ambiguous",
+                              "message": f"Alias '{alias}' is used in multiple contexts: " + ", ".join(details)})
+        else:
+            kind, group, cmd = unique[0]
+            targets[alias] = (group,) if kind == "group" else (group, cmd)
+        if alias in reserved:
+            conflicts.append({"alias": alias, "kind": "reserved",
+                              "message": f"Alias '{alias}' is reserved and cannot be used (found in no-go-alias.txt)."})
+        own_scripts.add(alias)
+
+    for name in sorted(own_scripts):
+        path = (executables or {}).get(name)
+        if path is not None and not is_own_script(path):
+            conflicts.append({"alias": name, "kind": "path",
+                              "message": f"Alias '{name}' is shadowed by or shadows {path} on $PATH"})
+    return {"sources": sources, "targets": targets, "resolved": resolved, "conflicts": conflicts}
@@ -0,0 +1,83 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Table-driven launcher for command alias entry points.
+
+Every alias script (``warp``, ``tour``, ...) points at the shim, which hands
+aliases to :func:`launch`. The script name is looked up in the manifest's
+alias table and the target command's module is imported and run directly,
+without importing the main CLI or building any click group.
+"""
+
+import importlib
+
+import click
+
+from starshipagentic.utils import help_cache
+from starshipagentic.utils.command_manifest import load_manifest
+
+def alias_target(prog, manifest=None):
+    """
+    Look up the command an alias script runs.
+
+    Args:
+        prog (str): Invoked script name
+        manifest (dict, optional): Command manifest (default: the current one)
+
+    Returns:
+        tuple or None: ``(group, command, import path)``, or None if ``prog``
+        is not a command alias or the manifest is missing or stale
+    """
+    if manifest is None:
+        manifest = load_manifest()
+    if manifest is None or prog in manifest["groups"]:
+        return None
+    target = manifest["aliases"].get(prog)
+    if target is None:
+        return None
+    group_name, cmd_name = target
+    cmd_info = manifest["groups"][group_name]["commands"][cmd_name]
+    return group_name, cmd_name, f"{cmd_info['module']}:{cmd_info['attr']}"
+
+def launch_command(command, args, prog_name, group_name=None):
+    """
+    Run a click command as a standalone program (exits via SystemExit).
+
+    Args:
+        command (click.Command): Command to run
+        args (list): Command-line arguments for it
+        prog_name (str): Name shown in usage and help
+        group_name (str, optional): Group the command belongs to, for the alias note in help
+    """
+    help_names = command.context_settings.get("help_option_names", ["--help"])
+    if group_name and help_cache.wants_help(args, help_names):
+        click.echo(f"This is an alias for: starshipagentic {group_name} {command.name}")
+        click.echo(f"For full documentation, use: starshipagentic {group_name} {command.name} --help\n")
+    return command.main(args=list(args), prog_name=prog_name)
+
+def launch(prog, args):
+    """
+    Run the command behind an alias script.
+
+    Args:
+        prog (str): Invoked script name
+        args (list): Arguments passed to the script
+
+    Returns:
+        bool: False if ``prog`` is not a command alias (nothing was run);
+        otherwise the command runs and exits via SystemExit
+    """
+    target = alias_target(prog)
+    if target is None:
+        return False
+    group_name, _cmd_name, import_path = target
+
+    module_name, attr_name = import_path.split(":", 1)
+    command = getattr(importlib.import_module(module_name), attr_name)
+    help_cache.instrument_command(command, help_cache.module_source(import_path))
+    return launch_command(command, args, prog, group_name)
@@ -0,0 +1,73 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""On-disk cache helpers for Starship Agentic.
+
+Caches live under ``$STARSHIPAGENTIC_CACHE_DIR``, ``$XDG_CACHE_HOME/starshipagentic``
+or ``~/.cache/starshipagentic``. Entries are written atomically, and any
+failure to read or write one is treated as a cache miss.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_DIR_ENV = "STARSHIPAGENTIC_CACHE_DIR"
+
+def cache_root():
+    """Return the directory all caches live under."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "starshipagentic"
+
+def file_stamp(path):
+    """Return ``(mtime_ns, size)`` of a file, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def cache_key(*parts):
+    """Return a stable file-name-safe digest of the given key parts."""
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+def atomic_write(path, data):
+    """Write bytes or text to ``path`` via a temporary file and rename."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def read_entry(namespace, key):
+    """Return a cached text entry, or None on a miss."""
+    try:
+        with open(cache_root() / namespace / key, "r", encoding="utf-8") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def write_entry(namespace, key, text):
+    """Store a text entry, ignoring failures (a read-only home just means no cache)."""
+    try:
+        atomic_write(cache_root() / namespace / key, text)
+    except OSError:
+        pass
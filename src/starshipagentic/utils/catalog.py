@@ -0,0 +1,140 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Command catalog listings for ``--all-commands`` and ``--commands-list``.
+
+Rows are generated one command at a time and written as they are produced,
+so a listing never builds the whole catalog in memory or in a rich table.
+
+Formats:
+    text   aligned columns per group (styled on a terminal)
+    json   a JSON array of row objects, written one row at a time
+    tsv    a header line, then one tab-separated row per command (lists
+           are joined with ";", tabs and newlines are backslash-escaped)
+"""
+
+import json
+
+import click
+
+from starshipagentic.utils.command_manifest import COMMANDS_LIST_PATH
+
+FORMATS = ("text", "json", "tsv")
+FIELDS = ("group", "command", "aliases", "description", "options")
+
+def registry_rows(registry=None):
+    """
+    Yield every command in the registry index, with all of its aliases.
+
+    Aliases include the console-script entry points from pyproject.toml.
+
+    Args:
+        registry (CommandRegistry, optional): Registry to list (default: the singleton)
+
+    Yields:
+        dict: One row per command, with the keys in FIELDS
+    """
+    if registry is None:
+        from starshipagentic.utils.command_registry import CommandRegistry
+        registry = CommandRegistry()
+
+    for group_name in registry.get_all_groups():
+        group_aliases = registry.aliases_for_group(group_name)
+        for cmd_name, cmd_info in registry.get_all_commands(group_name).items():
+            yield _row(group_name, cmd_name, cmd_info, group_aliases.get(cmd_name, []))
+
+def commands_list_rows(path=COMMANDS_LIST_PATH):
+    """
+    Yield every command exactly as written in commands-list.yml.
+
+    Args:
+        path (str): Commands list to read
+
+    Yields:
+        dict: One row per command, with the keys in FIELDS
+    """
+    import yaml
+
+    with open(path, "r") as f:
+        groups = yaml.safe_load(f) or {}
+    for group_name, group_data in groups.items():
+        for cmd_name, cmd_info in ((group_data or {}).get("commands") or {}).items():
+            cmd_info = cmd_info or {}
+            yield _row(group_name, cmd_name, cmd_info, cmd_info.get("aliases") or [])
+
+def _row(group_name, cmd_name, cmd_info, aliases):
+    return {
+        "group": group_name,
+        "command": cmd_name,
+        "aliases": list(aliases),
+        "description": (cmd_info or {}).get("description", ""),
+        "options": list((cmd_info or {}).get("options") or []),
+    }
+
+def write_catalog(rows, fmt="text", echo=click.echo):
+    """
+    Write catalog rows in the given format as they arrive.
+
+    Args:
+        rows (iterable): Rows from registry_rows() or commands_list_rows()
+        fmt (str): One of FORMATS
+        echo (callable): Writes one line (default: click.echo)
+
+    Returns:
+        int: Number of rows written
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format: {fmt}")
+    return {"text": _write_text, "json": _write_json, "tsv": _write_tsv}[fmt](rows, echo)
+
+def _write_json(rows, echo):
+    count = 0
+    for count, row in enumerate(rows, 1):
+        echo(("[" if count == 1 else ",") + json.dumps(row, ensure_ascii=False))
+    echo("]" if count else "[]")
+    return count
+
+def _tsv_field(value):
+    if isinstance(value, list):
+        value = ";".join(value)
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+def _write_tsv(rows, echo):
+    echo("\t".join(FIELDS))
+    count = 0
+    for count, row in enumerate(rows, 1):
+        echo("\t".join(_tsv_field(row[field]) for field in FIELDS))
+    return count
+
+def _write_text(rows, echo):
+    # Column widths are per group, so only one group's rows are held at a time
+    count = 0
+    group_rows = []
+    for row in rows:
+        if group_rows and row["group"] != group_rows[0]["group"]:
+            _write_text_group(group_rows, echo)
+            group_rows = []
+        group_rows.append(row)
+        count += 1
+    if group_rows:
+        _write_text_group(group_rows, echo)
+    return count
+
+def _write_text_group(rows, echo):
+    group_name = rows[0]["group"]
+    commands = [f"{group_name} {row['command']}" for row in rows]
+    aliases = [", ".join(row["aliases"]) for row in rows]
+    command_width = max(len(value) for value in commands)
+    alias_width = max(len(value) for value in aliases)
+
+    echo(click.style(group_name.upper(), fg="yellow", bold=True))
+    for row, command, alias in zip(rows, commands, aliases):
+        echo("  " + click.style(command.ljust(command_width), fg="green", bold=True)
+             + "  " + click.style(alias.ljust(alias_width), fg="yellow")
+             + "  " + row["description"])
+    echo("")
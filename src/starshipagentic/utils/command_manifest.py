@@ -0,0 +1,131 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Precompiled command manifest for Starship Agentic.
+
+The manifest is a JSON snapshot of ``commands-list.yml`` (plus the alias
+entry points from ``pyproject.toml``) written by ``tools/sync2_aliases.py``.
+It lets the CLI load its whole command catalog with one fast read instead of
+parsing YAML and TOML on every invocation.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from .alias_analysis import analyze
+from .cache import atomic_write
+
+MANIFEST_VERSION = 1
+PACKAGE_DIR = Path(__file__).parent.parent
+MANIFEST_PATH = PACKAGE_DIR / "commands-manifest.json"
+COMMANDS_LIST_PATH = PACKAGE_DIR / "commands-list.yml"
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def build_manifest(commands_data, scripts=None, source_hash=None):
+    """
+    Build a manifest from parsed commands-list.yml data.
+
+    Args:
+        commands_data (dict): Parsed contents of commands-list.yml
+        scripts (dict, optional): The [project.scripts] table (alias -> target)
+        source_hash (str, optional): Hash of the commands-list.yml the data came from
+
+    Returns:
+        dict: The manifest
+    """
+    groups = {}
+    for group_name, group_data in (commands_data or {}).items():
+        group_data = group_data or {}
+        commands = {}
+        for cmd_name, cmd_data in (group_data.get("commands") or {}).items():
+            cmd_data = cmd_data or {}
+            package = cmd_name.replace("-", "_")
+            module = f"starshipagentic.commands.{group_name}.{package}.cli"
+            attr = f"{package}_command"
+            commands[cmd_name] = {
+                "description": cmd_data.get("description", ""),
+                "options": list(cmd_data.get("options") or []),
+                "aliases": list(cmd_data.get("aliases") or []),
+                "module": module,
+                "attr": attr,
+            }
+        groups[group_name] = {
+            "description": group_data.get("description", ""),
+            "module": f"starshipagentic.commands.{group_name}",
+            "attr": f"{group_name}_group",
+            "commands": commands,
+        }
+
+    # Every command is reachable by its own name, its YAML aliases and any
+    # hand-written entry point that targets its module directly (the scripts
+    # sync2_aliases.py generates all target the shim instead). The table is
+    # the alias analysis' resolution, so conflict reports describe exactly
+    # what runs; names that resolve to a group are left to the group table
+    aliases = {alias: list(target) for alias, target in analyze(commands_data or {}, scripts)["resolved"].items()
+               if len(target) == 2}
+
+    return {
+        "version": MANIFEST_VERSION,
+        "source_hash": source_hash,
+        "groups": groups,
+        "aliases": aliases,
+    }
+
+def render_manifest(manifest):
+    """Return a manifest serialised as compact JSON, as written to disk."""
+    return json.dumps(manifest, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+def write_manifest(manifest, path=MANIFEST_PATH):
+    """
+    Write a manifest as compact JSON, atomically and only if its content changed.
+
+    Returns:
+        bool: True if the file was written
+    """
+    text = render_manifest(manifest)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    atomic_write(path, text)
+    return True
+
+def load_manifest(path=MANIFEST_PATH, source_path=COMMANDS_LIST_PATH):
+    """
+    Load the manifest if it exists and is current.
+
+    Args:
+        path (Path): Manifest file to read
+        source_path (Path): commands-list.yml the manifest must have been built from
+
+    Returns:
+        dict or None: The manifest, or None if it is missing, from another
+        manifest version, unreadable, or stale by content hash
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+
+    try:
+        if manifest.get("source_hash") != hash_file(source_path):
+            return None
+    except OSError:
+        # Without the YAML source there is nothing to fall back to
+        pass
+    return manifest
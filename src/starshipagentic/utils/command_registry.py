@@ -8,24 +8,155 @@
 # For full details, see the LICENSE.md file in the project root.
 """Command registry for Starship Agentic."""
 
-import yaml
-from pathlib import Path
+import logging
+import os
+import threading
+from .alias_analysis import PYPROJECT_PATH, analyze, load_pyproject_scripts
+from .command_manifest import COMMANDS_LIST_PATH, build_manifest, load_manifest
+from .command_trie import CommandTrie
+from .suggest import TrigramIndex
+from . import profiling
+
+logger = logging.getLogger(__name__)
 
 class CommandRegistry:
+    """Process-wide index of command groups, commands and aliases.
+
+    The index is held in one snapshot dict that is replaced as a whole, never
+    mutated, so readers need no lock: each method reads ``self._current``
+    once. ``reload()`` builds a new snapshot under a lock and swaps it in; it
+    runs when an alias lookup finds commands-list.yml or pyproject.toml
+    changed, and from the ``watch()`` thread in long-running hosts.
+    """
     _instance = None
-    _commands = None
+    _instance_lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(CommandRegistry, cls).__new__(cls)
-            cls._instance._load_commands()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls._create()
         return cls._instance
+
+    @classmethod
+    def _create(cls):
+        """Build a registry instance without touching the singleton."""
+        instance = super(CommandRegistry, cls).__new__(cls)
+        instance._lock = threading.Lock()
+        instance._watcher = None
+        with profiling.phase("registry"):
+            instance._current = instance._load_commands()
+        return instance
     
     def _load_commands(self):
-        """Load commands from YAML file."""
-        commands_path = Path(__file__).parent.parent / "commands-list.yml"
-        with open(commands_path, 'r') as f:
-            self._commands = yaml.safe_load(f)
+        """Load commands from the precompiled manifest, falling back to YAML if it is stale."""
+        signature = self._sources_signature()
+        manifest = load_manifest()
+        if manifest is not None:
+            commands = manifest["groups"]
+        else:
+            import yaml
+            with open(COMMANDS_LIST_PATH, 'r') as f:
+                commands = yaml.safe_load(f)
+        return {"commands": commands, "manifest": manifest, "signature": signature, "builtins": frozenset(),
+                "alias_index": None, "command_aliases": None, "tries": None, "suggesters": None}
+
+    def reload(self):
+        """
+        Re-read the manifest (or commands-list.yml) and pyproject.toml and swap in a new index.
+
+        Readers keep using the previous snapshot until the new one is complete.
+
+        Returns:
+            bool: True if the source files changed since the current snapshot was built
+        """
+        with self._lock:
+            with profiling.phase("registry"):
+                snapshot = self._load_commands()
+                snapshot["builtins"] = self._current["builtins"]
+                snapshot.update(self._build_alias_index(snapshot))
+            changed = snapshot["signature"] != self._current["signature"]
+            self._current = snapshot
+        logger.debug("Command registry reloaded (sources changed: %s)", changed)
+        return changed
+
+    def watch(self, interval=1.0, on_reload=None):
+        """
+        Poll commands-list.yml and pyproject.toml and reload when either changes.
+
+        The watcher is a daemon thread; calling watch() again while it runs does
+        nothing.
+
+        Args:
+            interval (float): Seconds between polls
+            on_reload (callable, optional): Called with the registry after each reload
+
+        Returns:
+            threading.Thread: The watcher thread
+        """
+        with self._lock:
+            if self._watcher is not None and self._watcher[0].is_alive():
+                return self._watcher[0]
+            stop = threading.Event()
+            thread = threading.Thread(target=self._watch, args=(interval, on_reload, stop),
+                                      name="starshipagentic-registry-watch", daemon=True)
+            self._watcher = (thread, stop)
+        thread.start()
+        return thread
+
+    def stop_watching(self, timeout=None):
+        """Stop the watcher thread started by watch(), if any."""
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher[1].set()
+            watcher[0].join(timeout)
+
+    def _watch(self, interval, on_reload, stop):
+        while not stop.wait(interval):
+            if self._sources_signature() == self._current["signature"]:
+                continue
+            try:
+                self.reload()
+            except Exception as e:
+                # Keep serving the previous index; a half-written file will settle
+                logger.warning("Command registry reload failed: %s", e)
+                continue
+            if on_reload is not None:
+                on_reload(self)
+
+    def _snapshot(self, builtins=()):
+        """
+        Return the current snapshot with its alias indexes built, reloading if its sources changed.
+
+        Args:
+            builtins (iterable, optional): Names of commands defined directly on
+                the main CLI; the top-level indexes are rebuilt to include any
+                not seen before
+        """
+        snapshot = self._current
+        if snapshot["signature"] != self._sources_signature():
+            self.reload()
+            snapshot = self._current
+        if snapshot["alias_index"] is None or self._new_builtins(snapshot, builtins):
+            with self._lock:
+                snapshot = self._current
+                new_builtins = self._new_builtins(snapshot, builtins)
+                if snapshot["alias_index"] is None or new_builtins:
+                    with profiling.phase("registry"):
+                        snapshot = dict(snapshot, builtins=snapshot["builtins"] | new_builtins)
+                        snapshot.update(self._build_alias_index(snapshot))
+                    self._current = snapshot
+        return snapshot
+
+    @staticmethod
+    def _new_builtins(snapshot, builtins):
+        """Return the builtin command names a snapshot's indexes do not cover yet."""
+        return frozenset(builtins) - snapshot["builtins"] - snapshot["commands"].keys()
+
+    @property
+    def _commands(self):
+        return self._current["commands"]
     
     def get_all_groups(self):
         """Return all command groups."""
@@ -52,80 +183,25 @@ class CommandRegistry:
                 all_commands[f"{group_name} {cmd_name}"] = cmd_data
         return all_commands
     
+    def get_command_import_path(self, group_name, command_name):
+        """Return the ``module:attribute`` import path of a command's click object."""
+        cmd_info = self.get_command_info(group_name, command_name)
+        if "module" in cmd_info:
+            return f"{cmd_info['module']}:{cmd_info['attr']}"
+        package = command_name.replace("-", "_")
+        return f"starshipagentic.commands.{group_name}.{package}.cli:{package}_command"
+
     def get_aliases_map(self):
         """Return a mapping of aliases to their full commands.
         
-        Uses pyproject.toml as the source of truth for aliases.
+        Uses pyproject.toml as the source of truth for aliases, as captured
+        in the precompiled manifest when it is current.
         """
-        aliases_map = {}
-        
-        # First try to get aliases from pyproject.toml (source of truth)
-        try:
-            import tomli
-        except ImportError:
-            try:
-                import tomllib as tomli
-            except ImportError:
-                # If neither tomli nor tomllib is available, fall back to YAML
-                for group_name, group_data in self._commands.items():
-                    for cmd_name, cmd_data in group_data.get('commands', {}).items():
-                        for alias in cmd_data.get('aliases', []):
-                            aliases_map[alias] = (group_name, cmd_name)
-                return aliases_map
-        
-        # Load aliases from pyproject.toml
-        pyproject_path = Path(__file__).parent.parent.parent.parent / "pyproject.toml"
-        if pyproject_path.exists():
-            try:
-                with open(pyproject_path, "rb") as f:
-                    pyproject = tomli.load(f)
-                
-                # Extract aliases from project.scripts
-                scripts = pyproject.get("project", {}).get("scripts", {})
-                for alias, target in scripts.items():
-                    # Skip the main command
-                    if alias == "starshipagentic":
-                        continue
-                        
-                    # Parse the target to get the group and command
-                    # Format is typically: "starshipagentic.commands.group_cmds:command_name_command"
-                    try:
-                        module_path, func_name = target.split(":")
-                        group_name = module_path.split(".")[-1].replace("_cmds", "")
-                        
-                        # The command function name typically ends with "_command"
-                        # and is derived from the actual command name
-                        cmd_func_name = func_name.replace("_command", "")
-                        
-                        # Convert function name to command name (replace underscores with hyphens)
-                        cmd_name = cmd_func_name.replace("_", "-")
-                        
-                        # Find the actual command name in the YAML that matches this function name
-                        for command_name in self._commands.get(group_name, {}).get('commands', {}):
-                            if command_name.replace("-", "_") == cmd_func_name:
-                                aliases_map[alias] = (group_name, command_name)
-                                break
-                    except (ValueError, KeyError, IndexError):
-                        # Skip entries that don't match the expected format
-                        continue
-            except Exception as e:
-                # Log the error but continue with fallback
-                print(f"Error reading pyproject.toml: {e}")
-                # Fall back to YAML
-                for group_name, group_data in self._commands.items():
-                    for cmd_name, cmd_data in group_data.get('commands', {}).items():
-                        for alias in cmd_data.get('aliases', []):
-                            aliases_map[alias] = (group_name, cmd_name)
-                return aliases_map
-        
-        # Fall back to YAML if no aliases were found in pyproject.toml
-        if not aliases_map:
-            for group_name, group_data in self._commands.items():
-                for cmd_name, cmd_data in group_data.get('commands', {}).items():
-                    for alias in cmd_data.get('aliases', []):
-                        aliases_map[alias] = (group_name, cmd_name)
-        
-        return aliases_map
+        return dict(self._snapshot()["alias_index"])
+
+    def get_command_for_alias(self, alias):
+        """Return the (group, command) an alias points to, or None."""
+        return self._snapshot()["alias_index"].get(alias)
     
     def get_example_command(self, group_name):
         """Return an example command for a group."""
@@ -140,59 +216,177 @@ class CommandRegistry:
     
     def get_aliases_for_command(self, group_name, command_name):
         """Get aliases for a specific command from pyproject.toml."""
-        aliases = []
-        
-        # Try to get aliases from pyproject.toml (source of truth)
-        try:
-            import tomli
-        except ImportError:
-            try:
-                import tomllib as tomli
-            except ImportError:
-                # If neither tomli nor tomllib is available, fall back to YAML
-                cmd_info = self.get_command_info(group_name, command_name)
-                return cmd_info.get("aliases", [])
-        
-        # Load aliases from pyproject.toml
-        pyproject_path = Path(__file__).parent.parent.parent.parent / "pyproject.toml"
-        if pyproject_path.exists():
+        return list(self._snapshot()["command_aliases"].get((group_name, command_name), []))
+
+    def aliases_for_group(self, group_name):
+        """Return a mapping of every command in a group to its aliases."""
+        snapshot = self._snapshot()
+        commands = snapshot["commands"].get(group_name, {}).get("commands") or {}
+        return {
+            cmd_name: list(snapshot["command_aliases"].get((group_name, cmd_name), []))
+            for cmd_name in commands
+        }
+
+    def resolve_command_path(self, token, group_name=None, builtins=()):
+        """
+        Resolve one command-line token against the precomputed tries.
+
+        At the top level a token may name a group or a builtin command (or a
+        unique prefix of either) or be a command alias; inside a group it may
+        name a command, a unique prefix of one, or one of its aliases.
+
+        Args:
+            token (str): Token from the command line
+            group_name (str, optional): Group the token is looked up in
+            builtins (iterable, optional): Commands defined directly on the main
+                CLI (e.g. ``find``), which top-level prefixes must also consider
+
+        Returns:
+            tuple or None: ``(group,)`` or ``(group, command)``
+
+        Raises:
+            AmbiguousCommandError: If the token prefixes several names
+        """
+        trie = self._snapshot(builtins)["tries"].get(group_name)
+        if trie is None:
+            return None
+        return trie.resolve(token)
+
+    def suggest(self, token, group_name=None, limit=3, builtins=()):
+        """
+        Suggest the names closest to a token that did not resolve.
+
+        At the top level group names, builtin commands and aliases are
+        considered; inside a group, its command names and their aliases.
+
+        Args:
+            token (str): Unresolved token from the command line
+            group_name (str, optional): Group the token was looked up in
+            limit (int): Maximum number of suggestions
+            builtins (iterable, optional): Commands defined directly on the main CLI
+
+        Returns:
+            list: Suggested names, best first, at most one per target
+        """
+        snapshot = self._snapshot(builtins)
+        index = snapshot["suggesters"].get(group_name)
+        if index is None:
+            with self._lock:
+                if self._current["alias_index"] is not None:
+                    # A reload may have swapped the snapshot; index the latest one
+                    snapshot = self._current
+                index = snapshot["suggesters"].get(group_name)
+                if index is None:
+                    with profiling.phase("registry"):
+                        index = self._build_suggester(snapshot, group_name)
+                    suggesters = dict(snapshot["suggesters"])
+                    suggesters[group_name] = index
+                    if snapshot is self._current:
+                        self._current = dict(snapshot, suggesters=suggesters)
+        return [name for name, _target, _score in index.search(token, limit=limit)]
+
+    def _build_suggester(self, snapshot, group_name):
+        """Build the trigram index suggestions are drawn from for one scope."""
+        index = TrigramIndex()
+        if group_name is None:
+            for name in list(snapshot["commands"]) + sorted(snapshot["builtins"]):
+                index.add(name, (name,))
+            for alias, target in snapshot["alias_index"].items():
+                index.add(alias, tuple(target))
+            return index
+        for cmd_name in snapshot["commands"].get(group_name, {}).get("commands") or {}:
+            index.add(cmd_name, (group_name, cmd_name))
+            for alias in snapshot["command_aliases"].get((group_name, cmd_name), []):
+                index.add(alias, (group_name, cmd_name))
+        return index
+
+    def _sources_signature(self):
+        """Return the (mtime, size) of the files the index is built from."""
+        signature = []
+        for path in (COMMANDS_LIST_PATH, PYPROJECT_PATH):
             try:
-                with open(pyproject_path, "rb") as f:
-                    pyproject = tomli.load(f)
-                
-                # Convert command name to function name (replace hyphens with underscores)
-                cmd_func_name = command_name.replace("-", "_")
-                
-                # Extract aliases from project.scripts
-                scripts = pyproject.get("project", {}).get("scripts", {})
-                for alias, target in scripts.items():
-                    # Skip the main command
-                    if alias == "starshipagentic":
-                        continue
-                    
-                    # Check if this target matches our command
-                    target_pattern = f"starshipagentic.commands.{group_name}_cmds:{cmd_func_name}_command"
-                    if target_pattern in target:
-                        aliases.append(alias)
-            except Exception as e:
-                # Log the error but continue with fallback
-                print(f"Error reading pyproject.toml: {e}")
-                # Fall back to YAML
-                cmd_info = self.get_command_info(group_name, command_name)
-                return cmd_info.get("aliases", [])
-        
-        # Fall back to YAML if no aliases were found in pyproject.toml
-        if not aliases:
-            cmd_info = self.get_command_info(group_name, command_name)
-            aliases = cmd_info.get("aliases", [])
-        
-        return aliases
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _build_alias_index(self, snapshot):
+        """
+        Build the alias -> (group, command) and (group, command) -> aliases indexes.
+
+        Args:
+            snapshot (dict): Snapshot whose commands (and manifest) are indexed
+
+        Returns:
+            dict: The snapshot's alias_index, command_aliases, tries and suggesters entries
+        """
+        commands = snapshot["commands"]
+        manifest = snapshot["manifest"]
+        if manifest is None:
+            manifest = build_manifest(commands, self._load_pyproject_scripts())
+        # The manifest's alias table is the alias analysis' resolution (see
+        # alias_analysis.analyze()), so lookups agree with its conflict reports
+        alias_index = {alias: tuple(target) for alias, target in manifest["aliases"].items()}
+
+        command_aliases = {}
+        for alias, (group_name, cmd_name) in alias_index.items():
+            # The command's own name is an entry point, not an alias
+            if alias != cmd_name:
+                command_aliases.setdefault((group_name, cmd_name), []).append(alias)
+
+        tries = {None: CommandTrie()}
+        for name in snapshot["builtins"]:
+            tries[None].add(name, (name,))
+        for group_name, group_data in commands.items():
+            tries[None].add(group_name, (group_name,))
+            group_trie = tries[group_name] = CommandTrie()
+            for cmd_name in (group_data.get('commands') or {}):
+                group_trie.add(cmd_name, (group_name, cmd_name))
+                for alias in command_aliases.get((group_name, cmd_name), []):
+                    group_trie.add_alias(alias, (group_name, cmd_name))
+        for alias, target in alias_index.items():
+            tries[None].add_alias(alias, tuple(target))
+
+        return {"alias_index": alias_index, "command_aliases": command_aliases,
+                "tries": tries, "suggesters": {}}
+
+    def alias_conflicts(self, reserved=None, executables=None):
+        """
+        Report alias conflicts in the catalog this registry resolves against.
+
+        Args:
+            reserved (set, optional): Reserved names (see alias_analysis.load_reserved())
+            executables (dict, optional): Executables on $PATH (see
+                alias_analysis.path_executables()); skip the $PATH check when None
+
+        Returns:
+            list: ``{alias, kind, message}`` conflicts from alias_analysis.analyze()
+        """
+        return analyze(self._current["commands"], self._load_pyproject_scripts(), reserved=reserved,
+                       executables=executables)["conflicts"]
+
+    def _load_pyproject_scripts(self):
+        """Return the [project.scripts] table from pyproject.toml, or {} if unavailable."""
+        return load_pyproject_scripts(PYPROJECT_PATH)
     
-    def validate_commands(self):
-        """Validate that all commands in YAML have implementations."""
-        # This would check that all commands in YAML have corresponding
-        # implementations in the codebase. For now, it's a placeholder.
-        return True
+    def validate_commands(self, jobs=None, use_cache=True):
+        """
+        Validate that every documented command has a working implementation.
+
+        Each command's cli.py and services.py must exist, import cleanly and
+        accept the documented options (see utils/command_validation.py).
+
+        Args:
+            jobs (int, optional): Worker threads used for the imports
+            use_cache (bool): Skip commands whose files passed unchanged before
+
+        Returns:
+            dict: Report with ``ok``, ``checked``, ``failed``, ``cached`` and
+            per-command ``commands`` results
+        """
+        from .command_validation import validate
+        return validate(self, jobs=jobs, use_cache=use_cache)
 
 # Create a singleton instance
 command_registry = CommandRegistry()
@@ -0,0 +1,88 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Prefix trie used to resolve command-line tokens to groups and commands."""
+
+
+class AmbiguousCommandError(ValueError):
+    """Raised when a token is a prefix of more than one name."""
+
+    def __init__(self, token, candidates):
+        self.token = token
+        self.candidates = sorted(candidates)
+        super().__init__(f"'{token}' is ambiguous: {', '.join(self.candidates)}")
+
+
+class CommandTrie:
+    """Map names (and exact-only aliases) to targets, with unique-prefix lookup.
+
+    Every node records the set of targets reachable below it, so deciding
+    whether a prefix is unique costs one walk down the token's characters.
+    """
+
+    def __init__(self):
+        self._root = {"children": {}, "target": None, "targets": set()}
+        self._aliases = {}
+
+    def add(self, name, target):
+        """Register a name that may also be abbreviated to a unique prefix."""
+        node = self._root
+        node["targets"].add(target)
+        for char in name:
+            node = node["children"].setdefault(char, {"children": {}, "target": None, "targets": set()})
+            node["targets"].add(target)
+        node["target"] = target
+
+    def add_alias(self, alias, target):
+        """Register a name that only matches exactly."""
+        self._aliases[alias] = target
+
+    def resolve(self, token):
+        """
+        Resolve a token in a single pass.
+
+        Exact names win, then exact aliases, then a prefix shared by exactly
+        one name.
+
+        Args:
+            token (str): Token from the command line
+
+        Returns:
+            The registered target, or None if nothing matches
+
+        Raises:
+            AmbiguousCommandError: If the token prefixes several names
+        """
+        if not token:
+            return None
+        node = self._root
+        for char in token:
+            node = node["children"].get(char)
+            if node is None:
+                return self._aliases.get(token)
+
+        if node["target"] is not None:
+            return node["target"]
+        if token in self._aliases:
+            return self._aliases[token]
+        if len(node["targets"]) == 1:
+            return next(iter(node["targets"]))
+        if node["targets"]:
+            raise AmbiguousCommandError(token, self._names_below(node, token))
+        return None
+
+    def _names_below(self, node, prefix):
+        """Return the full names registered below a node."""
+        names = []
+        stack = [(node, prefix)]
+        while stack:
+            node, name = stack.pop()
+            if node["target"] is not None:
+                names.append(name)
+            stack.extend((child, name + char) for char, child in node["children"].items())
+        return names
@@ -0,0 +1,127 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Check that every documented command has a working implementation.
+
+For each command in the registry the command package must have ``cli.py``
+and ``services.py``, the ``cli`` module must import cleanly and expose the
+click command named in the manifest, and that command must accept every
+option documented in commands-list.yml. Modules are imported concurrently,
+and passing results are cached under ``~/.cache/starshipagentic/validation``
+keyed by the SHA-256 of both files, so unchanged commands are not imported
+again.
+"""
+
+import importlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import click
+
+from starshipagentic.utils.cache import cache_key, read_entry, write_entry
+from starshipagentic.utils.command_manifest import hash_file
+
+VALIDATION_CACHE_VERSION = 1
+NAMESPACE = "validation"
+PACKAGE_ROOT = Path(__file__).parent.parent.parent
+
+def documented_options(cmd_info):
+    """Return the option names (``--name``) documented for a command."""
+    names = []
+    for option in cmd_info.get("options") or []:
+        name = str(option).split(":", 1)[0].strip()
+        if name.startswith("-"):
+            names.append(name)
+    return names
+
+def module_files(import_path):
+    """Return the ``cli.py`` and ``services.py`` paths of a command's package."""
+    module_name = import_path.split(":", 1)[0]
+    cli_path = PACKAGE_ROOT.joinpath(*module_name.split(".")).with_suffix(".py")
+    return cli_path, cli_path.with_name("services.py")
+
+def check_command(group_name, cmd_name, import_path, options, use_cache=True):
+    """
+    Check one command's files, import and options.
+
+    Args:
+        group_name (str): Command group
+        cmd_name (str): Command name
+        import_path (str): ``module:attribute`` of the click command
+        options (list): Documented option names
+        use_cache (bool): Reuse a passing result for unchanged files
+
+    Returns:
+        dict: ``{group, command, import_path, ok, problems, cached}``
+    """
+    result = {"group": group_name, "command": cmd_name, "import_path": import_path,
+              "ok": False, "problems": [], "cached": False}
+    cli_path, services_path = module_files(import_path)
+    missing = [path for path in (cli_path, services_path) if not path.is_file()]
+    if missing:
+        result["problems"] = [f"Missing {os.path.relpath(path, PACKAGE_ROOT)}" for path in missing]
+        return result
+
+    key = cache_key(VALIDATION_CACHE_VERSION, import_path, hash_file(cli_path), hash_file(services_path),
+                    tuple(options))
+    if use_cache and read_entry(NAMESPACE, key) is not None:
+        return dict(result, ok=True, cached=True)
+
+    module_name, attr_name = import_path.split(":", 1)
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        result["problems"] = [f"Import of {module_name} failed: {type(e).__name__}: {e}"]
+        return result
+    command = getattr(module, attr_name, None)
+    if not isinstance(command, click.Command):
+        result["problems"] = [f"{module_name} has no click command '{attr_name}'"]
+        return result
+
+    accepted = {opt for param in command.params if isinstance(param, click.Option)
+                for opt in param.opts + param.secondary_opts}
+    result["problems"] = [f"Documented option {option} is not accepted" for option in options
+                          if option not in accepted]
+    result["ok"] = not result["problems"]
+    if result["ok"]:
+        write_entry(NAMESPACE, key, json.dumps({"import_path": import_path}))
+    return result
+
+def validate(registry, jobs=None, use_cache=True):
+    """
+    Check every command in a registry, importing modules in a worker pool.
+
+    Args:
+        registry (CommandRegistry): Registry whose commands are checked
+        jobs (int, optional): Worker threads (default: one per CPU, at most 8)
+        use_cache (bool): Reuse passing results for unchanged files
+
+    Returns:
+        dict: ``{ok, checked, failed, cached, commands}`` where ``commands``
+        lists the per-command results in catalog order
+    """
+    checks = []
+    for group_name in registry.get_all_groups():
+        for cmd_name, cmd_info in registry.get_all_commands(group_name).items():
+            checks.append((group_name, cmd_name, registry.get_command_import_path(group_name, cmd_name),
+                           documented_options(cmd_info or {})))
+
+    jobs = jobs or min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(lambda check: check_command(*check, use_cache=use_cache), checks))
+
+    failed = [result for result in results if not result["ok"]]
+    return {
+        "ok": not failed,
+        "checked": len(results),
+        "failed": len(failed),
+        "cached": sum(1 for result in results if result["cached"]),
+        "commands": results,
+    }
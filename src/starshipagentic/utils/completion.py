@@ -0,0 +1,454 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Shell completion for Starship Agentic.
+
+``starshipagentic completion bash|zsh|fish`` prints a script that registers
+completion for the main CLI and every group and alias script. The script
+runs the program with ``STARSHIPAGENTIC_COMPLETE=<shell>`` and ``COMP_LINE``
+(the command line up to the cursor); the shim answers through
+:func:`complete` before importing click or any command module.
+
+Candidates come from a completion index built from the command manifest
+(plus the main CLI's options and its own commands, such as ``find`` and
+``completion``) and cached under ``<cache>/completion``.
+Option values come from small cached value sources:
+
+    ships        ship names in SHIP_CONFIGS (visualization/pygame_display.py)
+    checkpoints  git tags of the repository in the working directory
+    waypoints    entries of ./.starshipagentic/waypoints
+"""
+
+import ast
+import json
+import os
+import shlex
+import sys
+from pathlib import Path
+
+from starshipagentic.utils.cache import cache_key, file_stamp, read_entry, write_entry
+from starshipagentic.utils.command_manifest import COMMANDS_LIST_PATH, MANIFEST_PATH, PACKAGE_DIR, load_manifest
+
+COMPLETE_ENV = "STARSHIPAGENTIC_COMPLETE"
+INDEX_VERSION = 2
+NAMESPACE = "completion"
+MAIN_PROG = "starshipagentic"
+SHELLS = ("bash", "zsh", "fish")
+
+SHIP_CONFIGS_PATH = PACKAGE_DIR / "visualization" / "pygame_display.py"
+WAYPOINTS_DIR = Path(".starshipagentic") / "waypoints"
+
+# (group, command, option) -> value source; option None is the first positional argument
+VALUE_SOURCES = {
+    ("fleet_commander", "visualize-ship", "--ship"): "ships",
+    ("maintenance_officer", "restore-checkpoint", None): "checkpoints",
+    ("navigation_officer", "set-waypoints", None): "waypoints",
+}
+
+def _main_options():
+    """
+    Return the main CLI's options (imports the CLI; only done when the index is rebuilt).
+
+    Returns:
+        tuple: ``({option: help}, {option that takes a value: [choices]})``
+    """
+    from starshipagentic.cli import main
+
+    return _command_options(main)
+
+def _main_commands(groups):
+    """
+    Return the commands defined on the main CLI itself, other than the command groups.
+
+    Args:
+        groups (dict): Group names already in the index
+
+    Returns:
+        dict: name -> ``{description, options, value_options, arguments}`` where
+        arguments lists the choices of the first positional argument
+    """
+    import click
+    from starshipagentic.cli import main
+
+    commands = {}
+    for name, command in main.commands.items():
+        if name in groups:
+            continue
+        options, value_options = _command_options(command)
+        arguments = [param for param in command.params if isinstance(param, click.Argument)]
+        choices = getattr(arguments[0].type, "choices", None) if arguments else None
+        commands[name] = {
+            "description": command.get_short_help_str(limit=80),
+            "options": options,
+            "value_options": value_options,
+            "arguments": [str(choice) for choice in choices or []],
+        }
+    return commands
+
+def _command_options(command):
+    """Return ``({option: help}, {option that takes a value: [choices]})`` for a click command."""
+    import click
+
+    options = {"--help": "Show this message and exit."}
+    value_options = {}
+    for param in command.params:
+        if not isinstance(param, click.Option):
+            continue
+        choices = [str(choice) for choice in getattr(param.type, "choices", None) or []]
+        for opt in param.opts + param.secondary_opts:
+            if opt.startswith("--"):
+                options[opt] = param.help or ""
+            if not param.is_flag:
+                value_options[opt] = choices
+    return options, value_options
+
+def build_index(manifest=None):
+    """
+    Build the completion index from the command manifest.
+
+    Args:
+        manifest (dict, optional): Command manifest (default: the current one)
+
+    Returns:
+        dict: ``{"options", "groups", "commands", "aliases"}`` where groups
+        map command names to their description, aliases and documented
+        options, and commands are the main CLI's own (see _main_commands())
+    """
+    if manifest is None:
+        manifest = load_manifest()
+    if manifest is None:
+        from starshipagentic.utils.command_registry import CommandRegistry
+        from starshipagentic.utils.command_manifest import build_manifest
+
+        manifest = build_manifest(CommandRegistry()._commands)
+
+    groups = {}
+    for group_name, group in manifest["groups"].items():
+        commands = groups[group_name] = {"description": group.get("description", ""), "commands": {}}
+        for cmd_name, cmd in group["commands"].items():
+            options = {"--help": "Show this message and exit."}
+            for entry in cmd.get("options") or []:
+                name, _, description = str(entry).partition(":")
+                options[name.strip()] = description.strip()
+            commands["commands"][cmd_name] = {
+                "description": cmd.get("description", ""),
+                "aliases": [],
+                "options": options,
+            }
+
+    aliases = {}
+    for alias, (group_name, cmd_name) in manifest["aliases"].items():
+        aliases[alias] = [group_name, cmd_name]
+        if alias != cmd_name:
+            groups[group_name]["commands"][cmd_name]["aliases"].append(alias)
+
+    options, value_options = _main_options()
+    return {"version": INDEX_VERSION, "options": options, "value_options": value_options,
+            "groups": groups, "commands": _main_commands(groups), "aliases": aliases}
+
+def load_index():
+    """Return the completion index, from the cache when the manifest and CLI are unchanged."""
+    cli_path = PACKAGE_DIR / "cli.py"
+    key = cache_key(INDEX_VERSION, [file_stamp(path) for path in (MANIFEST_PATH, COMMANDS_LIST_PATH, cli_path)])
+    text = read_entry(NAMESPACE, f"index-{key}")
+    if text is not None:
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    index = build_index()
+    write_entry(NAMESPACE, f"index-{key}", json.dumps(index, separators=(",", ":")))
+    return index
+
+def _cached_values(source, key_parts, compute):
+    key = f"values-{source}-{cache_key(key_parts)}"
+    text = read_entry(NAMESPACE, key)
+    if text is not None:
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    values = compute()
+    write_entry(NAMESPACE, key, json.dumps(values))
+    return values
+
+def ship_names(path=SHIP_CONFIGS_PATH):
+    """Return the keys of SHIP_CONFIGS, read from the source without importing pygame."""
+    def compute():
+        try:
+            tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+        except (OSError, SyntaxError):
+            return []
+        for node in tree.body:
+            if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)
+                    and any(isinstance(target, ast.Name) and target.id == "SHIP_CONFIGS" for target in node.targets)):
+                return [key.value for key in node.value.keys if isinstance(key, ast.Constant)]
+        return []
+    return _cached_values("ships", (str(path), file_stamp(path)), compute)
+
+def _git_dir(start):
+    for directory in [start] + list(start.parents):
+        candidate = directory / ".git"
+        if candidate.is_dir():
+            return candidate
+    return None
+
+def checkpoint_ids(cwd=None):
+    """Return the git tags of the repository containing ``cwd`` (checkpoints are tags)."""
+    git_dir = _git_dir(Path(cwd or os.getcwd()).resolve())
+    if git_dir is None:
+        return []
+    tags_dir = git_dir / "refs" / "tags"
+    packed_refs = git_dir / "packed-refs"
+
+    def compute():
+        tags = set()
+        if tags_dir.is_dir():
+            tags.update(path.relative_to(tags_dir).as_posix() for path in tags_dir.rglob("*") if path.is_file())
+        try:
+            with open(packed_refs, "r", encoding="utf-8") as f:
+                for line in f:
+                    _, _, ref = line.strip().partition(" ")
+                    if ref.startswith("refs/tags/"):
+                        tags.add(ref[len("refs/tags/"):])
+        except OSError:
+            pass
+        return sorted(tags)
+
+    # Nested tag directories are rare; their own mtimes are included when present
+    stamps = [file_stamp(packed_refs), file_stamp(tags_dir)]
+    if tags_dir.is_dir():
+        stamps.extend(file_stamp(path) for path in tags_dir.iterdir() if path.is_dir())
+    return _cached_values("checkpoints", (str(git_dir), stamps), compute)
+
+def waypoint_ids(cwd=None):
+    """Return the waypoint IDs (entries of .starshipagentic/waypoints) for ``cwd``."""
+    directory = Path(cwd or os.getcwd()).resolve() / WAYPOINTS_DIR
+
+    def compute():
+        try:
+            return sorted(entry.split(".", 1)[0] for entry in os.listdir(directory) if not entry.startswith("."))
+        except OSError:
+            return []
+    return _cached_values("waypoints", (str(directory), file_stamp(directory)), compute)
+
+VALUE_PROVIDERS = {"ships": ship_names, "checkpoints": checkpoint_ids, "waypoints": waypoint_ids}
+
+def candidates(prog, words, index=None):
+    """
+    Return completion candidates for the last word.
+
+    Args:
+        prog (str): Invoked script name (main CLI, group or alias)
+        words (list): Words after the script name; the last one is being completed
+        index (dict, optional): Completion index (default: load_index())
+
+    Returns:
+        list: ``(candidate, description)`` tuples
+    """
+    index = index or load_index()
+    words = list(words) or [""]
+    *done, current = words
+
+    group_name = cmd_name = builtin = None
+    if prog in index["groups"]:
+        group_name = prog
+    elif prog != MAIN_PROG and prog in index["aliases"]:
+        group_name, cmd_name = index["aliases"][prog]
+
+    previous = None
+    positional = 0
+    for word in done:
+        if word.startswith("-"):
+            previous = word
+            continue
+        if previous and "=" not in previous and _takes_value(index, group_name, cmd_name, previous, builtin):
+            previous = None
+            continue
+        previous = None
+        if builtin is not None:
+            positional += 1
+        elif group_name is None:
+            if word in index["commands"]:
+                builtin = word
+            elif word in index["groups"]:
+                group_name = word
+            elif word in index["aliases"]:
+                group_name, cmd_name = index["aliases"][word]
+        elif cmd_name is None:
+            cmd_name = _command_for(index, group_name, word)
+        else:
+            positional += 1
+
+    if current.startswith("--") and "=" in current:
+        option, _, prefix = current.partition("=")
+        values = _values(index, group_name, cmd_name, option, builtin)
+        return [(f"{option}={value}", "") for value in values if value.startswith(prefix)]
+    if previous and "=" not in previous and _takes_value(index, group_name, cmd_name, previous, builtin):
+        return [(value, "") for value in _values(index, group_name, cmd_name, previous, builtin)
+                if value.startswith(current)]
+
+    if builtin is not None:
+        command = index["commands"][builtin]
+        if current.startswith("-"):
+            return _matching(command["options"], current)
+        if positional == 0:
+            return [(value, "") for value in command["arguments"] if value.startswith(current)]
+        return []
+
+    if cmd_name is not None:
+        command = index["groups"][group_name]["commands"].get(cmd_name, {})
+        if current.startswith("-"):
+            return _matching(command.get("options", {}), current)
+        if positional == 0:
+            return [(value, "") for value in _values(index, group_name, cmd_name, None) if value.startswith(current)]
+        return []
+
+    if group_name is not None:
+        group = index["groups"][group_name]
+        if current.startswith("-"):
+            return _matching({"--help": "Show this message and exit."}, current)
+        entries = {}
+        for name, command in group["commands"].items():
+            entries[name] = command["description"]
+            for alias in command["aliases"]:
+                entries.setdefault(alias, f"Alias for {name}")
+        return _matching(entries, current)
+
+    if current.startswith("-"):
+        return _matching(index["options"], current)
+    entries = {name: group["description"] for name, group in index["groups"].items()}
+    for name, command in index["commands"].items():
+        entries.setdefault(name, command["description"])
+    for alias, (alias_group, alias_cmd) in index["aliases"].items():
+        entries.setdefault(alias, f"{alias_group} {alias_cmd}")
+    return _matching(entries, current)
+
+def _command_for(index, group_name, word):
+    commands = index["groups"][group_name]["commands"]
+    if word in commands:
+        return word
+    for name, command in commands.items():
+        if word in command["aliases"]:
+            return name
+    return None
+
+def _takes_value(index, group_name, cmd_name, option, builtin=None):
+    if builtin is not None:
+        return option in index["commands"][builtin]["value_options"]
+    if cmd_name is None:
+        return group_name is None and option in index["value_options"]
+    # Documented command options do not say whether they are flags; assume they take a value
+    return option != "--help"
+
+def _values(index, group_name, cmd_name, option, builtin=None):
+    if builtin is not None:
+        return index["commands"][builtin]["value_options"].get(option, [])
+    if group_name is None:
+        return index["value_options"].get(option, [])
+    source = VALUE_SOURCES.get((group_name, cmd_name, option))
+    if source is None:
+        return []
+    return VALUE_PROVIDERS[source]()
+
+def _matching(entries, prefix):
+    return sorted((name, description) for name, description in entries.items() if name.startswith(prefix))
+
+def split_line(line):
+    """Split a command line up to the cursor into words; the last one is being completed."""
+    try:
+        words = shlex.split(line)
+    except ValueError:
+        # Unterminated quote: complete the quoted word as typed
+        words = line.split()
+    if not line or line[-1].isspace():
+        words.append("")
+    return words
+
+def complete(prog, environ=None, stream=None):
+    """
+    Answer a completion request from a shell script.
+
+    Args:
+        prog (str): Invoked script name
+        environ (dict, optional): Environment with COMPLETE_ENV and COMP_LINE (default: os.environ)
+        stream (file, optional): Where to write candidates (default: sys.stdout)
+
+    Returns:
+        int: Exit code
+    """
+    environ = os.environ if environ is None else environ
+    stream = stream or sys.stdout
+    shell = environ.get(COMPLETE_ENV, "bash")
+    words = split_line(environ.get("COMP_LINE", ""))[1:] or [""]
+
+    for name, description in candidates(prog, words):
+        if shell == "bash":
+            # bash splits words at "=", so only the part after it is replaced
+            if "=" in words[-1]:
+                name = name.split("=", 1)[1]
+            stream.write(f"{name}\n")
+        elif shell == "zsh":
+            name = name.replace(":", "\\:")
+            stream.write(f"{name}:{description}\n" if description else f"{name}\n")
+        else:
+            stream.write(f"{name}\t{description}\n" if description else f"{name}\n")
+    return 0
+
+def completion_script(shell, programs):
+    """
+    Return the completion script for a shell.
+
+    Args:
+        shell (str): One of SHELLS
+        programs (list): Script names to register completion for
+
+    Returns:
+        str: Shell source to ``eval`` or save in the shell's completion directory
+    """
+    names = " ".join(programs)
+    if shell == "bash":
+        return f"""_starshipagentic_complete() {{
+    local IFS=$'\\n'
+    COMPREPLY=( $(env {COMPLETE_ENV}=bash COMP_LINE="${{COMP_LINE:0:$COMP_POINT}}" "${{COMP_WORDS[0]}}" 2>/dev/null) )
+}}
+complete -o default -F _starshipagentic_complete {names}
+"""
+    if shell == "zsh":
+        return f"""#compdef {names}
+_starshipagentic_complete() {{
+    local -a candidates
+    candidates=("${{(@f)$(env {COMPLETE_ENV}=zsh COMP_LINE="${{(j: :)words[1,CURRENT]}}" "${{words[1]}}" 2>/dev/null)}}")
+    _describe 'starshipagentic' candidates
+}}
+compdef _starshipagentic_complete {names}
+"""
+    if shell == "fish":
+        return f"""function __starshipagentic_complete
+    env {COMPLETE_ENV}=fish COMP_LINE=(commandline -cp) (commandline -opc)[1] 2>/dev/null
+end
+for prog in {names}
+    complete -c $prog -f -a '(__starshipagentic_complete)'
+end
+"""
+    raise ValueError(f"unsupported shell: {shell}")
+
+def script_names():
+    """Return the installed console scripts that dispatch through the shim."""
+    from importlib.metadata import entry_points
+
+    try:
+        scripts = entry_points(group="console_scripts")
+    except TypeError:
+        # Python < 3.10: entry_points() takes no arguments and returns a dict by group
+        scripts = entry_points().get("console_scripts", [])
+    names = {MAIN_PROG}
+    for entry in scripts:
+        if entry.value.startswith("starshipagentic.shim:"):
+            names.add(entry.name)
+    return sorted(names)
@@ -0,0 +1,131 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Pre-rendered help screens.
+
+Help is rendered once per terminal profile (width and colour support) and
+stored under ``<cache>/help``. Entries are keyed by the help scope, the
+terminal profile and the stamps (mtime and size) of the command manifest,
+the commands list and the module that defines the command, so editing any
+of them renders afresh. Plain group help (``--plain``, piped output) is
+cached under its own scope, so a rich render is never replayed in plain
+mode. A hit is written straight to stdout without importing rich or the
+command module.
+
+Set ``STARSHIPAGENTIC_NO_HELP_CACHE=1`` to always render.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from starshipagentic.utils.cache import cache_key, file_stamp, read_entry, write_entry
+
+HELP_CACHE_VERSION = 1
+NO_HELP_CACHE_ENV = "STARSHIPAGENTIC_NO_HELP_CACHE"
+NAMESPACE = "help"
+
+PACKAGE_DIR = Path(__file__).parent.parent
+CATALOG_FILES = (PACKAGE_DIR / "commands-manifest.json", PACKAGE_DIR / "commands-list.yml")
+
+def enabled():
+    """Return whether the help cache is in use."""
+    return os.environ.get(NO_HELP_CACHE_ENV, "").lower() not in ("1", "true", "yes")
+
+def terminal_profile(stream=None):
+    """
+    Describe the terminal help is written to.
+
+    Args:
+        stream (file, optional): Output stream (default: sys.stdout)
+
+    Returns:
+        tuple: ``(width, color)`` where color is None, "standard", "256" or "truecolor"
+    """
+    stream = stream or sys.stdout
+    try:
+        width = int(os.environ["COLUMNS"])
+    except (KeyError, ValueError):
+        width = shutil.get_terminal_size().columns
+
+    try:
+        is_tty = stream.isatty()
+    except (AttributeError, ValueError):
+        is_tty = False
+    term = os.environ.get("TERM", "").lower()
+    if os.environ.get("NO_COLOR") or term in ("dumb", "unknown"):
+        return width, None
+    if not is_tty and not os.environ.get("FORCE_COLOR"):
+        return width, None
+    if os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return width, "truecolor"
+    if "256" in term:
+        return width, "256"
+    return width, "standard"
+
+def module_source(import_path):
+    """Return the file defining ``package.module:attribute`` without importing it."""
+    module_name = import_path.split(":", 1)[0]
+    return PACKAGE_DIR.parent.joinpath(*module_name.split(".")).with_suffix(".py")
+
+def _key(scope, profile, source):
+    stamps = [file_stamp(path) for path in CATALOG_FILES + (source,)]
+    return cache_key(HELP_CACHE_VERSION, scope, profile, stamps)
+
+def lookup(scope, profile, source):
+    """Return the cached help for ``scope``, or None."""
+    if not enabled():
+        return None
+    return read_entry(NAMESPACE, _key(scope, profile, source))
+
+def cached(scope, profile, source, render):
+    """
+    Return help for ``scope``, rendering and storing it on a miss.
+
+    Args:
+        scope (str): What the help is for, e.g. "group:fleet_commander"
+        profile (tuple): ``(width, color)`` from terminal_profile()
+        source (str): File whose changes invalidate the entry
+        render (callable): Called as ``render()`` to produce the help text
+
+    Returns:
+        str: The help text
+    """
+    if not enabled():
+        return render()
+    key = _key(scope, profile, source)
+    text = read_entry(NAMESPACE, key)
+    if text is None:
+        text = render()
+        write_entry(NAMESPACE, key, text)
+    return text
+
+def click_help_width(ctx):
+    """Return the width click formats ``ctx``'s help at (it caps it at 80 columns)."""
+    if ctx.terminal_width is not None:
+        return ctx.terminal_width
+    width, _color = terminal_profile()
+    return max(min(width, ctx.max_content_width or 80) - 2, 50)
+
+def cached_click_help(ctx, get_help, source, kind="command"):
+    """Return ``get_help(ctx)`` through the cache, keyed by ``kind`` and the command path."""
+    return cached(f"{kind}:{ctx.command_path}", (click_help_width(ctx), None), source,
+                  lambda: get_help(ctx))
+
+def instrument_command(cmd, source):
+    """Serve a command's ``--help`` text through the cache."""
+    get_help = cmd.get_help
+    cmd.get_help = lambda ctx: cached_click_help(ctx, get_help, source)
+    return cmd
+
+def wants_help(args, help_names=("--help",)):
+    """Return whether ``args`` ask a command for help (ignoring anything after ``--``)."""
+    if "--" in args:
+        args = args[:args.index("--")]
+    return any(arg in help_names for arg in args)
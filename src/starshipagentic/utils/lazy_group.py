@@ -0,0 +1,151 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Lazily-resolved click groups for Starship Agentic."""
+
+import importlib
+import sys
+import threading
+
+import click
+
+from starshipagentic.utils import help_cache, profiling
+
+
+class LazyGroup(click.Group):
+    """A click group whose subcommands are imported only when dispatched.
+
+    Subcommands are registered as ``"package.module:attribute"`` import paths
+    and resolved on first lookup, so running one command never pays for
+    importing the rest of the command catalog.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, on_load=None, resolver=None, suggester=None, **kwargs):
+        """
+        Create a lazily-resolved group.
+
+        Args:
+            lazy_subcommands (dict, optional): Mapping of command name to import path
+            on_load (callable, optional): Called as ``on_load(name, command)`` when a
+                lazy subcommand is first resolved; its return value is registered
+            resolver (callable, optional): Maps a command-line token to a path of
+                subcommand names (e.g. an alias to ``(group, command)``), or None
+            suggester (callable, optional): Maps a token that resolved to nothing
+                to a list of names to suggest in the error message
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+        self.on_load = on_load
+        self.resolver = resolver
+        self.suggester = suggester
+        self._lazy_lock = threading.RLock()
+
+    def add_lazy_command(self, name, import_path):
+        """Register a subcommand by import path without importing it."""
+        self.lazy_subcommands[name] = import_path
+
+    def list_commands(self, ctx):
+        """Return eager and lazy subcommand names without importing anything."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        """Return a subcommand, importing it first if it is still lazy."""
+        if cmd_name in self.lazy_subcommands:
+            # Sequences may dispatch from several threads at once
+            with self._lazy_lock:
+                return self._load_lazy_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def parse_args(self, ctx, args):
+        """Parse this group's own options (timed as the ``parse`` phase)."""
+        with profiling.phase("parse"):
+            return super().parse_args(ctx, args)
+
+    def invoke(self, ctx):
+        """Dispatch to the subcommand (timed as the ``dispatch`` phase)."""
+        with profiling.phase("dispatch"):
+            return super().invoke(ctx)
+
+    def get_help(self, ctx):
+        """Return this group's help text, from the help cache when possible."""
+        module = sys.modules.get(getattr(self.callback, "__module__", None))
+        return help_cache.cached_click_help(ctx, super().get_help, getattr(module, "__file__", None),
+                                            kind="group")
+
+    def resolve_command(self, ctx, args):
+        """Resolve the subcommand token through the resolver, then click's own lookup."""
+        path = None
+        if self.resolver is not None and args:
+            try:
+                path = self.resolver(args[0])
+            except ValueError as e:
+                ctx.fail(str(e))
+        if not path and args:
+            path = (args[0],)
+        if path:
+            owner = self
+            for name in path[:-1]:
+                owner = owner.get_command(ctx, name) if isinstance(owner, click.Group) else None
+            if isinstance(owner, LazyGroup):
+                owner.serve_cached_help(ctx, path[-1], args[1:])
+            cmd = owner.get_command(ctx, path[-1]) if isinstance(owner, click.Group) else None
+            if cmd is not None:
+                return path[-1], cmd, args[1:]
+        if args and self.suggester is not None and not args[0].startswith("-") and not ctx.resilient_parsing:
+            if super().get_command(ctx, args[0]) is None:
+                self._fail_with_suggestions(ctx, args[0])
+        return super().resolve_command(ctx, args)
+
+    def _fail_with_suggestions(self, ctx, token):
+        """Fail like click does for an unknown command, adding did-you-mean suggestions."""
+        suggestions = self.suggester(token)
+        if not suggestions:
+            return
+        if len(suggestions) == 1:
+            hint = f"Did you mean '{suggestions[0]}'?"
+        else:
+            hint = "Did you mean one of: " + ", ".join(f"'{name}'" for name in suggestions) + "?"
+        ctx.fail(f"No such command '{token}'. {hint}")
+
+    def serve_cached_help(self, ctx, cmd_name, args):
+        """Print a still-lazy subcommand's cached ``--help`` and exit, without importing it."""
+        import_path = self.lazy_subcommands.get(cmd_name)
+        if import_path is None or not help_cache.wants_help(args, ctx.help_option_names):
+            return
+        scope = f"command:{ctx.command_path} {cmd_name}"
+        profile = (help_cache.click_help_width(ctx), None)
+        text = help_cache.lookup(scope, profile, help_cache.module_source(import_path))
+        if text is not None:
+            with profiling.phase("output"):
+                click.echo(text, color=ctx.color)
+            ctx.exit()
+
+    def _load_lazy_command(self, cmd_name):
+        """Import a lazy subcommand and register it as a regular one."""
+        import_path = self.lazy_subcommands.get(cmd_name)
+        if import_path is None:
+            # Another caller resolved it in the meantime
+            return self.commands.get(cmd_name)
+
+        module_name, attr_name = import_path.split(":", 1)
+        with profiling.phase("import"):
+            module = importlib.import_module(module_name)
+        cmd = getattr(module, attr_name, None)
+        if not isinstance(cmd, click.Command):
+            return None
+        if not isinstance(cmd, click.Group):
+            profiling.instrument_command(cmd)
+            help_cache.instrument_command(cmd, help_cache.module_source(import_path))
+
+        if self.on_load is not None:
+            cmd = self.on_load(cmd_name, cmd)
+        self.add_command(cmd, cmd_name)
+        # Only drop the lazy entry once the command is registered, so a
+        # concurrent lookup never sees the name in neither table
+        del self.lazy_subcommands[cmd_name]
+        return cmd
@@ -0,0 +1,123 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Logging configuration for Starship Agentic.
+
+Modules log through ``logging.getLogger(__name__)`` with %-style arguments,
+so a disabled level costs one integer comparison and nothing is formatted.
+The level comes from ``--log-level`` or ``STARSHIPAGENTIC_LOG_LEVEL``
+(default WARNING). Records go to stderr as plain text, and can additionally
+be written as JSON lines to ``--log-file`` / ``STARSHIPAGENTIC_LOG_FILE``
+(``-`` sends the JSON lines to stderr instead of plain text).
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+
+LOGGER_NAME = "starshipagentic"
+LOG_LEVEL_ENV = "STARSHIPAGENTIC_LOG_LEVEL"
+LOG_FILE_ENV = "STARSHIPAGENTIC_LOG_FILE"
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+DEFAULT_LOG_LEVEL = "WARNING"
+
+# Attributes every LogRecord has; anything else came in through ``extra=``
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_state = {"level": None, "log_file": None}
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including ``extra=`` fields."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class StderrHandler(logging.StreamHandler):
+    """Handler that writes to whatever sys.stderr is when a record is emitted.
+
+    Test runners and the daemon's forwarded stdio replace sys.stderr after
+    logging is configured; a plain StreamHandler would keep the old stream.
+    """
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def configure_logging(level=None, log_file=None):
+    """
+    Configure the ``starshipagentic`` logger.
+
+    Arguments left as None keep the current setting, or fall back to the
+    environment (and then the defaults) the first time.
+
+    Args:
+        level (str, optional): One of LOG_LEVELS (case-insensitive)
+        log_file (str, optional): Path for the JSON-lines sink, or ``-`` for stderr
+
+    Returns:
+        logging.Logger: The configured package logger
+
+    Raises:
+        ValueError: If the level is unknown
+        OSError: If the log file cannot be opened for writing
+    """
+    if level is None:
+        level = _state["level"] or os.environ.get(LOG_LEVEL_ENV) or DEFAULT_LOG_LEVEL
+    if log_file is None:
+        log_file = _state["log_file"] or os.environ.get(LOG_FILE_ENV) or None
+    level = level.upper()
+    if level not in LOG_LEVELS:
+        raise ValueError(f"unknown log level: {level}")
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.propagate = False
+    if (level, log_file) == (_state["level"], _state["log_file"]) and logger.handlers:
+        return logger
+
+    file_handler = None
+    if log_file and log_file != "-":
+        # Open now, so an unwritable path raises OSError here (a usage error
+        # for --log-file) rather than from the first record logged
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(JsonLinesFormatter())
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    handler = StderrHandler()
+    if log_file == "-":
+        handler.setFormatter(JsonLinesFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    logger.addHandler(handler)
+    if file_handler is not None:
+        logger.addHandler(file_handler)
+
+    _state.update(level=level, log_file=log_file)
+    return logger
@@ -0,0 +1,103 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Console output that only imports rich when styled output is needed.
+
+Modules print through the shared ``console`` with rich markup as before::
+
+    from starshipagentic.utils.output import console
+    console.print("[bold red]Initiating supernova sequence...[/bold red]")
+
+When stdout is not a terminal, or ``--plain`` / ``STARSHIPAGENTIC_PLAIN=1``
+is set, strings are written by a plain writer that strips the markup, and
+rich is never imported. Otherwise (and for rich renderables such as panels
+and tables) a rich Console is created on first use.
+"""
+
+import os
+import re
+import sys
+
+PLAIN_ENV = "STARSHIPAGENTIC_PLAIN"
+
+# Same tag syntax as rich.markup; an odd number of backslashes escapes the tag
+_TAG = re.compile(r"(\\*)\[([a-z#/@][^[]*?)]")
+
+_state = {"plain": None}
+
+def set_plain(plain=True):
+    """Force plain (True) or terminal-dependent (None) output for this process."""
+    _state["plain"] = plain
+
+def is_plain(stream=None):
+    """Return whether output to ``stream`` (default: stdout) should be plain."""
+    if _state["plain"] is not None:
+        return _state["plain"]
+    if os.environ.get(PLAIN_ENV, "").lower() in ("1", "true", "yes"):
+        return True
+    if os.environ.get("FORCE_COLOR"):
+        return False
+    stream = stream or sys.stdout
+    try:
+        return not stream.isatty()
+    except (AttributeError, ValueError):
+        return True
+
+def strip_markup(text):
+    """Remove rich markup tags from ``text``, keeping escaped brackets literally."""
+    def replace(match):
+        backslashes, tag = match.groups()
+        if len(backslashes) % 2:
+            return backslashes[:-1] + f"[{tag}]"
+        return backslashes
+    return _TAG.sub(replace, text)
+
+class PlainWriter:
+    """Writes strings to the current stdout (or stderr) with markup stripped."""
+
+    def __init__(self, stderr=False):
+        self.stderr = stderr
+
+    @property
+    def file(self):
+        return sys.stderr if self.stderr else sys.stdout
+
+    def print(self, *objects, sep=" ", end="\n", markup=True, **_style):
+        """Print like ``rich.console.Console.print``, without styling."""
+        text = sep.join(str(obj) for obj in objects)
+        if markup:
+            text = strip_markup(text)
+        self.file.write(text + end)
+
+class LazyConsole:
+    """Stand-in for ``rich.console.Console`` that picks the plain writer when it can."""
+
+    def __init__(self, stderr=False):
+        self.stderr = stderr
+        self._plain = PlainWriter(stderr=stderr)
+        self._rich = None
+
+    @property
+    def rich(self):
+        """The rich Console, created (and rich imported) on first use."""
+        if self._rich is None:
+            from rich.console import Console
+            self._rich = Console(stderr=self.stderr)
+        return self._rich
+
+    def print(self, *objects, **kwargs):
+        """Print strings plainly when output is plain; anything else goes through rich."""
+        if is_plain(self._plain.file) and all(isinstance(obj, str) for obj in objects):
+            self._plain.print(*objects, **kwargs)
+        else:
+            self.rich.print(*objects, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.rich, name)
+
+console = LazyConsole()
@@ -0,0 +1,213 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Per-phase timing for ``starshipagentic --profile``.
+
+Phases are always recorded (a pair of perf_counter calls each) so that
+``--profile``, which is only parsed after the CLI has been imported, can
+still report import and registration time. Time is exclusive: entering a
+nested phase pauses the enclosing one, so the phases add up to the total.
+
+Phases:
+    import    importing the CLI and, later, lazily loaded groups and commands
+    register  registering the command groups (register_dynamic_groups)
+    registry  loading the command manifest and alias indexes
+    parse     click argument parsing
+    dispatch  resolving subcommands and running group callbacks
+    command   the command body
+    output    writing to stdout/stderr and rendering help
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+PHASES = ("import", "register", "registry", "parse", "dispatch", "command", "output")
+
+class PhaseTimer:
+    """Exclusive wall-clock accounting over a stack of active phases."""
+
+    def __init__(self):
+        self.profiler = None
+        self.reset()
+
+    def reset(self):
+        """Start accounting afresh from now."""
+        self.started = time.perf_counter()
+        self.totals = {}
+        self._stack = []
+
+    def begin(self, name):
+        """Enter a phase, pausing the current one."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        now = time.perf_counter()
+        if self._stack:
+            parent = self._stack[-1]
+            self.totals[parent[0]] = self.totals.get(parent[0], 0.0) + now - parent[1]
+        self._stack.append([name, now])
+        if name == "command" and self.profiler is not None:
+            self.profiler.enable()
+
+    def end(self, name):
+        """Leave a phase (and every phase opened inside it), resuming the enclosing one."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        if name not in (entry[0] for entry in self._stack):
+            return
+        now = time.perf_counter()
+        while self._stack:
+            entry, started = self._stack.pop()
+            self.totals[entry] = self.totals.get(entry, 0.0) + now - started
+            if entry == "command" and self.profiler is not None:
+                self.profiler.disable()
+            if entry == name:
+                break
+        if self._stack:
+            self._stack[-1][1] = now
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as ``name``."""
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def timed(self, name, func):
+        """Wrap a callable so each call is timed as ``name``."""
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def breakdown(self):
+        """Return ``(total seconds, [(phase, seconds), ...])`` including unattributed time."""
+        total = time.perf_counter() - self.started
+        rows = [(name, self.totals[name]) for name in PHASES if name in self.totals]
+        rows.extend((name, value) for name, value in self.totals.items() if name not in PHASES)
+        rows.append(("other", max(0.0, total - sum(value for _, value in rows))))
+        return total, rows
+
+timer = PhaseTimer()
+begin = timer.begin
+end = timer.end
+phase = timer.phase
+
+def instrument_command(cmd):
+    """Time a leaf command's argument parsing and body."""
+    cmd.parse_args = timer.timed("parse", cmd.parse_args)
+    cmd.invoke = timer.timed("command", cmd.invoke)
+    return cmd
+
+class _TimedStream:
+    """Stream proxy that books the time spent writing as the ``output`` phase."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        with timer.phase("output"):
+            return self._stream.write(text)
+
+    def flush(self):
+        with timer.phase("output"):
+            return self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def collapsed_stacks(stats):
+    """
+    Convert cProfile statistics into flamegraph collapsed-stack lines.
+
+    cProfile keeps caller -> callee edges rather than full stacks, so each
+    callee's time is split across its callers in proportion to the time
+    recorded on each edge (the same approximation flameprof uses).
+
+    Args:
+        stats (pstats.Stats): Profile of the command body
+
+    Returns:
+        list: ``"frame;frame;frame microseconds"`` lines
+    """
+    entries = stats.stats
+    callees = {}
+    for func, (_cc, _nc, _tt, _ct, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+
+    def label(func):
+        filename, line, name = func
+        if filename == "~":
+            return name
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    weights = {}
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    stack = [((func,), 1.0) for func in roots]
+    while stack:
+        path, fraction = stack.pop()
+        func = path[-1]
+        _cc, _nc, tt, ct, _callers = entries[func]
+        key = ";".join(label(f) for f in path)
+        weights[key] = weights.get(key, 0.0) + tt * fraction
+        for callee, edge_ct in callees.get(func, []):
+            callee_ct = entries[callee][3]
+            if callee in path or not callee_ct:
+                continue
+            stack.append((path + (callee,), fraction * min(1.0, edge_ct / callee_ct)))
+
+    return [f"{key} {round(weight * 1e6)}" for key, weight in sorted(weights.items()) if weight * 1e6 >= 1]
+
+def enable():
+    """Turn on reporting for this invocation: also time writes to stdout/stderr."""
+    sys.stdout = _TimedStream(sys.stdout)
+    sys.stderr = _TimedStream(sys.stderr)
+
+def collect_stats():
+    """Run the command body under cProfile."""
+    import cProfile
+
+    timer.profiler = cProfile.Profile()
+
+def report(path=None, stream=None):
+    """Write the phase breakdown (and profile files) once the invocation has finished."""
+    for name in ("stdout", "stderr"):
+        current = getattr(sys, name)
+        if isinstance(current, _TimedStream):
+            setattr(sys, name, current._stream)
+    stream = stream or sys.stderr
+
+    total, rows = timer.breakdown()
+    lines = ["", "Phase         ms       %"]
+    for name, seconds in rows:
+        share = 100.0 * seconds / total if total else 0.0
+        lines.append(f"{name:<10}{seconds * 1000:>8.2f}  {share:>6.1f}")
+    lines.append(f"{'total':<10}{total * 1000:>8.2f}  {100.0:>6.1f}")
+
+    profiler, timer.profiler = timer.profiler, None
+    if path and profiler is not None:
+        import pstats
+
+        profiler.create_stats()
+        if profiler.stats:
+            profiler.dump_stats(path)
+            with open(f"{path}.collapsed", "w", encoding="utf-8") as f:
+                f.writelines(line + "\n" for line in collapsed_stacks(pstats.Stats(profiler)))
+            lines.append(f"Profile written to {path} (collapsed stacks: {path}.collapsed)")
+        else:
+            lines.append("No command body ran; no profile written")
+
+    stream.write("\n".join(lines) + "\n")
+    stream.flush()
@@ -0,0 +1,439 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Batch execution of command sequences from starshipagentic.yml.
+
+A sequence is a ``commands:`` list whose entries are either strings
+(``"fleet_commander tour-ship"``) or mappings of group -> command -> options::
+
+    - fleet_commander:
+        commission-ship:
+          template: "modern-django"
+          name: "modern-starship"
+
+Mappings may also carry ``id:`` and ``needs:`` keys (and use ``run:`` for a
+string command) to describe dependencies between steps::
+
+    - id: scan
+      needs: []
+      run: "communications_officer scan-sector"
+    - id: report
+      needs: []
+      maintenance_officer: complexity-report
+    - needs: [scan, report]
+      run: "tactical_officer fire-photons"
+
+A step without ``needs:`` runs after the step before it, so plain sequences
+keep running strictly in order; ``needs: []`` lets a step start right away.
+Steps listed in ``needs:`` must succeed, otherwise the dependent is skipped.
+
+Every step runs inside the current process against the already-registered
+click tree, so a sequence costs one interpreter start-up in total. With more
+than one job, ready steps run concurrently on a thread pool; their output is
+captured per step and replayed in sequence order.
+"""
+
+import json
+import shlex
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+
+import click
+
+from starshipagentic.utils import interactive
+from starshipagentic.utils.output import console
+
+SEQUENCE_FILE_NAME = "starshipagentic.yml"
+STEP_KEYS = ("id", "needs", "run")
+DEFAULT_SEQUENCE_PATH = Path(__file__).parent.parent / SEQUENCE_FILE_NAME
+
+def find_sequence_file(path=None):
+    """Return the sequence file to run: an explicit path, ./starshipagentic.yml, or the packaged default."""
+    if path:
+        return Path(path)
+    local = Path.cwd() / SEQUENCE_FILE_NAME
+    if local.exists():
+        return local
+    return DEFAULT_SEQUENCE_PATH
+
+def load_sequence(path=None):
+    """
+    Load the ``commands:`` list from a sequence file.
+
+    Args:
+        path (str or Path, optional): Sequence file; see find_sequence_file()
+
+    Returns:
+        list: The raw command entries
+    """
+    import yaml
+
+    with open(find_sequence_file(path), "r") as f:
+        data = yaml.safe_load(f) or {}
+    if isinstance(data, list):
+        return data
+    return data.get("commands") or []
+
+def load_sequence_answers(path=None):
+    """
+    Load the ``answers:`` mapping (parameter name -> value) from a sequence file.
+
+    Args:
+        path (str or Path, optional): Sequence file; see find_sequence_file()
+
+    Returns:
+        dict: Answers for parameters the steps would otherwise prompt for
+    """
+    import yaml
+
+    with open(find_sequence_file(path), "r") as f:
+        data = yaml.safe_load(f) or {}
+    answers = data.get("answers") if isinstance(data, dict) else None
+    if answers is not None and not isinstance(answers, dict):
+        raise ValueError("answers must be a mapping of parameter name to value")
+    return answers or {}
+
+def _option_args(options):
+    """Turn a mapping of option name -> value into command-line arguments."""
+    if options is None:
+        return []
+    if isinstance(options, str):
+        return shlex.split(options)
+    if isinstance(options, list):
+        return [str(value) for value in options]
+
+    args = []
+    for name, value in options.items():
+        flag = name if name.startswith("-") else f"--{name}"
+        if value is True:
+            args.append(flag)
+        elif value is False or value is None:
+            continue
+        elif isinstance(value, list):
+            args.extend(f"{flag}={item}" for item in value)
+        else:
+            args.append(f"{flag}={value}")
+    return args
+
+def parse_step(entry):
+    """
+    Parse one sequence entry into CLI arguments.
+
+    Args:
+        entry (str or dict): ``"group command --opt=value"`` or
+            ``{group: {command: {opt: value}}}``; ``id``/``needs`` keys are ignored
+
+    Returns:
+        list: Arguments for the main CLI
+
+    Raises:
+        ValueError: If the entry has an unsupported shape
+    """
+    if isinstance(entry, str):
+        args = shlex.split(entry)
+        if not args:
+            raise ValueError("empty command")
+        return args
+
+    if isinstance(entry, dict) and "run" in entry:
+        return parse_step(entry["run"])
+    if isinstance(entry, dict):
+        entry = {key: value for key, value in entry.items() if key not in STEP_KEYS}
+    if isinstance(entry, dict) and len(entry) == 1:
+        group, body = next(iter(entry.items()))
+        if isinstance(body, str):
+            return [group] + shlex.split(body)
+        if isinstance(body, dict) and len(body) == 1:
+            command, options = next(iter(body.items()))
+            return [group, command] + _option_args(options)
+
+    raise ValueError(f"unsupported command entry: {entry!r}")
+
+def run_step(cli, args):
+    """
+    Run one step through the click tree without leaving the process.
+
+    Args:
+        cli (click.Command): Root command to dispatch through
+        args (list): Arguments for the root command
+
+    Returns:
+        tuple: (exit_code, error message or None)
+    """
+    try:
+        rv = cli.main(args=list(args), prog_name="starshipagentic", standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code, e.format_message()
+    except click.Abort:
+        return 1, "aborted"
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        return code, None if code == 0 else f"exited with status {code}"
+    except Exception as e:
+        return 1, f"{type(e).__name__}: {e}"
+
+    # In non-standalone mode click returns the exit code of ctx.exit() calls
+    exit_code = rv if isinstance(rv, int) else 0
+    return exit_code, None if exit_code == 0 else f"exited with status {exit_code}"
+
+
+def plan_sequence(commands):
+    """
+    Turn sequence entries into steps with ids and dependencies.
+
+    Entries that cannot be parsed still become steps; they fail when run.
+
+    Args:
+        commands (list): Entries from a ``commands:`` list
+
+    Returns:
+        list: Step dicts in sequence order
+
+    Raises:
+        ValueError: On duplicate ids, unknown ``needs`` or dependency cycles
+    """
+    steps = []
+    ids = set()
+    for index, entry in enumerate(commands or [], 1):
+        options = entry if isinstance(entry, dict) else {}
+        step_id = str(options.get("id", f"step-{index}"))
+        if step_id in ids:
+            raise ValueError(f"duplicate step id: {step_id}")
+        ids.add(step_id)
+
+        # Without explicit needs a step is only ordered after its predecessor
+        needs = options.get("needs")
+        after = []
+        if needs is None:
+            needs = []
+            after = [steps[-1]["id"]] if steps else []
+        elif isinstance(needs, str):
+            needs = [needs]
+        needs = [str(need) for need in needs]
+
+        step = {"index": index, "id": step_id, "needs": needs, "after": after, "entry": entry, "args": None,
+                "status": "pending", "exit_code": None, "duration": 0.0, "error": None}
+        try:
+            step["args"] = parse_step(entry)
+        except ValueError as e:
+            step["error"] = str(e)
+        steps.append(step)
+
+    for step in steps:
+        for need in step["needs"]:
+            if need not in ids:
+                raise ValueError(f"step {step['id']} needs unknown step: {need}")
+
+    # Kahn's algorithm: anything left unvisited sits on a cycle
+    waiting = {step["id"]: len(_upstream(step)) for step in steps}
+    ready = [step["id"] for step in steps if not waiting[step["id"]]]
+    dependents = _dependents(steps)
+    while ready:
+        for dependent, _required in dependents[ready.pop()]:
+            waiting[dependent["id"]] -= 1
+            if waiting[dependent["id"]] == 0:
+                ready.append(dependent["id"])
+    cyclic = [step_id for step_id, count in waiting.items() if count]
+    if cyclic:
+        raise ValueError(f"dependency cycle between steps: {', '.join(cyclic)}")
+    return steps
+
+def _upstream(step):
+    """Return the ids a step waits for."""
+    return set(step["needs"]) | set(step["after"])
+
+def _dependents(steps):
+    """Map each step id to ``(dependent step, must succeed)`` pairs."""
+    dependents = {step["id"]: [] for step in steps}
+    for step in steps:
+        for upstream in _upstream(step):
+            dependents[upstream].append((step, upstream in step["needs"]))
+    return dependents
+
+class _ThreadRouter:
+    """Stream proxy that diverts writes from capturing threads into their step's buffer."""
+
+    _local = threading.local()
+
+    def __init__(self, stream, name):
+        self._stream = stream
+        self._name = name
+
+    def write(self, text):
+        chunks = getattr(self._local, "chunks", None)
+        if chunks is None or not isinstance(text, str):
+            return self._stream.write(text)
+        chunks.append((self._name, text))
+        return len(text)
+
+    def flush(self):
+        if getattr(self._local, "chunks", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+@contextmanager
+def _routed_output():
+    """Install stdout/stderr proxies for the duration of a parallel run."""
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    sys.stdout = _ThreadRouter(streams["stdout"], "stdout")
+    sys.stderr = _ThreadRouter(streams["stderr"], "stderr")
+    try:
+        yield streams
+    finally:
+        sys.stdout, sys.stderr = streams["stdout"], streams["stderr"]
+
+def _perform(cli, step, total, capture):
+    """Run one step (in a worker thread when capturing); return (exit_code, error, duration, output)."""
+    chunks = [] if capture else None
+    _ThreadRouter._local.chunks = chunks
+    try:
+        label = f"[{step['index']}/{total}]"
+        if step["args"] is None:
+            console.print(f"[bold red]✗ {label} {step['error']}[/bold red]")
+            return 2, step["error"], 0.0, chunks
+
+        console.print(f"[bold cyan]▶ {label} starshipagentic {shlex.join(step['args'])}[/bold cyan]")
+        started = time.perf_counter()
+        exit_code, error = run_step(cli, step["args"])
+        duration = round(time.perf_counter() - started, 6)
+        if exit_code == 0:
+            console.print(f"[green]✓ {label} done in {duration:.3f}s[/green]")
+        else:
+            console.print(f"[bold red]✗ {label} {error}[/bold red]")
+        return exit_code, error, duration, chunks
+    finally:
+        _ThreadRouter._local.chunks = None
+
+def run_command_sequence(commands, cli=None, stop_on_failure=True, report_path=None, jobs=1, answers=None):
+    """
+    Run sequence entries, honouring their ``needs`` dependencies.
+
+    A failed step skips everything that depends on it. In stop mode no new
+    steps start after the first failure; steps already running finish.
+
+    Args:
+        commands (list): Entries from a ``commands:`` list
+        cli (click.Command, optional): Root command; defaults to starshipagentic.cli.main
+        stop_on_failure (bool): Stop starting steps after the first failure
+        report_path (str or Path, optional): Write the run report there as JSON
+        jobs (int): Maximum number of steps to run at once
+        answers (dict, optional): Values for parameters steps would prompt for.
+            Parallel runs (jobs > 1) never prompt.
+
+    Returns:
+        dict: Run report with per-step status, exit code and duration
+
+    Raises:
+        ValueError: If the dependency graph is invalid
+    """
+    if cli is None:
+        from starshipagentic.cli import main as cli
+
+    steps = plan_sequence(commands)
+    total = len(steps)
+    jobs = max(1, int(jobs or 1))
+    capture = jobs > 1
+    started = time.perf_counter()
+
+    dependents = _dependents(steps)
+    waiting = {step["id"]: len(_upstream(step)) for step in steps}
+    ready = deque(step for step in steps if not waiting[step["id"]])
+    finished = set()
+    replayed = 0
+    failed = False
+
+    def settle(step):
+        """Release or skip the steps that were waiting on a finished step."""
+        pending = [step]
+        while pending:
+            done = pending.pop()
+            finished.add(done["index"])
+            for dependent, required in dependents[done["id"]]:
+                if dependent["status"] != "pending":
+                    continue
+                if required and done["status"] != "ok":
+                    dependent["status"] = "skipped"
+                    pending.append(dependent)
+                    continue
+                waiting[dependent["id"]] -= 1
+                if waiting[dependent["id"]] == 0:
+                    ready.append(dependent)
+
+    def replay(streams):
+        """Write captured output for every finished step not yet shown, in sequence order."""
+        nonlocal replayed
+        while replayed < total and steps[replayed]["index"] in finished:
+            for name, text in steps[replayed].pop("output", None) or []:
+                streams[name].write(text)
+            replayed += 1
+        for stream in streams.values():
+            stream.flush()
+
+    pool = ThreadPoolExecutor(max_workers=jobs) if capture else None
+    try:
+        with _routed_output() as streams, interactive.answers(answers, strict=True if capture else None):
+            running = {}
+            while ready or running:
+                while ready and len(running) < jobs and not (failed and stop_on_failure):
+                    step = ready.popleft()
+                    step["status"] = "running"
+                    if pool is None:
+                        future = Future()
+                        future.set_result(_perform(cli, step, total, capture))
+                    else:
+                        future = pool.submit(_perform, cli, step, total, capture)
+                    running[future] = step
+                if failed and stop_on_failure:
+                    ready.clear()
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: running[f]["index"]):
+                    step = running.pop(future)
+                    exit_code, error, duration, output = future.result()
+                    step.update(status="ok" if exit_code == 0 else "failed", exit_code=exit_code,
+                                error=error, duration=duration, output=output)
+                    failed = failed or exit_code != 0
+                    settle(step)
+                replay(streams)
+
+            for step in steps:
+                if step["status"] == "pending":
+                    step["status"] = "skipped"
+                    finished.add(step["index"])
+            replay(streams)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    counts = {status: sum(1 for s in steps if s["status"] == status) for status in ("ok", "failed", "skipped")}
+    report = {
+        "ok": not failed,
+        "mode": "stop" if stop_on_failure else "continue",
+        "jobs": jobs,
+        "duration": round(time.perf_counter() - started, 6),
+        "counts": counts,
+        "steps": steps,
+    }
+    console.print(f"[bold]Sequence finished:[/bold] {counts['ok']} ok, {counts['failed']} failed, "
+                  f"{counts['skipped']} skipped in {report['duration']:.3f}s")
+
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+            f.write("\n")
+    return report
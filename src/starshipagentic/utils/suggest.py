@@ -0,0 +1,164 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Trigram indexes for did-you-mean suggestions and ``starshipagentic find``."""
+
+
+def trigrams(text):
+    """Return the set of trigrams of a word, padded so short words and word edges count."""
+    text = f"  {text.lower()} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def edit_distance(a, b, limit=None):
+    """
+    Return the Damerau-Levenshtein (optimal string alignment) distance.
+
+    Args:
+        a (str): First string
+        b (str): Second string
+        limit (int, optional): Stop early and return ``limit + 1`` once exceeded
+
+    Returns:
+        int: Number of insertions, deletions, substitutions and transpositions
+    """
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class TrigramIndex:
+    """Map names to targets and rank the names most similar to a mistyped token.
+
+    Candidates are the names sharing at least one trigram with the token
+    (found through the postings lists); only those are compared by edit
+    distance, so a query never scans the whole vocabulary.
+    """
+
+    def __init__(self):
+        self._names = []
+        self._targets = []
+        self._grams = []
+        self._postings = {}
+
+    def add(self, name, target=None):
+        """Register a name and the target it stands for."""
+        name_id = len(self._names)
+        grams = trigrams(name)
+        self._names.append(name)
+        self._targets.append(name if target is None else target)
+        self._grams.append(grams)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(name_id)
+
+    def search(self, token, limit=3, min_score=0.3):
+        """
+        Rank registered names by similarity to a token.
+
+        The score is trigram overlap (Dice coefficient) blended with
+        normalised edit distance, so both transpositions and dropped
+        letters rank well.
+
+        Args:
+            token (str): Mistyped or partial name
+            limit (int): Maximum number of results
+            min_score (float): Drop results scoring below this (0..1)
+
+        Returns:
+            list: ``(name, target, score)`` tuples, best first, one per target
+        """
+        grams = trigrams(token)
+        shared = {}
+        for gram in grams:
+            for name_id in self._postings.get(gram, ()):
+                shared[name_id] = shared.get(name_id, 0) + 1
+
+        token = token.lower()
+        results = []
+        for name_id, count in shared.items():
+            name = self._names[name_id]
+            dice = 2.0 * count / (len(grams) + len(self._grams[name_id]))
+            longest = max(len(token), len(name))
+            distance = edit_distance(token, name.lower(), limit=longest)
+            score = (dice + max(0.0, 1.0 - distance / longest)) / 2
+            if score >= min_score:
+                results.append((score, name, self._targets[name_id]))
+
+        results.sort(key=lambda result: (-result[0], result[1]))
+        ranked, seen = [], set()
+        for score, name, target in results:
+            key = repr(target)
+            if key not in seen:
+                seen.add(key)
+                ranked.append((name, target, round(score, 3)))
+            if len(ranked) == limit:
+                break
+        return ranked
+
+
+def search_rows(rows, text, limit=10):
+    """
+    Rank catalog rows by how well their names, aliases and description match ``text``.
+
+    Every word of the query is matched against the words of each row through
+    a trigram index over the row vocabulary, so typos still find commands.
+
+    Args:
+        rows (iterable): Rows from catalog.registry_rows() or commands_list_rows()
+        text (str): Search text
+        limit (int): Maximum number of rows returned
+
+    Returns:
+        list: Matching rows, best first
+    """
+    rows = list(rows)
+    vocabulary = TrigramIndex()
+    documents = {}
+    for row_id, row in enumerate(rows):
+        words = [row["group"], row["command"]] + row["aliases"] + row["description"].split()
+        for word in words:
+            for part in _words(word):
+                documents.setdefault(part, set()).add(row_id)
+
+    for word in documents:
+        vocabulary.add(word)
+
+    scores = {}
+    query_words = [part for word in text.split() for part in _words(word)]
+    for query_word in query_words:
+        best = {}
+        for word, _target, score in vocabulary.search(query_word, limit=20, min_score=0.45):
+            for row_id in documents[word]:
+                best[row_id] = max(best.get(row_id, 0.0), score)
+        for row_id, score in best.items():
+            scores[row_id] = scores.get(row_id, 0.0) + score
+
+    phrase = text.lower().strip()
+    for row_id, row in enumerate(rows):
+        if phrase and phrase in row["description"].lower():
+            scores[row_id] = scores.get(row_id, 0.0) + 1.0
+
+    ranked = sorted(scores, key=lambda row_id: (-scores[row_id], row_id))
+    return [rows[row_id] for row_id in ranked[:limit]]
+
+def _words(text):
+    """Split on separators used in names and prose; keep words of two letters or more."""
+    for separator in "-_/(),.:;":
+        text = text.replace(separator, " ")
+    return [word.lower() for word in text.split() if len(word) > 1]
@@ -0,0 +1,89 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the shared alias analysis."""
+
+import os
+
+from starshipagentic.utils import alias_analysis
+from starshipagentic.utils.command_registry import command_registry
+
+COMMANDS = {
+    "fleet_commander": {
+        "commands": {
+            "tour-ship": {"aliases": ["tour", "help"]},
+            "visualize-ship": {"aliases": ["visualize", "tour"]},
+        },
+    },
+    "droids": {"commands": {"droids": {}}},
+}
+
+def make_executable(directory, name, text):
+    """Write an executable file."""
+    path = directory / name
+    path.write_text(text)
+    os.chmod(path, 0o755)
+    return str(path)
+
+def test_analyze():
+    """Test targets and ambiguous and reserved conflicts."""
+    analysis = alias_analysis.analyze(COMMANDS, reserved={"help", "ls"})
+    assert analysis["targets"]["tour-ship"] == ("fleet_commander", "tour-ship")
+    assert analysis["targets"]["fleet_commander"] == ("fleet_commander",)
+    assert "tour" not in analysis["targets"]
+    assert [(c["alias"], c["kind"]) for c in analysis["conflicts"]] == [
+        ("droids", "ambiguous"), ("tour", "ambiguous"), ("help", "reserved")]
+    assert analysis["conflicts"][1]["message"] == (
+        "Alias 'tour' is used in multiple contexts: "
+        "command fleet_commander:tour-ship, command fleet_commander:visualize-ship")
+
+def test_resolved_targets():
+    """Test that every name resolves, groups first and otherwise to the last claim."""
+    scripts = {"ts": "starshipagentic.commands.fleet_commander.tour_ship.cli:tour_ship_command",
+               "tour": "starshipagentic.shim:main"}
+    analysis = alias_analysis.analyze(COMMANDS, scripts)
+    assert analysis["resolved"]["tour"] == ("fleet_commander", "visualize-ship")
+    assert analysis["resolved"]["droids"] == ("droids",)
+    assert analysis["resolved"]["ts"] == ("fleet_commander", "tour-ship")
+    assert analysis["sources"]["ts"] == [("command", "fleet_commander", "tour-ship")]
+
+def test_registry_resolves_like_the_analysis():
+    """Test that the registry's alias index is the analysis' resolution."""
+    analysis = alias_analysis.analyze(command_registry._commands, alias_analysis.load_pyproject_scripts())
+    for name, target in analysis["resolved"].items():
+        if len(target) == 2:
+            assert command_registry.get_command_for_alias(name) == target
+        else:
+            assert command_registry.resolve_command_path(name) == target
+    assert command_registry.alias_conflicts() == analysis["conflicts"]
+
+def test_path_collisions(tmp_path):
+    """Test that only executables this package did not install collide."""
+    make_executable(tmp_path, "visualize", "#!/bin/sh\necho someone else\n")
+    make_executable(tmp_path, "tour-ship", "#!/usr/bin/python\nfrom starshipagentic.shim import main\n")
+    (tmp_path / "visualize-ship").write_text("not executable")
+    executables = alias_analysis.path_executables(str(tmp_path))
+    assert set(executables) == {"visualize", "tour-ship"}
+
+    conflicts = alias_analysis.analyze(COMMANDS, executables=executables)["conflicts"]
+    assert [(c["alias"], c["kind"]) for c in conflicts if c["kind"] == "path"] == [("visualize", "path")]
+
+def test_load_helpers(tmp_path):
+    """Test reading the scripts table and reserved names."""
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project.scripts]\ntour = "starshipagentic.shim:main"\n')
+    (tmp_path / "no-go.txt").write_text("ls\n\ncd\n")
+    assert alias_analysis.load_pyproject_scripts(pyproject) == {"tour": "starshipagentic.shim:main"}
+    assert alias_analysis.load_pyproject_scripts(tmp_path / "missing.toml") == {}
+    assert alias_analysis.load_reserved(tmp_path / "no-go.txt") == {"ls", "cd"}
+
+def test_shipped_catalog_has_no_conflicts():
+    """Test that commands-list.yml has no ambiguous or reserved aliases."""
+    analysis = alias_analysis.analyze(command_registry._commands, alias_analysis.load_pyproject_scripts(),
+                                      alias_analysis.load_reserved())
+    assert analysis["conflicts"] == []
@@ -0,0 +1,35 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the alias entry-point launcher."""
+
+import pytest
+from starshipagentic.utils.alias_launcher import alias_target, launch
+
+def test_alias_target():
+    """Test looking up alias scripts in the manifest."""
+    assert alias_target("warp") == ("captains_orders", "warp-speed",
+                                    "starshipagentic.commands.captains_orders.warp_speed.cli:warp_speed_command")
+    assert alias_target("warp-speed")[:2] == ("captains_orders", "warp-speed")
+    # Group scripts and unknown names go through the main CLI
+    assert alias_target("captains_orders") is None
+    assert alias_target("no-such-alias") is None
+
+def test_launch(capsys):
+    """Test running an alias's command directly."""
+    assert launch("no-such-alias", []) is False
+    with pytest.raises(SystemExit) as exc_info:
+        launch("warp", ["go"])
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out == "Executed warp_speed with input: go\n"
+
+    with pytest.raises(SystemExit):
+        launch("warp", ["--help"])
+    out = capsys.readouterr().out
+    assert out.startswith("This is an alias for: starshipagentic captains_orders warp-speed\n")
+    assert "Usage: warp [OPTIONS] [INPUT]" in out
@@ -68,24 +68,17 @@ def test_get_param_value_with_default(mock_prompt):
         mock_prompt.assert_called_once_with("param", "Prompt text", choices=None, default="default_value")
 
 def test_parse_args_for_command():
-    """Test parsing arguments for a command."""
+    """Test that the wrapper runs the command with the script's arguments."""
     base_cmd = BaseCommand()
     
     # Create a mock Click command
-    mock_command = MagicMock()
-    mock_param1 = MagicMock(spec=click.Argument)
-    mock_param1.name = "arg1"
-    mock_param2 = MagicMock(spec=click.Option)
-    mock_param2.name = "opt1"
-    mock_param2.is_flag = False
-    
-    # Set up the command's parameters
-    mock_command.__click_params__ = [mock_param1, mock_param2]
+    mock_command = MagicMock(spec=click.Command)
+    mock_command.context_settings = {}
     
     # Create the wrapper function
     wrapper = base_cmd.parse_args_for_command(mock_command)
     
-    # Test the wrapper with pytest module present
-    with patch('sys.modules', {'pytest': MagicMock()}):
+    # The wrapper runs the command as a standalone program named after the script
+    with patch('sys.argv', ['/usr/bin/tour', 'x', '--category', 'web']):
         wrapper()
-        mock_command.assert_called_once_with(arg1=None, opt1=None)
+        mock_command.main.assert_called_once_with(args=['x', '--category', 'web'], prog_name='tour')
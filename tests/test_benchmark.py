@@ -0,0 +1,49 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the CLI benchmark suite."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+import benchmark_cli
+
+def results(**cases):
+    """Build a results document with the given warm minimums (in ms) and exit code 0."""
+    return {"cases": {name: {"warm_min": ms / 1000, "exit_code": 0} for name, ms in cases.items()}}
+
+def test_compare_results():
+    """Test the relative threshold and absolute noise floor."""
+    baseline = results(help=100, group=100, alias=10)
+    current = results(help=130, group=120, alias=14, sequence=500)
+    regressions = benchmark_cli.compare_results(current, baseline, threshold=0.25, min_delta_ms=5)
+    # group is within 25%, alias is 40% slower but only by 4 ms, sequence has no baseline
+    assert [name for name, _ in regressions] == ["help"]
+
+def test_compare_results_exit_code():
+    """Test that a changed exit code regresses even when the case got faster."""
+    baseline = results(help=100, group=100)
+    current = results(help=20, group=100)
+    current["cases"]["help"]["exit_code"] = 1
+    regressions = benchmark_cli.compare_results(current, baseline)
+    assert regressions == [("help", "exit code 0 -> 1")]
+
+def test_cases_cover_groups_and_aliases():
+    """Test that every group and shim entry point gets a case."""
+    cases = benchmark_cli.build_cases()
+    assert cases["help"] == ("starshipagentic", ["--help"])
+    assert cases["group:fleet_commander"] == ("starshipagentic", ["fleet_commander", "--help"])
+    assert cases["alias:warp"] == ("warp", ["--help"])
+    assert "sequence" in cases
+
+def test_run_case():
+    """Test running one case through the entry point."""
+    elapsed, exit_code = benchmark_cli.run_case("warp", ["--help"], None)
+    assert exit_code == 0
+    assert elapsed > 0
@@ -0,0 +1,51 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the --all-commands and --commands-list listings."""
+
+import json
+
+from click.testing import CliRunner
+from starshipagentic.cli import main
+from starshipagentic.utils.catalog import FIELDS, write_catalog
+from starshipagentic.utils.command_registry import command_registry
+
+def test_all_commands_json():
+    """Test that the JSON listing covers every command and alias in the registry."""
+    result = CliRunner().invoke(main, ["--all-commands", "--format", "json"])
+    assert result.exit_code == 0
+    rows = {(row["group"], row["command"]): row for row in json.loads(result.output)}
+    for group_name in command_registry.get_all_groups():
+        for cmd_name in command_registry.get_all_commands(group_name):
+            row = rows[(group_name, cmd_name)]
+            assert row["aliases"] == command_registry.get_aliases_for_command(group_name, cmd_name)
+
+def test_commands_list_tsv():
+    """Test the TSV listing of commands-list.yml."""
+    result = CliRunner().invoke(main, ["--commands-list", "--format", "tsv"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].split("\t") == list(FIELDS)
+    assert all(len(line.split("\t")) == len(FIELDS) for line in lines[1:])
+    assert "fleet_commander\tvisualize-ship\tvisualize;ships;fleet\t" in result.output
+
+def test_rows_are_streamed():
+    """Test that each row is written before the next one is generated."""
+    written = []
+
+    def rows():
+        for name in ("one", "two"):
+            yield {"group": "g", "command": name, "aliases": [], "description": "d\tx", "options": []}
+            # The previous row is already out by the time the next is asked for
+            assert any(name in line for line in written)
+
+    assert write_catalog(rows(), "tsv", echo=written.append) == 2
+    assert written[-1] == "g\ttwo\t\td\\tx\t"
+    written.clear()
+    assert write_catalog(rows(), "json", echo=written.append) == 2
+    assert json.loads("\n".join(written))[1]["command"] == "two"
@@ -0,0 +1,82 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the precompiled command manifest."""
+
+import yaml
+from starshipagentic.utils.command_manifest import (
+    COMMANDS_LIST_PATH,
+    MANIFEST_VERSION,
+    build_manifest,
+    hash_file,
+    load_manifest,
+    write_manifest,
+)
+
+COMMANDS = {
+    "fleet_commander": {
+        "description": "Initialize and select project templates",
+        "commands": {
+            "tour-ship": {"description": "Browse templates", "aliases": ["tour"]},
+        },
+    },
+}
+
+SCRIPTS = {
+    "fleet_commander": "starshipagentic.commands.fleet_commander:run_group",
+    "tour-ship": "starshipagentic.commands.fleet_commander.tour_ship.cli:tour_ship_command",
+    "tour": "starshipagentic.commands.fleet_commander.tour_ship.cli:tour_ship_command",
+    "starshipagentic": "starshipagentic.cli:main",
+}
+
+def test_build_manifest():
+    """Test that the manifest captures groups, module paths and aliases."""
+    manifest = build_manifest(COMMANDS, SCRIPTS, source_hash="abc")
+    assert manifest["version"] == MANIFEST_VERSION
+    cmd = manifest["groups"]["fleet_commander"]["commands"]["tour-ship"]
+    assert cmd["module"] == "starshipagentic.commands.fleet_commander.tour_ship.cli"
+    assert cmd["attr"] == "tour_ship_command"
+    assert cmd["aliases"] == ["tour"]
+    assert manifest["aliases"] == {
+        "tour-ship": ["fleet_commander", "tour-ship"],
+        "tour": ["fleet_commander", "tour-ship"],
+    }
+
+def test_load_manifest_rejects_stale_hash(tmp_path):
+    """Test that a manifest built from different YAML is treated as stale."""
+    source = tmp_path / "commands-list.yml"
+    source.write_text(yaml.safe_dump(COMMANDS))
+    manifest_path = tmp_path / "commands-manifest.json"
+
+    write_manifest(build_manifest(COMMANDS, SCRIPTS, hash_file(source)), manifest_path)
+    assert load_manifest(manifest_path, source) is not None
+
+    source.write_text(yaml.safe_dump({}))
+    assert load_manifest(manifest_path, source) is None
+
+def test_write_manifest_only_when_changed(tmp_path):
+    """Test that rewriting an identical manifest leaves the file untouched."""
+    manifest_path = tmp_path / "commands-manifest.json"
+    assert write_manifest(build_manifest(COMMANDS, SCRIPTS, "abc"), manifest_path) is True
+    mtime = manifest_path.stat().st_mtime_ns
+    assert write_manifest(build_manifest(COMMANDS, SCRIPTS, "abc"), manifest_path) is False
+    assert manifest_path.stat().st_mtime_ns == mtime
+    assert write_manifest(build_manifest(COMMANDS, SCRIPTS, "def"), manifest_path) is True
+    assert load_manifest(manifest_path, COMMANDS_LIST_PATH) is None
+
+def test_load_manifest_missing(tmp_path):
+    """Test that a missing manifest falls back cleanly."""
+    assert load_manifest(tmp_path / "missing.json", COMMANDS_LIST_PATH) is None
+
+def test_shipped_manifest_matches_commands_list():
+    """Test that the shipped manifest is in sync with commands-list.yml."""
+    manifest = load_manifest()
+    assert manifest is not None, "Run tools/sync2_aliases.py to regenerate the manifest"
+    with open(COMMANDS_LIST_PATH) as f:
+        commands = yaml.safe_load(f)
+    assert list(manifest["groups"]) == list(commands)
@@ -0,0 +1,152 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the CommandRegistry alias indexes."""
+
+import os
+import threading
+
+import pytest
+import yaml
+from starshipagentic.utils import command_registry as registry_module
+from starshipagentic.utils.command_registry import CommandRegistry, command_registry
+
+COMMANDS = {
+    "maintenance_officer": {
+        "description": "Maintenance",
+        "commands": {
+            "create-checkpoint": {"aliases": ["checkpoint"]},
+            "complexity-report": {"aliases": ["complexity"]},
+        },
+    },
+}
+
+PYPROJECT = """
+[project.scripts]
+create-checkpoint = "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command"
+checkpoint = "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command"
+cp = "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command"
+"""
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """Provide a registry built from YAML data and a temporary pyproject.toml."""
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(PYPROJECT)
+    commands_list = tmp_path / "commands-list.yml"
+    commands_list.write_text(yaml.safe_dump(COMMANDS))
+    monkeypatch.setattr(registry_module, "PYPROJECT_PATH", pyproject)
+    monkeypatch.setattr(registry_module, "COMMANDS_LIST_PATH", commands_list)
+    monkeypatch.setattr(registry_module, "load_manifest", lambda: None)
+
+    registry = CommandRegistry._create()
+    yield registry
+    registry.stop_watching()
+
+def touch(path, text):
+    """Rewrite a file and move its mtime forward so the change is always seen."""
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+def test_alias_lookups_both_directions(registry):
+    """Test alias -> command and command -> aliases lookups."""
+    assert registry.get_command_for_alias("cp") == ("maintenance_officer", "create-checkpoint")
+    assert registry.get_command_for_alias("complexity") == ("maintenance_officer", "complexity-report")
+    assert registry.get_command_for_alias("unknown") is None
+    assert registry.get_aliases_for_command("maintenance_officer", "create-checkpoint") == ["checkpoint", "cp"]
+
+def test_aliases_for_group(registry):
+    """Test the bulk per-group alias lookup."""
+    assert registry.aliases_for_group("maintenance_officer") == {
+        "create-checkpoint": ["checkpoint", "cp"],
+        "complexity-report": ["complexity"],
+    }
+
+def test_alias_index_built_once(registry, monkeypatch):
+    """Test that repeated lookups do not re-parse pyproject.toml."""
+    registry.get_aliases_map()
+    calls = []
+    monkeypatch.setattr(registry, "_load_pyproject_scripts", lambda: calls.append(1) or {})
+    for _ in range(10):
+        registry.get_aliases_for_command("maintenance_officer", "create-checkpoint")
+    assert calls == []
+
+def test_suggest_publishes_new_snapshot(registry):
+    """Test that building a suggestion index never mutates a published snapshot."""
+    before = registry._snapshot()
+    assert registry.suggest("complexty", "maintenance_officer") == ["complexity"]
+    assert before["suggesters"] == {}
+    assert "maintenance_officer" in registry._current["suggesters"]
+    assert registry._current is not before
+
+def test_alias_index_invalidated_on_change(registry):
+    """Test that editing pyproject.toml rebuilds the index."""
+    assert registry.get_command_for_alias("ckpt") is None
+    touch(registry_module.PYPROJECT_PATH,
+          PYPROJECT + 'ckpt = "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command"\n')
+    assert registry.get_command_for_alias("ckpt") == ("maintenance_officer", "create-checkpoint")
+
+def test_reload(registry):
+    """Test that reload() picks up new commands from commands-list.yml."""
+    assert "warp-drive" not in registry.get_all_commands("maintenance_officer")
+    commands = {"maintenance_officer": dict(COMMANDS["maintenance_officer"])}
+    commands["maintenance_officer"]["commands"] = dict(COMMANDS["maintenance_officer"]["commands"],
+                                                       **{"warp-drive": {"aliases": ["wd"]}})
+    touch(registry_module.COMMANDS_LIST_PATH, yaml.safe_dump(commands))
+    assert registry.reload() is True
+    assert "warp-drive" in registry.get_all_commands("maintenance_officer")
+    assert registry.get_command_for_alias("wd") == ("maintenance_officer", "warp-drive")
+    assert registry.reload() is False
+
+def test_watch(registry):
+    """Test that the watcher reloads when pyproject.toml changes."""
+    reloaded = threading.Event()
+    registry.watch(interval=0.01, on_reload=lambda _registry: reloaded.set())
+    touch(registry_module.PYPROJECT_PATH,
+          PYPROJECT + 'ckpt = "starshipagentic.commands.maintenance_officer.create_checkpoint.cli:create_checkpoint_command"\n')
+    assert reloaded.wait(5)
+    assert registry._current["alias_index"]["ckpt"] == ("maintenance_officer", "create-checkpoint")
+
+def test_reload_under_readers(registry):
+    """Test that readers never see a partial index while reloads swap it."""
+    errors = []
+
+    def read():
+        for _ in range(500):
+            try:
+                assert registry.get_command_for_alias("cp") == ("maintenance_officer", "create-checkpoint")
+                assert registry.resolve_command_path("complexity", "maintenance_officer") == (
+                    "maintenance_officer", "complexity-report")
+            except Exception as e:
+                errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for _ in range(20):
+        registry.reload()
+    for reader in readers:
+        reader.join()
+    assert errors == []
+
+def test_singleton_thread_safe(monkeypatch):
+    """Test that concurrent first use constructs a single registry."""
+    monkeypatch.setattr(CommandRegistry, "_instance", None)
+    instances = []
+    threads = [threading.Thread(target=lambda: instances.append(CommandRegistry())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(instance) for instance in instances}) == 1
+
+def test_shipped_aliases():
+    """Test alias lookups against the real catalog."""
+    assert command_registry.get_aliases_for_command("fleet_commander", "visualize-ship") == ["visualize", "ships", "fleet"]
+    assert command_registry.get_command_for_alias("warp") == ("captains_orders", "warp-speed")
@@ -0,0 +1,77 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for single-pass command resolution."""
+
+import pytest
+from click.testing import CliRunner
+from starshipagentic.cli import main
+from starshipagentic.utils.command_trie import AmbiguousCommandError, CommandTrie
+
+@pytest.fixture
+def trie():
+    """Provide a trie with a few names and aliases."""
+    trie = CommandTrie()
+    trie.add("create-checkpoint", "create")
+    trie.add("complexity-report", "complexity")
+    trie.add("restore", "restore")
+    trie.add_alias("cp", "create")
+    return trie
+
+def test_exact_alias_and_prefix(trie):
+    """Test exact names, exact-only aliases and unique prefixes."""
+    assert trie.resolve("restore") == "restore"
+    assert trie.resolve("cp") == "create"
+    assert trie.resolve("cr") == "create"
+    assert trie.resolve("comp") == "complexity"
+    assert trie.resolve("zzz") is None
+    assert trie.resolve("") is None
+
+def test_ambiguous_prefix(trie):
+    """Test that a shared prefix lists its candidates."""
+    with pytest.raises(AmbiguousCommandError) as excinfo:
+        trie.resolve("c")
+    assert excinfo.value.candidates == ["complexity-report", "create-checkpoint"]
+
+@pytest.mark.parametrize("args, expected", [
+    (["captains_orders", "warp-speed", "a"], "Executed warp_speed with input: a"),
+    (["warp", "a"], "Executed warp_speed with input: a"),
+    (["capt", "warp", "a"], "Executed warp_speed with input: a"),
+    (["fleet_commander", "commis", "a"], "Executed commission_ship with input: a"),
+])
+def test_cli_resolution(args, expected):
+    """Test that groups, aliases and prefixes dispatch in one pass."""
+    result = CliRunner().invoke(main, args)
+    assert result.exit_code == 0
+    assert expected in result.output
+
+def test_cli_ambiguous_prefix():
+    """Test that an ambiguous group prefix is a usage error."""
+    result = CliRunner().invoke(main, ["c"])
+    assert result.exit_code == 2
+    assert "ambiguous" in result.output
+
+@pytest.mark.parametrize("token, candidates", [
+    ("f", "find, fleet_commander"),
+    ("c", "captains_orders, communications_officer, completion"),
+])
+def test_cli_prefix_sees_builtin_commands(token, candidates):
+    """Test that top-level prefixes consider the commands defined on main itself."""
+    result = CliRunner().invoke(main, [token, "--help"])
+    assert result.exit_code == 2
+    assert f"'{token}' is ambiguous: {candidates}" in result.output
+
+def test_cli_builtin_prefix():
+    """Test that a unique prefix of a builtin command dispatches to it."""
+    result = CliRunner().invoke(main, ["fin", "--help"])
+    assert result.exit_code == 0
+    assert "Search command names" in result.output
+
+def test_library_call():
+    """Test that programmatic invocation resolves like the command line."""
+    assert main.main(args=["tactical", "fire"], standalone_mode=False) is None
@@ -0,0 +1,106 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for CommandRegistry.validate_commands."""
+
+import sys
+
+import pytest
+from starshipagentic.utils import command_validation
+from starshipagentic.utils.cache import CACHE_DIR_ENV
+from starshipagentic.utils.command_registry import command_registry
+
+CLI = '''import click
+from .services import run
+
+@click.command()
+@click.option("--level")
+def {name}_command(level=None):
+    click.echo(run(level))
+'''
+
+class FakeRegistry:
+    """Registry stand-in listing the commands of a temporary package."""
+
+    def __init__(self, commands):
+        self.commands = commands
+
+    def get_all_groups(self):
+        return ["fake_group"]
+
+    def get_all_commands(self, group_name):
+        return self.commands
+
+    def get_command_import_path(self, group_name, command_name):
+        package = command_name.replace("-", "_")
+        return f"fakecmds_{package}.cli:{package}_command"
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep cache entries inside the test's temporary directory."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+
+@pytest.fixture
+def package_root(tmp_path, monkeypatch):
+    """Provide an importable directory for fake command packages."""
+    root = tmp_path / "src"
+    root.mkdir()
+    monkeypatch.setattr(command_validation, "PACKAGE_ROOT", root)
+    monkeypatch.syspath_prepend(str(root))
+    yield root
+    for name in [name for name in sys.modules if name.startswith("fakecmds_")]:
+        del sys.modules[name]
+
+def make_command(root, name, cli=CLI, services="def run(value):\n    return value\n"):
+    """Write a command package with cli.py and services.py."""
+    package = root / f"fakecmds_{name}"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "cli.py").write_text(cli.format(name=name))
+    if services is not None:
+        (package / "services.py").write_text(services)
+
+def test_report(package_root):
+    """Test passing, missing-file, import-error and missing-option results."""
+    make_command(package_root, "good")
+    make_command(package_root, "no_services", services=None)
+    make_command(package_root, "broken", services="raise RuntimeError('boom')\n")
+    make_command(package_root, "no_option")
+    registry = FakeRegistry({
+        "good": {"options": ["--level: Shield level"]},
+        "no-services": {},
+        "broken": {},
+        "no-option": {"options": ["--force: Skip confirmation"]},
+    })
+
+    report = command_validation.validate(registry, jobs=4)
+    results = {result["command"]: result for result in report["commands"]}
+    assert (report["ok"], report["checked"], report["failed"]) == (False, 4, 3)
+    assert list(results) == ["good", "no-services", "broken", "no-option"]
+    assert results["good"]["ok"] and results["good"]["problems"] == []
+    assert results["no-services"]["problems"] == ["Missing fakecmds_no_services/services.py"]
+    assert "RuntimeError: boom" in results["broken"]["problems"][0]
+    assert results["no-option"]["problems"] == ["Documented option --force is not accepted"]
+
+def test_cache_keyed_by_file_hash(package_root):
+    """Test that passing results are reused until a file's contents change."""
+    make_command(package_root, "good")
+    registry = FakeRegistry({"good": {"options": ["--level: Shield level"]}})
+    assert command_validation.validate(registry)["cached"] == 0
+    assert command_validation.validate(registry)["cached"] == 1
+    assert command_validation.validate(registry, use_cache=False)["cached"] == 0
+
+    (package_root / "fakecmds_good" / "services.py").write_text("def run(value):\n    return None\n")
+    assert command_validation.validate(registry)["cached"] == 0
+
+def test_shipped_commands():
+    """Test the report for the real catalog."""
+    report = command_registry.validate_commands()
+    results = {(result["group"], result["command"]): result for result in report["commands"]}
+    assert report["checked"] == len(command_registry.get_all_commands())
+    assert results[("maintenance_officer", "complexity-report")]["ok"]
@@ -0,0 +1,84 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for shell completion."""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+from starshipagentic.utils import completion
+from starshipagentic.utils.cache import CACHE_DIR_ENV
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep cache entries inside the test's temporary directory."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+
+def names(prog, line):
+    """Return the candidate names for a command line."""
+    return [name for name, _ in completion.candidates(prog, completion.split_line(line)[1:])]
+
+def test_candidates():
+    """Test completing groups, commands, aliases, options and values."""
+    assert names("starshipagentic", "starshipagentic fleet_c") == ["fleet_commander"]
+    assert "visualize" in names("starshipagentic", "starshipagentic fleet_commander vis")
+    assert names("starshipagentic", "starshipagentic --log-level W") == ["WARNING"]
+    assert names("starshipagentic", "starshipagentic --log-level debug warp --") == ["--help"]
+    assert names("starshipagentic", "starshipagentic visualize --ship=fl") == ["--ship=flask"]
+    assert names("fleet_commander", "fleet_commander tour") == ["tour", "tour-ship"]
+    assert names("visualize", "visualize --ship ") == ["scout", "django", "flask", "react"]
+
+def test_main_cli_commands():
+    """Test completing the commands defined on the main CLI itself."""
+    assert names("starshipagentic", "starshipagentic fi") == ["find", "fire-photons"]
+    assert "completion" in names("starshipagentic", "starshipagentic comp")
+    assert names("starshipagentic", "starshipagentic completion ") == ["bash", "zsh", "fish"]
+    assert names("starshipagentic", "starshipagentic find --format j") == ["json"]
+    assert names("starshipagentic", "starshipagentic find warp --l") == ["--limit"]
+
+def test_checkpoint_values(tmp_path):
+    """Test that checkpoint IDs are the repository's tags."""
+    tags = tmp_path / ".git" / "refs" / "tags"
+    (tags / "release").mkdir(parents=True)
+    (tags / "before-refactor").write_text("0" * 40)
+    (tags / "release" / "v1").write_text("0" * 40)
+    (tmp_path / ".git" / "packed-refs").write_text(f"# pack-refs\n{'1' * 40} refs/tags/v0\n")
+    assert completion.checkpoint_ids(tmp_path) == ["before-refactor", "release/v1", "v0"]
+    (tags / "after-refactor").write_text("0" * 40)
+    assert "after-refactor" in completion.checkpoint_ids(tmp_path)
+
+def test_completion_endpoint(tmp_path):
+    """Test the shim answering a completion request."""
+    stream = io.StringIO()
+    completion.complete("starshipagentic", {completion.COMPLETE_ENV: "fish",
+                                             "COMP_LINE": "starshipagentic number_two mission-"}, stream)
+    assert stream.getvalue() == "mission-brief\tDefine project mission and requirements\n"
+
+    code = "import sys; sys.argv[0] = 'tour'; from starshipagentic.shim import main; main()"
+    env = dict(os.environ, STARSHIPAGENTIC_COMPLETE="bash", COMP_LINE="tour --")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == ["--category", "--help"]
+
+def test_script_names_old_entry_points_api(monkeypatch):
+    """Test listing scripts where entry_points() only returns a dict (Python < 3.10)."""
+    import importlib.metadata
+
+    scripts = [importlib.metadata.EntryPoint("warp", "starshipagentic.shim:main", "console_scripts"),
+               importlib.metadata.EntryPoint("pip", "pip._internal.cli.main:main", "console_scripts")]
+
+    def entry_points(**params):
+        if params:
+            raise TypeError("entry_points() got an unexpected keyword argument 'group'")
+        return {"console_scripts": scripts}
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", entry_points)
+    assert completion.script_names() == ["starshipagentic", "warp"]
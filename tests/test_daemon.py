@@ -0,0 +1,82 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the entry-point shim and the warm daemon."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+from starshipagentic import daemon
+from starshipagentic.shim import check_socket_dir, connect, entry_point_args, forward
+
+def test_entry_point_args():
+    """Test translating script names into main CLI arguments."""
+    assert entry_point_args("starshipagentic", ["--help"]) == ["--help"]
+    assert entry_point_args("maintenance_officer", []) == ["maintenance_officer"]
+    assert entry_point_args("warp", ["go"]) == ["captains_orders", "warp-speed", "go"]
+    assert entry_point_args("warp-speed", []) == ["captains_orders", "warp-speed"]
+
+def test_forward_without_daemon(tmp_path):
+    """Test that forwarding reports no daemon when the socket is missing."""
+    assert forward("warp", [], str(tmp_path / "missing.sock")) is None
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="daemon requires fork")
+def test_forward_to_daemon(tmp_path):
+    """Test that a running daemon executes commands with the client's stdio."""
+    socket_path = str(tmp_path / "daemon.sock")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "starshipagentic.daemon", "--socket", socket_path, "start", "--foreground"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 15
+        while daemon.request("ping", socket_path) is None:
+            assert time.monotonic() < deadline, "daemon did not start"
+            time.sleep(0.05)
+
+        client = (
+            "import sys\n"
+            "from starshipagentic.shim import forward\n"
+            f"sys.exit(forward(sys.argv[1], sys.argv[2:], {socket_path!r}))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", client, "complexity", "abc"],
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert "Executed complexity_report with input: abc" in result.stdout
+
+        result = subprocess.run([sys.executable, "-c", client, "starshipagentic", "no-such-group"],
+                                capture_output=True, text=True)
+        assert result.returncode == 2
+        assert "No such command" in result.stderr
+    finally:
+        daemon.request("stop", socket_path)
+        server.wait(timeout=10)
+
+def test_connect_refuses_untrusted_socket_dir(tmp_path):
+    """Test that nothing is sent to a socket in a directory others could have populated."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o755)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with server:
+        server.bind(str(shared / "daemon.sock"))
+        server.listen(1)
+        assert connect(str(shared / "daemon.sock")) is None
+        assert forward("warp", [], str(shared / "daemon.sock")) is None
+
+    os.chmod(shared, 0o700)
+    link = tmp_path / "link"
+    link.symlink_to(shared)
+    with pytest.raises(PermissionError):
+        check_socket_dir(str(link))
+    check_socket_dir(str(shared))
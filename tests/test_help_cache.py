@@ -0,0 +1,82 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the pre-rendered help cache."""
+
+import pytest
+from click.testing import CliRunner
+from starshipagentic.cli import main
+from starshipagentic.utils import help_cache, output
+from starshipagentic.utils.cache import CACHE_DIR_ENV
+from starshipagentic.utils.lazy_group import LazyGroup
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep cache entries inside the test's temporary directory."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.delenv(help_cache.NO_HELP_CACHE_ENV, raising=False)
+    return tmp_path / help_cache.NAMESPACE
+
+def test_terminal_profile(monkeypatch):
+    """Test width and colour detection from the environment."""
+    class Tty:
+        def isatty(self):
+            return True
+
+    for name in ("NO_COLOR", "FORCE_COLOR", "COLORTERM"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("COLUMNS", "100")
+    monkeypatch.setenv("TERM", "xterm-256color")
+    assert help_cache.terminal_profile(Tty()) == (100, "256")
+    monkeypatch.setenv("COLORTERM", "truecolor")
+    assert help_cache.terminal_profile(Tty()) == (100, "truecolor")
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert help_cache.terminal_profile(Tty()) == (100, None)
+
+def test_group_help_is_served_from_cache(cache_dir):
+    """Test that group help is rendered once and then read back."""
+    first = CliRunner().invoke(main, ["fleet_commander", "--help"])
+    assert first.exit_code == 0
+    assert "tour-ship" in first.output
+    entries = list(cache_dir.iterdir())
+    assert len(entries) == 1
+    assert entries[0].read_text() == first.output
+
+    entries[0].write_text("cached help\n")
+    second = CliRunner().invoke(main, ["fleet_commander", "--help"])
+    assert second.output == "cached help\n"
+
+def test_plain_group_help_never_replays_rich(monkeypatch, cache_dir):
+    """Test that plain mode renders unstyled group help instead of a cached rich screen."""
+    monkeypatch.setattr(output, "_state", {"plain": False})
+    rich_help = CliRunner().invoke(main, ["fleet_commander", "--help"])
+    assert "╭" in rich_help.output
+
+    output.set_plain(True)
+    plain_help = CliRunner().invoke(main, ["fleet_commander", "--help"])
+    assert plain_help.exit_code == 0
+    assert "╭" not in plain_help.output
+    assert "  tour-ship" in plain_help.output
+    assert len(list(cache_dir.iterdir())) == 2
+
+def test_command_help_without_import(monkeypatch):
+    """Test that a cached command help is printed without importing the command."""
+    import_path = "starshipagentic.commands.no_such_group.no_such_command:command"
+    group = LazyGroup(name="ships", lazy_subcommands={"launch": import_path})
+    ctx = group.make_context("ships", ["launch"], resilient_parsing=True)
+    scope = f"command:{ctx.command_path} launch"
+    profile = (help_cache.click_help_width(ctx), None)
+    help_cache.cached(scope, profile, help_cache.module_source(import_path), lambda: "Usage: ships launch")
+
+    result = CliRunner().invoke(group, ["launch", "--help"], prog_name="ships")
+    assert result.exit_code == 0
+    assert result.output == "Usage: ships launch\n"
+
+    monkeypatch.setenv(help_cache.NO_HELP_CACHE_ENV, "1")
+    result = CliRunner().invoke(group, ["launch", "--help"], prog_name="ships")
+    assert isinstance(result.exception, ModuleNotFoundError)
@@ -0,0 +1,50 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for non-interactive parameter resolution."""
+
+import click
+import pytest
+from starshipagentic.utils import interactive
+
+@pytest.fixture(autouse=True)
+def reset_interactive(monkeypatch):
+    """Start every test with no answers and prompting allowed."""
+    monkeypatch.setattr(interactive, "_state",
+                        {"answers": {}, "answers_file": None, "file_answers": None, "strict": None})
+    for name in (interactive.ANSWERS_FILE_ENV, interactive.NON_INTERACTIVE_ENV, "STARSHIPAGENTIC_ANSWER_SHIP"):
+        monkeypatch.delenv(name, raising=False)
+
+def test_provider_order(tmp_path, monkeypatch):
+    """Test that run answers beat the environment, which beats the answers file."""
+    answers_file = tmp_path / "answers.yml"
+    answers_file.write_text("ship: from-file\ntemplate-name: django\n")
+    interactive.configure(answers_file=str(answers_file))
+    assert interactive.prompt_for_missing_param("ship", "Ship?") == "from-file"
+    assert interactive.prompt_for_missing_param("template_name", "Template?") == "django"
+
+    monkeypatch.setenv("STARSHIPAGENTIC_ANSWER_SHIP", "from-env")
+    assert interactive.prompt_for_missing_param("ship", "Ship?") == "from-env"
+
+    with interactive.answers({"ship": "from-sequence"}):
+        assert interactive.prompt_for_missing_param("ship", "Ship?") == "from-sequence"
+    assert interactive.prompt_for_missing_param("ship", "Ship?") == "from-env"
+
+def test_strict_mode_never_prompts(monkeypatch):
+    """Test that strict mode uses defaults and fails without one."""
+    monkeypatch.setenv(interactive.NON_INTERACTIVE_ENV, "1")
+    assert interactive.prompt_for_missing_param("ship", "Ship?", default="enterprise") == "enterprise"
+    assert interactive.confirm_action("Launch?", default=False) is False
+    with pytest.raises(interactive.MissingParameterError, match="STARSHIPAGENTIC_ANSWER_SHIP"):
+        interactive.prompt_for_missing_param("ship", "Ship?")
+
+def test_provided_value_must_be_a_choice(monkeypatch):
+    """Test that provided values are checked against the choices."""
+    monkeypatch.setenv("STARSHIPAGENTIC_ANSWER_SHIP", "galactica")
+    with pytest.raises(click.BadParameter):
+        interactive.prompt_for_missing_param("ship", "Ship?", choices=["enterprise", "voyager"])
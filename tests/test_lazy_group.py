@@ -0,0 +1,63 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for lazily-resolved command groups."""
+
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+from starshipagentic.utils.lazy_group import LazyGroup
+
+@click.command()
+@click.argument("name", required=False)
+def hello_command(name=None):
+    """Say hello."""
+    click.echo(f"Hello {name}")
+
+def test_lazy_command_is_listed_without_loading():
+    """Test that lazy commands are listed but not imported."""
+    group = LazyGroup(name="demo", lazy_subcommands={"hello": f"{__name__}:hello_command"})
+    ctx = click.Context(group)
+    assert group.list_commands(ctx) == ["hello"]
+    assert "hello" not in group.commands
+
+def test_lazy_command_dispatch():
+    """Test that a lazy command is resolved and invoked on dispatch."""
+    loaded = []
+
+    def on_load(name, cmd):
+        loaded.append(name)
+        return cmd
+
+    group = LazyGroup(name="demo", on_load=on_load)
+    group.add_lazy_command("hello", f"{__name__}:hello_command")
+    result = CliRunner().invoke(group, ["hello", "world"])
+    assert result.exit_code == 0
+    assert "Hello world" in result.output
+    assert loaded == ["hello"]
+    assert group.commands["hello"] is hello_command
+
+def test_missing_attribute_is_no_such_command():
+    """Test that an import path without a click command is reported as missing."""
+    group = LazyGroup(name="demo", lazy_subcommands={"nope": f"{__name__}:missing_command"})
+    result = CliRunner().invoke(group, ["nope"])
+    assert result.exit_code != 0
+    assert "No such command" in result.output
+
+def test_cli_import_does_not_load_command_modules():
+    """Test that importing the main CLI does not import any group or command module."""
+    code = (
+        "import sys, starshipagentic.cli\n"
+        "loaded = [m for m in sys.modules if m.startswith('starshipagentic.commands.')]\n"
+        "assert not loaded, loaded\n"
+        "assert 'pygame' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,87 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the logging layer."""
+
+import json
+import logging
+
+import pytest
+from click.testing import CliRunner
+from starshipagentic.cli import main
+from starshipagentic.utils import log
+
+@pytest.fixture(autouse=True)
+def reset_logging(monkeypatch):
+    """Start every test unconfigured and leave no handlers behind."""
+    monkeypatch.setattr(log, "_state", {"level": None, "log_file": None})
+    monkeypatch.delenv(log.LOG_LEVEL_ENV, raising=False)
+    monkeypatch.delenv(log.LOG_FILE_ENV, raising=False)
+    yield
+    logger = logging.getLogger(log.LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(logging.NOTSET)
+
+def test_level_from_environment(monkeypatch):
+    """Test the env default and that explicit levels win."""
+    monkeypatch.setenv(log.LOG_LEVEL_ENV, "info")
+    assert log.configure_logging().level == logging.INFO
+    assert log.configure_logging(level="error").level == logging.ERROR
+    # Unspecified arguments keep the current configuration
+    assert log.configure_logging().level == logging.ERROR
+    with pytest.raises(ValueError):
+        log.configure_logging(level="loud")
+
+def test_json_lines_sink(tmp_path):
+    """Test that records are written as JSON with their extra fields."""
+    path = tmp_path / "log.jsonl"
+    log.configure_logging(level="debug", log_file=str(path))
+    logging.getLogger("starshipagentic.test").debug("hello %s", "world", extra={"step": 3})
+    logging.getLogger("starshipagentic.test").info("second")
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["message"] for r in records] == ["hello world", "second"]
+    assert records[0]["level"] == "DEBUG"
+    assert records[0]["logger"] == "starshipagentic.test"
+    assert records[0]["step"] == 3
+
+def test_disabled_debug_skips_formatting():
+    """Test that a disabled level never formats its arguments."""
+    log.configure_logging(level="warning")
+
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted")
+
+    logging.getLogger("starshipagentic.test").debug("value %s", Exploding())
+
+def test_cli_output_has_no_debug_by_default():
+    """Test that commands print only their own output unless debug is on."""
+    result = CliRunner().invoke(main, ["fleet_commander", "tour-ship", "x"])
+    assert result.exit_code == 0
+    assert "DEBUG" not in result.output
+
+    result = CliRunner().invoke(main, ["--log-level", "debug", "fleet_commander", "tour-ship", "x"])
+    assert result.exit_code == 0
+    assert "DEBUG starshipagentic.cli: Delegating control to subcommand fleet_commander" in result.stderr
+    assert "Executed tour_ship with input: x" in result.stdout
+
+@pytest.mark.parametrize("use_env", [False, True])
+def test_unwritable_log_file_is_usage_error(tmp_path, monkeypatch, use_env):
+    """Test that a log file that cannot be opened is reported as a usage error."""
+    path = str(tmp_path / "missing" / "x.log")
+    if use_env:
+        monkeypatch.setenv(log.LOG_FILE_ENV, path)
+        args = ["--log-level", "debug", "fleet_commander", "tour-ship", "x"]
+    else:
+        args = ["--log-level", "debug", "--log-file", path, "fleet_commander", "tour-ship", "x"]
+    result = CliRunner().invoke(main, args)
+    assert result.exit_code == 2
+    assert not isinstance(result.exception, OSError)
+    assert "No such file or directory" in result.output
@@ -0,0 +1,45 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the plain/rich output layer."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from starshipagentic.utils import output
+
+@pytest.fixture(autouse=True)
+def reset_output(monkeypatch):
+    """Start every test with terminal-dependent output."""
+    monkeypatch.setattr(output, "_state", {"plain": None})
+    monkeypatch.delenv(output.PLAIN_ENV, raising=False)
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+
+def test_strip_markup():
+    """Test that tags are removed and escaped brackets are kept."""
+    assert output.strip_markup("[bold red]✗ step[/bold red] [/]done") == "✗ step done"
+    assert output.strip_markup(r"list\[int] [1]") == "list[int] [1]"
+
+def test_plain_when_not_a_terminal(capsys):
+    """Test that strings print without markup when stdout is not a terminal."""
+    output.console.print("[green]✓[/green]", "ok", end="!\n")
+    assert capsys.readouterr().out == "✓ ok!\n"
+    output.set_plain(False)
+    assert not output.is_plain()
+
+def test_dispatch_does_not_import_rich():
+    """Test that piped command output never imports rich."""
+    code = ("import sys; from starshipagentic.cli import main\n"
+            "try:\n    main(['fleet_commander', 'tour-ship', 'x'])\n"
+            "except SystemExit:\n    pass\n"
+            "print('rich' in sys.modules)")
+    env = dict(os.environ, STARSHIPAGENTIC_NO_DAEMON="1")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert result.stdout.splitlines() == ["Executed tour_ship with input: x", "False"]
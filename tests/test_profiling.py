@@ -0,0 +1,61 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for per-phase timing and --profile."""
+
+import cProfile
+import pstats
+import time
+
+from click.testing import CliRunner
+from starshipagentic.cli import main
+from starshipagentic.utils.profiling import PhaseTimer, collapsed_stacks
+
+def test_phases_are_exclusive():
+    """Test that a nested phase pauses the enclosing one."""
+    timer = PhaseTimer()
+    with timer.phase("dispatch"):
+        time.sleep(0.01)
+        with timer.phase("command"):
+            time.sleep(0.03)
+    total, rows = timer.breakdown()
+    totals = dict(rows)
+    assert 0.03 <= totals["command"] < 0.03 + 0.02
+    assert 0.01 <= totals["dispatch"] < 0.03
+    assert abs(sum(totals.values()) - total) < 1e-6
+
+def test_collapsed_stacks():
+    """Test converting a cProfile run into collapsed stacks."""
+    def leaf():
+        return sum(range(20000))
+
+    def branch():
+        return leaf() + leaf()
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    branch()
+    profiler.disable()
+    lines = collapsed_stacks(pstats.Stats(profiler))
+    stacks = [line.rsplit(" ", 1) for line in lines]
+    assert all(weight.isdigit() for _, weight in stacks)
+    assert any(stack.split(";")[-2:] == [f"branch (test_profiling.py:{branch.__code__.co_firstlineno})",
+                                         f"leaf (test_profiling.py:{leaf.__code__.co_firstlineno})"]
+               for stack, _ in stacks)
+
+def test_profile_option(tmp_path):
+    """Test the phase report and the profile files."""
+    output = tmp_path / "warp.prof"
+    result = CliRunner().invoke(main, ["--profile-output", str(output), "warp", "x"])
+    assert result.exit_code == 0
+    assert "Executed warp_speed with input: x" in result.stdout
+    assert "Phase" in result.stderr
+    for phase in ("parse", "dispatch", "command", "total"):
+        assert f"\n{phase} " in result.stderr
+    assert pstats.Stats(str(output)).total_calls > 0
+    assert "warp_speed_command" in (tmp_path / "warp.prof.collapsed").read_text()
@@ -0,0 +1,105 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for in-process command sequence execution."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+from starshipagentic.cli import main
+from starshipagentic.utils.sequence import (load_sequence, load_sequence_answers, parse_step, plan_sequence,
+                                            run_command_sequence)
+
+def test_parse_step_forms():
+    """Test parsing string and mapping entries."""
+    assert parse_step("fleet_commander tour-ship") == ["fleet_commander", "tour-ship"]
+    assert parse_step("number_two mission-brief --idea='Test project'") == [
+        "number_two", "mission-brief", "--idea=Test project"]
+    assert parse_step({"fleet_commander": {"commission-ship": {"template": "modern-django", "verbose": True}}}) == [
+        "fleet_commander", "commission-ship", "--template=modern-django", "--verbose"]
+    assert parse_step({"fleet_commander": {"tour-ship": None}}) == ["fleet_commander", "tour-ship"]
+    with pytest.raises(ValueError):
+        parse_step({"a": {}, "b": {}})
+
+def test_plan_dependencies():
+    """Test implicit ordering, explicit needs and graph validation."""
+    steps = plan_sequence([
+        "fleet_commander tour-ship",
+        {"id": "scan", "needs": [], "run": "communications_officer scan-sector"},
+        {"needs": "scan", "maintenance_officer": "complexity-report"},
+    ])
+    assert [(step["id"], step["needs"], step["after"]) for step in steps] == [
+        ("step-1", [], []), ("scan", [], []), ("step-3", ["scan"], [])]
+    assert steps[2]["args"] == ["maintenance_officer", "complexity-report"]
+    with pytest.raises(ValueError, match="unknown"):
+        plan_sequence([{"needs": ["missing"], "run": "fleet_commander tour-ship"}])
+    with pytest.raises(ValueError, match="duplicate"):
+        plan_sequence([{"id": "a", "run": "x y"}, {"id": "a", "run": "x y"}])
+    with pytest.raises(ValueError, match="cycle"):
+        plan_sequence([{"id": "a", "needs": ["b"], "run": "x y"}, {"id": "b", "needs": ["a"], "run": "x y"}])
+
+def test_packaged_sequence_parses():
+    """Test that every entry of the shipped starshipagentic.yml parses."""
+    commands = load_sequence()
+    assert commands
+    for entry in commands:
+        assert parse_step(entry)
+
+def test_stop_on_failure(tmp_path):
+    """Test that the first failing step skips the rest and is reported."""
+    report_path = tmp_path / "report.json"
+    report = run_command_sequence(
+        ["fleet_commander tour-ship", "fleet_commander no-such-command", "tactical_officer fire-photons"],
+        report_path=report_path,
+    )
+    assert not report["ok"]
+    assert [step["status"] for step in report["steps"]] == ["ok", "failed", "skipped"]
+    assert report["steps"][1]["exit_code"] == 2
+    assert json.loads(report_path.read_text())["counts"] == {"ok": 1, "failed": 1, "skipped": 1}
+
+def test_continue_on_failure():
+    """Test that continue mode runs every step."""
+    report = run_command_sequence(
+        ["fleet_commander no-such-command", "tactical_officer fire-photons"],
+        stop_on_failure=False,
+    )
+    assert [step["status"] for step in report["steps"]] == ["failed", "ok"]
+
+def test_sequence_option(tmp_path):
+    """Test running a sequence file through the main CLI."""
+    sequence_file = tmp_path / "starshipagentic.yml"
+    sequence_file.write_text('commands:\n  - "tactical_officer fire-photons"\n')
+    result = CliRunner().invoke(main, ["--sequence", str(sequence_file)])
+    assert result.exit_code == 0
+    assert "Executed fire_photons" in result.output
+
+def test_parallel_run_replays_output_in_order(capsys):
+    """Test concurrent steps, skipped dependents and ordered output."""
+    report = run_command_sequence([
+        {"id": "scan", "needs": [], "run": "communications_officer scan-sector first"},
+        {"id": "bad", "needs": [], "run": "fleet_commander no-such-command"},
+        {"id": "report", "needs": [], "run": "maintenance_officer complexity-report second"},
+        {"needs": ["bad"], "run": "tactical_officer fire-photons never"},
+        {"needs": ["scan", "report"], "run": "tactical_officer fire-photons third"},
+    ], stop_on_failure=False, jobs=3)
+    assert [step["status"] for step in report["steps"]] == ["ok", "failed", "ok", "skipped", "ok"]
+    out = capsys.readouterr().out
+    positions = [out.index(f"with input: {word}") for word in ("first", "second", "third")]
+    assert positions == sorted(positions)
+    assert "with input: never" not in out
+
+def test_sequence_answers(tmp_path):
+    """Test reading the answers: mapping next to the commands."""
+    path = tmp_path / "starshipagentic.yml"
+    path.write_text("answers:\n  ship: enterprise\ncommands:\n  - fleet_commander tour-ship\n")
+    assert load_sequence(path) == ["fleet_commander tour-ship"]
+    assert load_sequence_answers(path) == {"ship": "enterprise"}
+    path.write_text("answers: [ship]\ncommands: []\n")
+    with pytest.raises(ValueError):
+        load_sequence_answers(path)
@@ -0,0 +1,55 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for did-you-mean suggestions and starshipagentic find."""
+
+import time
+
+from click.testing import CliRunner
+from starshipagentic.cli import main
+from starshipagentic.utils.command_registry import CommandRegistry
+from starshipagentic.utils.suggest import TrigramIndex, edit_distance
+
+def test_edit_distance():
+    """Test that transpositions count as one edit."""
+    assert edit_distance("warp", "wrap") == 1
+    assert edit_distance("complexty", "complexity") == 1
+    assert edit_distance("abc", "xyz", limit=1) == 2
+
+def test_index_dedupes_targets():
+    """Test that a target is suggested once, through its best name."""
+    index = TrigramIndex()
+    index.add("warp-speed", ("command_officer", "warp-speed"))
+    index.add("warp", ("command_officer", "warp-speed"))
+    index.add("tour-ship", ("fleet_commander", "tour-ship"))
+    assert [(name, target) for name, target, _score in index.search("warpp")] == [
+        ("warp", ("command_officer", "warp-speed"))]
+
+def test_registry_suggest():
+    """Test suggestions for mistyped groups, commands and aliases."""
+    registry = CommandRegistry()
+    assert registry.suggest("complexty-report", "maintenance_officer")[0] == "complexity-report"
+    assert registry.suggest("maintenence_officer")[0] == "maintenance_officer"
+    assert registry.suggest("xyzzy") == []
+
+    start = time.perf_counter()
+    for _ in range(100):
+        registry.suggest("complexty-report", "maintenance_officer")
+    assert (time.perf_counter() - start) / 100 < 0.005
+
+def test_unknown_command_suggestion():
+    """Test that an unknown command fails with a did-you-mean hint."""
+    result = CliRunner().invoke(main, ["maintenance_officer", "complexty-report"])
+    assert result.exit_code == 2
+    assert "Did you mean 'complexity-report'?" in result.output
+
+def test_find():
+    """Test searching descriptions with a typo."""
+    result = CliRunner().invoke(main, ["find", "complexty", "--format", "tsv"])
+    assert result.exit_code == 0
+    assert result.output.splitlines()[1].split("\t")[:2] == ["maintenance_officer", "complexity-report"]
@@ -0,0 +1,93 @@
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Tests for the incremental alias sync tool."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+from starshipagentic.utils.cache import CACHE_DIR_ENV
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+import sync2_aliases
+
+COMMANDS = {
+    "probe_group": {
+        "description": "Probe commands",
+        "commands": {
+            "probe-scan": {"description": "Scan", "aliases": ["pscan"]},
+            "probe-log": {"description": "Log"},
+        },
+    },
+}
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """Point the sync tool at a scratch project with one command group."""
+    root = tmp_path / "project"
+    package = root / "src" / "starshipagentic"
+    (package / "commands").mkdir(parents=True)
+    shutil.copy(sync2_aliases.BASE_DIR / "pyproject.toml", root / "pyproject.toml")
+    shutil.copy(sync2_aliases.BASE_DIR / "src" / "starshipagentic" / "cli_static.py", package / "cli_static.py")
+    (package / "commands-list.yml").write_text(yaml.safe_dump(COMMANDS))
+
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(sync2_aliases, "BASE_DIR", root)
+    monkeypatch.setattr(sync2_aliases, "COMMANDS_LIST_PATH", package / "commands-list.yml")
+    monkeypatch.setattr(sync2_aliases, "COMMANDS_DIR", package / "commands")
+    monkeypatch.setattr(sync2_aliases, "PYPROJECT_PATH", root / "pyproject.toml")
+    monkeypatch.setattr(sync2_aliases, "CLI_PATH", package / "cli.py")
+    monkeypatch.setattr(sync2_aliases, "CLI_GENERATED_PATH", package / "cli_generated.py")
+    monkeypatch.setattr(sync2_aliases, "MANIFEST_PATH", package / "commands-manifest.json")
+    return package
+
+def sync(force=False):
+    """Run a sync without reinstalling; return the groups it skipped."""
+    state = sync2_aliases.load_sync_state()
+    sync2_aliases.sync_cli_file(state, force=force)
+    sync2_aliases.save_sync_state({key: value for key, value in state.items() if key != "skipped"})
+    return [step.split(":", 1)[1] for step in state["skipped"]]
+
+def test_unchanged_group_is_skipped(tree):
+    """Test that a second sync skips a group whose entry and files are unchanged."""
+    assert sync() == []
+    assert (tree / "commands" / "probe_group" / "probe_scan" / "services.py").is_file()
+    assert sync() == ["probe_group"]
+    assert sync(force=True) == []
+
+def test_missing_or_edited_files_are_regenerated(tree):
+    """Test that deleted scaffolding and a hand-edited group __init__.py are not skipped."""
+    sync()
+    services = tree / "commands" / "probe_group" / "probe_log" / "services.py"
+    services.unlink()
+    assert sync() == []
+    assert services.is_file()
+
+    group_init = tree / "commands" / "probe_group" / "__init__.py"
+    expected = group_init.read_text()
+    group_init.write_text(expected + "# edited\n")
+    assert sync() == []
+    assert group_init.read_text() == expected
+
+def test_check(tree, capsys):
+    """Test that --check reports out-of-sync files without writing anything."""
+    assert sync2_aliases.check_sync() is False
+    assert not (tree / "commands" / "probe_group").exists()
+
+    sync()
+    capsys.readouterr()
+    assert sync2_aliases.check_sync() is True
+
+    services = tree / "commands" / "probe_group" / "probe_log" / "services.py"
+    services.unlink()
+    assert sync2_aliases.check_sync() is False
+    assert "missing  src/starshipagentic/commands/probe_group/probe_log/services.py" in capsys.readouterr().out
+    assert not services.exists()
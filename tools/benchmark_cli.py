@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# Starship Agentic License Header
+#
+# Copyright (c) 2025 Travis Somerville and David Samson
+#
+# This file is part of Starship Agentic.
+#
+# It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
+# For full details, see the LICENSE.md file in the project root.
+"""Benchmark CLI start-up and dispatch, and gate on regressions.
+
+Cases:
+    help                  starshipagentic --help
+    group:<name>          starshipagentic <group> --help
+    alias:<name>          <alias> --help, through the console-script entry point
+    sequence              starshipagentic --sequence (the packaged starshipagentic.yml)
+
+Each case runs in a fresh interpreter exactly as the console script does.
+"Cold" is one run with empty bytecode and Starship Agentic caches (help,
+completion, validation); "warm" is the best and median of several runs with
+caches populated. The daemon is disabled so in-process start-up is measured.
+
+Usage:
+    python tools/benchmark_cli.py                       # run, compare with the baseline
+    python tools/benchmark_cli.py --save-baseline       # run and store the baseline
+    python tools/benchmark_cli.py --cases 'group:*' --runs 3 --output results.json
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from src.starshipagentic.utils.cache import CACHE_DIR_ENV
+from src.starshipagentic.utils.command_manifest import COMMANDS_LIST_PATH
+from src.starshipagentic.utils.sequence import DEFAULT_SEQUENCE_PATH
+
+RESULTS_VERSION = 1
+DEFAULT_BASELINE_PATH = BASE_DIR / "tools" / "benchmark-baseline.json"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 5.0
+
+# Equivalent of the generated console-script wrapper, with argv[0] set to the script name
+ENTRY_POINT = "import sys; sys.argv[0] = sys.argv.pop(1); from starshipagentic.shim import main; sys.exit(main())"
+
+def load_scripts():
+    """Return the [project.scripts] table from pyproject.toml."""
+    try:
+        import tomllib as tomli
+    except ImportError:
+        import tomli
+    with open(BASE_DIR / "pyproject.toml", "rb") as f:
+        return tomli.load(f).get("project", {}).get("scripts", {})
+
+def build_cases():
+    """Return the benchmark cases as an ordered mapping of name -> (script, args)."""
+    import yaml
+
+    with open(COMMANDS_LIST_PATH, "r") as f:
+        groups = yaml.safe_load(f) or {}
+
+    cases = {"help": ("starshipagentic", ["--help"])}
+    for group_name in groups:
+        cases[f"group:{group_name}"] = ("starshipagentic", [group_name, "--help"])
+    for script, target in load_scripts().items():
+        if script != "starshipagentic" and target.startswith("starshipagentic.shim:"):
+            cases[f"alias:{script}"] = (script, ["--help"])
+    cases["sequence"] = ("starshipagentic", ["--sequence", str(DEFAULT_SEQUENCE_PATH), "--continue-on-error"])
+    return cases
+
+def run_case(script, args, env):
+    """Run one invocation; return (seconds, exit code)."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", ENTRY_POINT, script] + list(args),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    return time.perf_counter() - started, result.returncode
+
+def benchmark(cases, runs=5):
+    """
+    Time every case cold and warm.
+
+    Args:
+        cases (dict): name -> (script, args)
+        runs (int): Warm runs per case
+
+    Returns:
+        dict: name -> {"cold", "warm_min", "warm_median", "warm_runs", "exit_code"} (seconds)
+    """
+    env = dict(os.environ, STARSHIPAGENTIC_NO_DAEMON="1", COLUMNS="120", NO_COLOR="1")
+    env.pop("STARSHIPAGENTIC_LOG_FILE", None)
+    results = {}
+    for name, (script, args) in cases.items():
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold_env = dict(env, PYTHONPYCACHEPREFIX=os.path.join(cache_dir, "pycache"),
+                            **{CACHE_DIR_ENV: os.path.join(cache_dir, "starshipagentic")})
+            cold, exit_code = run_case(script, args, cold_env)
+        run_case(script, args, env)
+        warm = [run_case(script, args, env)[0] for _ in range(runs)]
+        results[name] = {
+            "cold": round(cold, 6),
+            "warm_min": round(min(warm), 6),
+            "warm_median": round(statistics.median(warm), 6),
+            "warm_runs": [round(value, 6) for value in warm],
+            "exit_code": exit_code,
+        }
+        print(f"{name:<40} cold {cold * 1000:8.1f} ms   warm min {min(warm) * 1000:8.1f} ms"
+              f"   median {statistics.median(warm) * 1000:8.1f} ms")
+    return results
+
+def environment_metadata():
+    """Describe the machine and software the results were measured on."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=BASE_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    versions = {}
+    for package in ("click", "rich", "pyyaml"):
+        try:
+            from importlib.metadata import version
+            versions[package] = version(package)
+        except Exception:
+            versions[package] = None
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": commit,
+        "packages": versions,
+    }
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=DEFAULT_MIN_DELTA_MS):
+    """
+    Compare the exit codes and fastest warm runs with a baseline.
+
+    A case whose exit code differs from the baseline's always regresses, so a
+    command that starts failing fast is not mistaken for a speed-up.
+
+    The minimum is the least noisy statistic for start-up times: slowdowns
+    from other load on the machine only ever add time.
+
+    A case regresses when it is both ``threshold`` (relative) and
+    ``min_delta_ms`` (absolute) slower than the baseline; the absolute floor
+    keeps millisecond-level noise from failing the gate.
+
+    Args:
+        current (dict): Results document being checked
+        baseline (dict): Stored baseline results document
+        threshold (float): Allowed relative slowdown, e.g. 0.25 for 25%
+        min_delta_ms (float): Slowdowns smaller than this never fail
+
+    Returns:
+        list: ``(case, description)`` for every regression
+    """
+    regressions = []
+    for name, result in current["cases"].items():
+        reference = baseline.get("cases", {}).get(name)
+        if reference is None:
+            continue
+        if "exit_code" in reference and result.get("exit_code") != reference["exit_code"]:
+            regressions.append((name, f"exit code {reference['exit_code']} -> {result.get('exit_code')}"))
+            continue
+        before, after = reference["warm_min"], result["warm_min"]
+        if after > before * (1 + threshold) and (after - before) * 1000 > min_delta_ms:
+            regressions.append((name, f"{before * 1000:.1f} ms -> {after * 1000:.1f} ms"))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark starshipagentic start-up and dispatch")
+    parser.add_argument("--runs", type=int, default=5, help="Warm runs per case (default: 5)")
+    parser.add_argument("--cases", action="append", help="Only run cases matching this glob (repeatable)")
+    parser.add_argument("--output", help="Write the results JSON here")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="Baseline results JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown before failing (default: 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Ignore slowdowns smaller than this (default: 5)")
+    args = parser.parse_args()
+
+    cases = build_cases()
+    if args.cases:
+        cases = {name: case for name, case in cases.items()
+                 if any(fnmatch.fnmatch(name, pattern) for pattern in args.cases)}
+
+    current = {
+        "version": RESULTS_VERSION,
+        "environment": environment_metadata(),
+        "settings": {"runs": args.runs},
+        "cases": benchmark(cases, runs=max(1, args.runs)),
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("environment", {}).get("python") != current["environment"]["python"]:
+        print("⚠️ Baseline was recorded with a different Python version; comparison may be unreliable")
+
+    regressions = compare_results(current, baseline, args.threshold, args.min_delta_ms)
+    for name, description in regressions:
+        print(f"❌ {name}: {description}")
+    if regressions:
+        print(f"{len(regressions)} case(s) changed exit code or regressed by more than {args.threshold:.0%}")
+        return 1
+    print("✅ No regressions against the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
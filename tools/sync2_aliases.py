@@ -21,14 +21,25 @@ It also updates:
   - The __init__.py in each group folder to import all command packages.
   - The top-level commands/__init__.py to import all group folders.
   - The pyproject.toml [project.scripts] section with the expected aliases.
+  - The precompiled command manifest (commands-manifest.json) read by the CLI at runtime.
   - The main CLI (src/starshipagentic/cli.py) with auto-generated import lines.
 The tool is generative – it creates missing files using fixed templates, but if files already exist,
 it leaves any existing user logic intact (only updating __init__ files, etc).
+
+Syncing is incremental: each group's commands-list.yml entry is hashed, and groups whose hash
+and command packages are unchanged since the last sync are skipped. Generated files are only
+written (atomically) when their content differs from disk, and `pip install -e .` only runs when
+the [project.scripts] table changed. The sync state lives in the user cache directory.
 """
 
+import difflib
+import hashlib
+import json
 import os
 import sys
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import subprocess
 
@@ -108,6 +119,14 @@ COMMANDS_DIR = BASE_DIR / "src" / "starshipagentic" / "commands"
 PYPROJECT_PATH = BASE_DIR / "pyproject.toml"
 CLI_PATH = BASE_DIR / "src" / "starshipagentic" / "cli.py"
 CLI_GENERATED_PATH = BASE_DIR / "src" / "starshipagentic" / "cli_generated.py"
+MANIFEST_PATH = BASE_DIR / "src" / "starshipagentic" / "commands-manifest.json"
+
+sys.path.insert(0, str(BASE_DIR))
+from src.starshipagentic.utils.alias_analysis import analyze, load_reserved, path_executables
+from src.starshipagentic.utils.cache import atomic_write, cache_key, read_entry, write_entry
+
+SYNC_STATE_VERSION = 1
+SYNC_STATE_NAMESPACE = "sync"
 
 # Templates for new command package files
 INIT_TEMPLATE = '''"""Auto-generated __init__.py for the {command} command package."""
@@ -141,6 +160,40 @@ def load_commands_list():
     with open(COMMANDS_LIST_PATH, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
+def content_hash(data):
+    """Return a SHA-256 digest of JSON-serialisable data."""
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def write_if_changed(path, content):
+    """
+    Atomically write text to path unless the file already has exactly that content.
+    Returns True if the file was written.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    atomic_write(path, content)
+    return True
+
+def load_sync_state():
+    """Return the state recorded by the last sync of this checkout (empty if none)."""
+    text = read_entry(SYNC_STATE_NAMESPACE, cache_key(str(BASE_DIR.resolve())))
+    try:
+        state = json.loads(text) if text else {}
+    except ValueError:
+        state = {}
+    if state.get("version") != SYNC_STATE_VERSION:
+        state = {"version": SYNC_STATE_VERSION}
+    state.setdefault("groups", {})
+    state.setdefault("timings", {})
+    return state
+
+def save_sync_state(state):
+    write_entry(SYNC_STATE_NAMESPACE, cache_key(str(BASE_DIR.resolve())), json.dumps(state, indent=2))
+
 def scaffold_command_package(group, command):
     """
     Ensure that the command package exists under:
@@ -156,30 +209,24 @@ def scaffold_command_package(group, command):
     # __init__.py: Only scaffold if it doesn't exist.
     init_file = package_dir / "__init__.py"
     if not init_file.exists():
-        with open(init_file, "w", encoding="utf-8") as f:
-            f.write(INIT_TEMPLATE.format(command=sanitized_command))
+        atomic_write(init_file, INIT_TEMPLATE.format(command=sanitized_command))
         print(f"Created: {init_file}")
 
     # cli.py: Scaffold if file does not exist.
     cli_file = package_dir / "cli.py"
     if not cli_file.exists():
-        with open(cli_file, "w", encoding="utf-8") as f:
-            f.write(CLI_TEMPLATE.format(command=sanitized_command))
+        atomic_write(cli_file, CLI_TEMPLATE.format(command=sanitized_command))
         print(f"Created: {cli_file}")
 
     # services.py: Scaffold if file does not exist.
     services_file = package_dir / "services.py"
     if not services_file.exists():
-        with open(services_file, "w", encoding="utf-8") as f:
-            f.write(SERVICES_TEMPLATE.format(command=sanitized_command))
+        atomic_write(services_file, SERVICES_TEMPLATE.format(command=sanitized_command))
         print(f"Created: {services_file}")
 
-def update_group_init(group):
-    """
-    In the group folder (COMMANDS_DIR/group), update __init__.py to list all command packages and create a click group object.
-    """
+def group_packages(group):
+    """Return the sorted command packages (directories with a cli.py) in a group folder."""
     group_dir = COMMANDS_DIR / group
-    init_file = group_dir / "__init__.py"
     packages = []
     if group_dir.exists():
         for item in os.listdir(group_dir):
@@ -187,9 +234,24 @@ def update_group_init(group):
             if item_path.is_dir() and (item_path / "cli.py").exists():
                 packages.append(item)
         packages.sort()
+    return packages
+
+def update_group_init(group):
+    """
+    In the group folder (COMMANDS_DIR/group), update __init__.py to list all command packages and create a click group object.
+    Returns True if the file changed.
+    """
+    init_file = COMMANDS_DIR / group / "__init__.py"
+    if write_if_changed(init_file, render_group_init(group, group_packages(group))):
+        print(f"✅ Group '{group}' updated.")
+        return True
+    return False
+
+def render_group_init(group, packages):
+    """Return the content of a group's __init__.py for the given command packages."""
     content = f'"""Auto-generated __init__.py for the {group} group."""\n\n'
-    content += "import click\n"
-    content += f'{group}_group = click.Group(name="{group}")\n\n'
+    content += "from starshipagentic.utils.lazy_group import LazyGroup\n"
+    content += f'{group}_group = LazyGroup(name="{group}")\n\n'
     content += "__all__ = [\n"
     for pkg in packages:
         content += f'    "{pkg}",\n'
@@ -203,12 +265,9 @@ def run_group():
     """Entry point for running the {group} command group directly."""
     import sys
     from starshipagentic.cli import main as cli_main
-    sys.argv = ['starshipagentic', '{group}']
-    cli_main()
+    cli_main(args=['{group}'] + sys.argv[1:], prog_name='starshipagentic')
 '''
-    with open(init_file, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"✅ Group '{group}' updated.")
+    return content
 
 def update_commands_init(valid_groups):
     """
@@ -216,6 +275,18 @@ def update_commands_init(valid_groups):
     Also report stale groups that are present on disk but not in valid_groups.
     """
     init_file = COMMANDS_DIR / "__init__.py"
+    groups = group_dirs()
+    stale = sorted(set(groups) - set(valid_groups))
+    if stale:
+        from rich import print as rich_print
+        rich_print("[bold red]BIG NOTE: The following command group directories are stale (not in commands-list.yml). Please cleanup manually:[/bold red]")
+        for s in stale:
+            rich_print(f" - {s}")
+    if write_if_changed(init_file, render_commands_init(groups)):
+        print("✅ Commands __init__ updated.")
+
+def group_dirs():
+    """Return the sorted group directories under COMMANDS_DIR."""
     ignored = {"__pycache__"}
     groups = []
     for item in os.listdir(COMMANDS_DIR):
@@ -225,61 +296,90 @@ def update_commands_init(valid_groups):
         if item_path.is_dir():
             groups.append(item)
     groups.sort()
-    stale = sorted(set(groups) - set(valid_groups))
-    if stale:
-        from rich import print as rich_print
-        rich_print("[bold red]BIG NOTE: The following command group directories are stale (not in commands-list.yml). Please cleanup manually:[/bold red]")
-        for s in stale:
-            rich_print(f" - {s}")
+    return groups
+
+def render_commands_init(groups):
+    """Return the content of the top-level commands/__init__.py for the given groups."""
     content = '"""Auto-generated __init__.py for command groups."""\n\n__all__ = [\n'
     for group in groups:
         content += f'    "{group}",\n'
     content += ']\n\n'
-    for group in groups:
-        content += f"from . import {group}\n"
-    with open(init_file, "w", encoding="utf-8") as f:
-        f.write(content)
-    print("✅ Commands __init__ updated.")
+    content += '''
+def __getattr__(name):
+    """Import a command group package on first attribute access."""
+    if name in __all__:
+        import importlib
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+'''
+    return content
 
-def generate_expected_aliases(commands_data):
+SHIM_TARGET = "starshipagentic.shim:main"
+DAEMON_TARGET = "starshipagentic.daemon:daemon_cli"
+
+def generate_command_targets(commands_data):
     """
-    Build a dictionary of expected aliases.
+    Build a dictionary mapping every group and command alias to the object it runs.
     For each command in each group, the alias maps to:
        starshipagentic.commands.<group>.<command>.cli:<command>_command
     Also add each group shortcut mapping to a run_group function:
        e.g., group alias "weapons" -> starshipagentic.commands.weapons:run_group
-    And always include the main alias:
-       "starshipagentic" -> starshipagentic.cli:main
-    """
-    expected = {}
-    # Group-level aliases
-    for group in commands_data.keys():
-        expected[group] = f"starshipagentic.commands.{group}:run_group"
-    # Command-level aliases
-    for group, data in commands_data.items():
-        cmds = data.get("commands", {})
-        for cmd in cmds.keys():
+    Names come from the alias analysis; where a name is claimed twice the last claim wins.
+    """
+    targets = {}
+    for alias, claims in analyze(commands_data)["sources"].items():
+        kind, group, cmd = claims[-1]
+        if kind == "group":
+            targets[alias] = f"starshipagentic.commands.{group}:run_group"
+        else:
             sanitized_cmd = cmd.replace("-", "_")
-            alias = cmd.replace("_", "-")
-            expected[alias] = f"starshipagentic.commands.{group}.{sanitized_cmd}.cli:{sanitized_cmd}_command"
-            # Also consider any additional aliases defined in commands-list.yml
-            for extra_alias in cmds.get(cmd, {}).get("aliases", []):
-                expected[extra_alias] = f"starshipagentic.commands.{group}.{sanitized_cmd}.cli:{sanitized_cmd}_command"
+            targets[alias] = f"starshipagentic.commands.{group}.{sanitized_cmd}.cli:{sanitized_cmd}_command"
+    return targets
+
+def generate_expected_aliases(commands_data):
+    """
+    Build the expected [project.scripts] table.
+    Every group and command alias is a console script pointing at the entry-point
+    shim (starshipagentic.shim:main), which forwards to a warm daemon when one is
+    running and otherwise resolves the script name in-process.
+    Also include the main alias and the daemon control script.
+    """
+    expected = {alias: SHIM_TARGET for alias in generate_command_targets(commands_data)}
     # Main alias
-    expected["starshipagentic"] = "starshipagentic.cli:main"
+    expected["starshipagentic"] = SHIM_TARGET
+    expected["starshipagentic-daemon"] = DAEMON_TARGET
     return expected
 
 def update_pyproject_scripts(expected_aliases):
     """
     Update the [project.scripts] section in pyproject.toml.
     Regenerates the scripts from expected_aliases computed from commands-list.yml.
+    Returns True if the scripts table changed (entry points must be reinstalled).
     """
     with open(PYPROJECT_PATH, "rb") as f:
         pyproject = tomli.load(f)
+    if pyproject.get("project", {}).get("scripts") == expected_aliases:
+        return False
     pyproject.setdefault("project", {})["scripts"] = expected_aliases
-    with open(PYPROJECT_PATH, "wb") as f:
-        tomli_w.dump(pyproject, f)
+    atomic_write(PYPROJECT_PATH, tomli_w.dumps(pyproject))
     print("✅ pyproject.toml scripts regenerated.")
+    return True
+
+def update_command_manifest(commands_data, expected_aliases):
+    """
+    Write the precompiled command manifest (commands-manifest.json).
+    The CLI loads this instead of parsing commands-list.yml and pyproject.toml,
+    and falls back to YAML whenever the manifest's source hash is stale.
+    """
+    from src.starshipagentic.utils.command_manifest import build_manifest, hash_file, write_manifest
+
+    manifest = build_manifest(
+        commands_data,
+        scripts=expected_aliases,
+        source_hash=hash_file(COMMANDS_LIST_PATH),
+    )
+    if write_manifest(manifest, MANIFEST_PATH):
+        print("✅ Command manifest regenerated.")
 
 def update_cli_main(expected_aliases):
     """
@@ -320,30 +420,34 @@ def update_cli_main(expected_aliases):
         f.write(content)
     print("✅ CLI updated with command aliases.")
 
-def update_cli_generated(group_names, expected_aliases):
+def update_cli_generated(group_names, command_targets):
     """
     Update the cli_generated.py file with all dynamic content.
     This includes:
-    - Command imports
+    - Command imports (alias -> target table from generate_command_targets)
     - Group themes and icons
     - Group help registration
     
     All generated code is placed inside functions to prevent execution before main is defined.
     """
-    # Generate command imports block
+    if write_if_changed(CLI_GENERATED_PATH, render_cli_generated(group_names, command_targets)):
+        print("✅ CLI generated file updated.")
+    
+    # Now combine cli_static.py and cli_generated.py to create cli.py
+    combine_cli_files()
+
+def render_cli_generated(group_names, command_targets):
+    """Return the content of cli_generated.py."""
+    # Generate the lazy command import table (resolved on first attribute access)
     command_imports = []
-    for alias, target in expected_aliases.items():
-        if alias == "starshipagentic":
-            continue
-        try:
-            module, func = target.split(":")
-        except ValueError:
+    for alias, target in command_targets.items():
+        if ":" not in target:
             print(f"❌ Invalid target format for alias '{alias}': {target}")
             continue
         safe_alias = alias.replace("-", "_")
-        command_imports.append(f"from {module} import {func} as {safe_alias}")
+        command_imports.append(f'    "{safe_alias}": "{target}",')
     
-    command_imports_block = "\n".join(command_imports)
+    command_imports_block = "COMMAND_IMPORTS = {\n" + "\n".join(command_imports) + "\n}"
     
     # Generate group themes and icons block
     themes = "GROUP_THEMES = {\n"
@@ -366,7 +470,7 @@ def update_cli_generated(group_names, expected_aliases):
 """
 AUTO-GENERATED FILE – DO NOT EDIT MANUALLY.
 This file is generated by the sync2_aliases.py tool.
-It contains all dynamic imports, group themes/icons, and group help registration code.
+It contains the lazy command import table, group themes/icons, and group registration code.
 """
 
 # [AUTO-GENERATED COMMAND IMPORTS START]
@@ -374,33 +478,33 @@ It contains all dynamic imports, group themes/icons, and group help registration
 # [AUTO-GENERATED COMMAND IMPORTS END]
 
 
+def __getattr__(name):
+    """Import an aliased command from COMMAND_IMPORTS on first attribute access."""
+    import_path = COMMAND_IMPORTS.get(name)
+    if import_path is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    import importlib
+    module_name, attr_name = import_path.split(":", 1)
+    return getattr(importlib.import_module(module_name), attr_name)
+
+
 # [AUTO-GENERATED GROUP THEMES AND ICONS START]
 {group_themes_icons_block}
 # [AUTO-GENERATED GROUP THEMES AND ICONS END]
 
 
 def register_dynamic_groups():
-    """Register all dynamic command groups with the main CLI."""
-    from starshipagentic.cli import main, enhance_group_help
-    import importlib
+    """Register all dynamic command groups with the main CLI.
+
+    Groups are registered by import path only; a group package and its
+    commands are imported the first time click dispatches to them.
+    """
+    from starshipagentic.cli import main
     GROUP_NAMES = {group_names_block}
     for group in GROUP_NAMES:
-        mod = importlib.import_module(f'starshipagentic.commands.{{group}}')
-        group_obj = getattr(mod, f'{{group}}_group', None)
-        if group_obj is None:
-            continue
-        enhanced = enhance_group_help(group_obj, group)
-        main.add_command(enhanced, group)
+        main.add_lazy_command(group, f'starshipagentic.commands.{{group}}:{{group}}_group')
 '''
-    
-    # Write the generated file
-    with open(CLI_GENERATED_PATH, "w", encoding="utf-8") as f:
-        f.write(content)
-    
-    # Now combine cli_static.py and cli_generated.py to create cli.py
-    combine_cli_files()
-    
-    print("✅ CLI generated file updated.")
+    return content
 
 def combine_cli_files():
     """
@@ -418,12 +522,13 @@ Starship Agentic CLI - Static Content
 This file contains the static parts of the CLI that don't change during generation.
 \"\"\"
 
+from starshipagentic.utils import profiling
+profiling.begin("import")
+
 import click
 from rich.console import Console
-console = Console()
-console.print("[bold red]DEBUG: fleet_commander/cli.py loaded[/bold red]")
-from rich.console import Console
 from rich.panel import Panel
+from starshipagentic.utils.lazy_group import LazyGroup
 
 console = Console()
 
@@ -431,7 +536,7 @@ def enhance_group_help(group, name):
     \"\"\"Enhance a command group with better help text.\"\"\"
     return group
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.option("--all-commands", is_flag=True, help="Display all available commands")
 @click.option("--commands-list", is_flag=True, help="Display commands from commands-list.yml")
 @click.pass_context
@@ -458,6 +563,12 @@ if __name__ == "__main__":
     with open(CLI_GENERATED_PATH, "r", encoding="utf-8") as f:
         generated_content = f.read()
     
+    # Write the combined file
+    if write_if_changed(CLI_PATH, render_combined_cli(static_content, generated_content)):
+        print("✅ Combined CLI file created with dynamic groups registered before __main__ is called.")
+
+def render_combined_cli(static_content, generated_content):
+    """Return the content of cli.py combined from cli_static.py and cli_generated.py."""
     # Extract and remove the "__main__" block from the static content.
     main_block_pattern = r"(if __name__\s*==\s*['\"]__main__['\"]:.*)"
     match = re.search(main_block_pattern, static_content, flags=re.DOTALL)
@@ -471,111 +582,219 @@ if __name__ == "__main__":
     # Insert a dynamic registration call at module level so that commands (e.g. communications_officer) are registered before CLI is invoked.
     registration_call = (
         "from starshipagentic.cli_generated import register_dynamic_groups\n"
-        "register_dynamic_groups()\n"
+        "with profiling.phase(\"register\"):\n"
+        "    register_dynamic_groups()\n"
+        "profiling.end(\"import\")\n"
     )
     # Reattach the __main__ block unchanged.
-    combined = f"{static_without_main}\n\n{generated_content}\n\n{registration_call}\n\n{main_block}"
-    
-    # Write the combined file
-    with open(CLI_PATH, "w", encoding="utf-8") as f:
-        f.write(combined)
-    
-    print("✅ Combined CLI file created with dynamic groups registered before __main__ is called.")
+    return f"{static_without_main}\n\n{generated_content}\n\n{registration_call}\n\n{main_block}"
+
+def check_alias_conflicts(commands_data):
+    """
+    Exit with a table of conflicts if an alias is used by more than one group or command,
+    or is reserved in no-go-alias.txt. Names already taken on $PATH by another program
+    are reported as warnings.
+    """
+    analysis = analyze(commands_data, scripts=generate_expected_aliases(commands_data),
+                       reserved=load_reserved(BASE_DIR / "no-go-alias.txt"), executables=path_executables())
+    conflicts = [conflict for conflict in analysis["conflicts"] if conflict["kind"] != "path"]
+    for conflict in analysis["conflicts"]:
+        if conflict["kind"] == "path":
+            print(f"⚠️  {conflict['message']}")
+    if conflicts:
+        console = Console()
+        table = Table(title="Alias Conflicts Detected", show_lines=True)
+        table.add_column("Alias", style="bold red")
+        table.add_column("Conflict Details", style="magenta")
+        for conflict in conflicts:
+            table.add_row(conflict["alias"], conflict["message"].split(": ", 1)[-1])
+        console.print(table)
+        sys.exit(1)
+
+def sync_group(group, data):
+    """
+    Scaffold a group's missing command packages and update its __init__.py.
+    Returns the seconds it took.
+    """
+    started = time.perf_counter()
+    # Check if group folder exists; if not, create it.
+    group_dir = COMMANDS_DIR / group
+    if not group_dir.exists():
+        os.makedirs(group_dir, exist_ok=True)
+        print(f"Created group directory: {group_dir}")
+    # For each command in the group, scaffold its package if missing.
+    for cmd in data.get("commands", {}):
+        scaffold_command_package(group, cmd)
+    update_group_init(group)
+    return time.perf_counter() - started
+
+def group_files_current(group, data):
+    """
+    Return whether a group's generated files are all on disk: every command package has
+    its __init__.py, cli.py and services.py, and the group's __init__.py is exactly what
+    sync would write. Scaffolded command files are meant to be edited, so only their
+    presence is checked.
+    """
+    for cmd in data.get("commands", {}):
+        package_dir = COMMANDS_DIR / group / cmd.replace("-", "_")
+        if not all((package_dir / name).is_file() for name in ("__init__.py", "cli.py", "services.py")):
+            return False
+    try:
+        with open(COMMANDS_DIR / group / "__init__.py", "r", encoding="utf-8") as f:
+            return f.read() == render_group_init(group, group_packages(group))
+    except OSError:
+        return False
+
+def sync_groups(commands_data, state, force=False, jobs=None):
+    """
+    Scaffold missing command packages and update each group's __init__.py on a worker pool,
+    skipping groups whose commands-list.yml entry and command packages are unchanged
+    since the last sync and whose generated files are intact (see group_files_current()).
+    Returns the names of the skipped groups.
+    """
+    skipped, pending = [], {}
+    for group, data in commands_data.items():
+        group_hash = content_hash(data)
+        recorded = state["groups"].get(group, {})
+        if (not force and recorded.get("hash") == group_hash
+                and recorded.get("packages") == group_packages(group)
+                and group_files_current(group, data)):
+            skipped.append(group)
+        else:
+            pending[group] = group_hash
+    errors = []
+    with ThreadPoolExecutor(max_workers=jobs or min(8, os.cpu_count() or 1)) as pool:
+        futures = {pool.submit(sync_group, group, commands_data[group]): group for group in pending}
+        for future in as_completed(futures):
+            group = futures[future]
+            try:
+                elapsed = future.result()
+            except Exception as e:
+                # Leave the group unrecorded so the next run retries it
+                state["groups"].pop(group, None)
+                errors.append(e)
+                continue
+            # Only record a group once its worker has finished scaffolding it
+            state["groups"][group] = {"hash": pending[group], "packages": group_packages(group)}
+            state["timings"][f"group:{group}"] = elapsed
+    for group in set(state["groups"]) - set(commands_data):
+        del state["groups"][group]
+    if errors:
+        raise errors[0]
+    return skipped
+
+def expected_files(commands_data):
+    """
+    Build every file a sync would write, in memory, without touching the disk.
+    Scaffold files are included only where they are missing, and pyproject.toml only
+    if its scripts table would change. Returns a {path: content} mapping.
+    """
+    from src.starshipagentic.utils.command_manifest import build_manifest, hash_file, render_manifest
+
+    files = {}
+    for group, data in commands_data.items():
+        packages = set(group_packages(group))
+        for cmd in data.get("commands", {}):
+            sanitized_command = cmd.replace("-", "_")
+            package_dir = COMMANDS_DIR / group / sanitized_command
+            for name, template in (("__init__.py", INIT_TEMPLATE), ("cli.py", CLI_TEMPLATE),
+                                   ("services.py", SERVICES_TEMPLATE)):
+                if not (package_dir / name).exists():
+                    files[package_dir / name] = template.format(command=sanitized_command)
+            packages.add(sanitized_command)
+        files[COMMANDS_DIR / group / "__init__.py"] = render_group_init(group, sorted(packages))
+    files[COMMANDS_DIR / "__init__.py"] = render_commands_init(sorted(set(group_dirs()) | set(commands_data)))
+
+    expected_aliases = generate_expected_aliases(commands_data)
+    with open(PYPROJECT_PATH, "rb") as f:
+        pyproject = tomli.load(f)
+    if pyproject.get("project", {}).get("scripts") != expected_aliases:
+        pyproject.setdefault("project", {})["scripts"] = expected_aliases
+        files[PYPROJECT_PATH] = tomli_w.dumps(pyproject)
+    files[MANIFEST_PATH] = render_manifest(build_manifest(
+        commands_data, scripts=expected_aliases, source_hash=hash_file(COMMANDS_LIST_PATH)))
+
+    generated = render_cli_generated(list(commands_data.keys()), generate_command_targets(commands_data))
+    files[CLI_GENERATED_PATH] = generated
+    with open(BASE_DIR / "src" / "starshipagentic" / "cli_static.py", "r", encoding="utf-8") as f:
+        files[CLI_PATH] = render_combined_cli(f.read(), generated)
+    return files
+
+def diff_file(path, expected):
+    """
+    Compare expected content with a file on disk.
+    Returns None if they match, else (status, added lines, removed lines).
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            actual = f.read()
+    except OSError:
+        return ("missing", expected.count("\n"), 0)
+    if actual == expected:
+        return None
+    added = removed = 0
+    for line in difflib.unified_diff(actual.splitlines(), expected.splitlines(), lineterm="", n=0):
+        if line.startswith("+") and not line.startswith("+++"):
+            added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed += 1
+    return ("changed", added, removed)
+
+def check_sync(jobs=None):
+    """
+    Dry run: report the files a sync would create or change, without writing anything.
+    Returns True if the tree is in sync.
+    """
+    started = time.perf_counter()
+    commands_data = load_commands_list()
+    check_alias_conflicts(commands_data)
+    files = expected_files(commands_data)
+    with ThreadPoolExecutor(max_workers=jobs or min(8, os.cpu_count() or 1)) as pool:
+        diffs = dict(zip(files, pool.map(lambda path: diff_file(path, files[path]), files)))
+    out_of_sync = {path: diff for path, diff in diffs.items() if diff is not None}
+    for path, (status, added, removed) in sorted(out_of_sync.items()):
+        print(f"  {status:8} {os.path.relpath(path, BASE_DIR)} (+{added} -{removed})")
+    elapsed = time.perf_counter() - started
+    if out_of_sync:
+        print(f"❌ {len(out_of_sync)} of {len(files)} generated files are out of sync with commands-list.yml "
+              f"({elapsed:.2f}s). Run python tools/sync2_aliases.py")
+        return False
+    print(f"✅ All {len(files)} generated files are in sync with commands-list.yml ({elapsed:.2f}s).")
+    return True
 
-def sync_cli_file():
+def sync_cli_file(state=None, force=False, jobs=None):
     """
     Synchronize cli.py by ensuring that for each group in commands-list.yml,
     if the file for that group doesn't exist, scaffold a command module.
     Then update the import section in cli.py.
+    Records per-group hashes, timings and the scripts table hash in state.
+    Returns True if the [project.scripts] table in pyproject.toml changed.
     """
     log_messages = []
     def log(msg):
         log_messages.append(msg)
         print(msg)
     log("  ├─ Synchronizing CLI file...")
+    if state is None:
+        state = load_sync_state()
     commands_data = load_commands_list()
+    # Abort on conflicting aliases before anything is written
+    check_alias_conflicts(commands_data)
     group_names = list(commands_data.keys())
     log(f"🔍 Groups: {', '.join(group_names)}")
-    for group in group_names:
-        # Check if group folder exists; if not, create it.
-        group_dir = COMMANDS_DIR / group
-        if not group_dir.exists():
-            os.makedirs(group_dir)
-            log(f"Created group directory: {group_dir}")
-        # For each command in the group, scaffold its package if missing.
-        for cmd in commands_data[group].get("commands", {}):
-            scaffold_command_package(group, cmd)
-        update_group_init(group)
+    skipped = sync_groups(commands_data, state, force=force, jobs=jobs)
+    if skipped:
+        log(f"⏭  Unchanged groups skipped: {', '.join(skipped)}")
+    state["skipped"] = [f"group:{group}" for group in skipped]
     update_commands_init(list(commands_data.keys()))
     expected_aliases = generate_expected_aliases(commands_data)
-    import sys
-    # Build a detailed mapping of alias -> list of source tuples.
-    # Each tuple: (source_type, group, command)
-    # - source_type is "group" for group aliases
-    #   and "command" for command aliases.
-    # For command aliases, group & command specify the origin.
-    alias_sources = {}
-
-    def add_alias(alias, source_type, group, cmd=None):
-        # Build the source tuple.
-        source = (source_type, group, cmd)
-        alias_sources.setdefault(alias, []).append(source)
-
-    for group, data in commands_data.items():
-        # Group alias.
-        add_alias(group, "group", group)
-        # Now the commands within that group.
-        for cmd, cmd_data in data.get("commands", {}).items():
-            default_alias = cmd.replace("_", "-")
-            add_alias(default_alias, "command", group, cmd)
-            # Process extra aliases.
-            for extra in cmd_data.get("aliases", []):
-                add_alias(extra, "command", group, cmd)
-
-    # Now check for conflicts. For a given alias, if the sources list contains entries
-    # that don’t all refer to the same command, then that alias is ambiguous.
-    conflicts = []
-    for alias, sources in alias_sources.items():
-        if len(sources) > 1:
-            unique = set(sources)
-            if len(unique) == 1 and all(s[0] == "command" for s in sources):
-                continue
-            details = []
-            for s in sources:
-                if s[0] == "group":
-                    details.append(f"group {s[1]}")
-                elif s[0] == "command":
-                    details.append(f"command {s[1]}:{s[2]}")
-            conflicts.append(f"Alias '{alias}' is used in multiple contexts: " + ", ".join(details))
-    no_go_path = BASE_DIR / "no-go-alias.txt"
-    if os.path.exists(no_go_path):
-        with open(no_go_path, "r", encoding="utf-8") as nf:
-            no_go = {line.strip() for line in nf if line.strip()}
-        for alias in alias_sources:
-            if alias in no_go:
-                conflicts.append(f"Alias '{alias}' is reserved and cannot be used (found in no-go-alias.txt).")
-    if conflicts:
-        console = Console()
-        table = Table(title="Alias Conflicts Detected", show_lines=True)
-        table.add_column("Alias", style="bold red")
-        table.add_column("Conflict Details", style="magenta")
-        for conflict in conflicts:
-            try:
-                alias_val = conflict.split("'")[1]
-            except IndexError:
-                alias_val = "N/A"
-            try:
-                details = conflict.split(": ", 1)[1]
-            except IndexError:
-                details = conflict
-            table.add_row(alias_val, details)
-        console.print(table)
-        sys.exit(1)
-    update_pyproject_scripts(expected_aliases)
-    update_cli_generated(group_names, expected_aliases)
+    scripts_changed = update_pyproject_scripts(expected_aliases)
+    state["scripts"] = content_hash(expected_aliases)
+    update_command_manifest(commands_data, expected_aliases)
+    update_cli_generated(group_names, generate_command_targets(commands_data))
     for msg in log_messages:
         print(msg)
-    return True
+    return scripts_changed
 
 def fix_command_imports():
     """
@@ -586,19 +805,33 @@ def fix_command_imports():
     # (This function can be expanded as necessary.)
     return True
 
-def sync_aliases():
+def sync_aliases(force=False, install=None, jobs=None):
     """
     Main synchronization function.
     It reads commands-list.yml, scaffolds missing command packages,
     updates group and top-level __init__.py files, pyproject.toml scripts,
     and updates the main CLI file.
+    Entry points are reinstalled (pip install -e .) only when the scripts table
+    differs from the one last installed, unless install is True (always) or False (never).
     """
     print("🔄 Starting synchronization based on commands-list.yml...")
-    sync_cli_file()
+    started = time.perf_counter()
+    state = load_sync_state()
+    sync_cli_file(state, force=force, jobs=jobs)
     fix_command_imports()
-    import subprocess
-    subprocess.run(["pip", "install", "-e", "."], check=True)
-    print("Sync complete.")
+    if install or (install is None and state["scripts"] != state.get("installed_scripts")):
+        install_started = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "pip", "install", "-e", "."], cwd=BASE_DIR, check=True)
+        state["timings"]["pip-install"] = time.perf_counter() - install_started
+        state["installed_scripts"] = state["scripts"]
+    else:
+        reason = "--no-install" if install is False else "[project.scripts] unchanged"
+        print(f"⏭  {reason}; skipped pip install -e .")
+        state["skipped"].append("pip-install")
+    saved = sum(state["timings"].get(step, 0.0) for step in state["skipped"])
+    save_sync_state({key: value for key, value in state.items() if key != "skipped"})
+    print(f"Sync complete in {time.perf_counter() - started:.2f}s "
+          f"({len(state['skipped'])} steps skipped, ~{saved:.2f}s saved).")
     return True
 
 def main():
@@ -609,12 +842,23 @@ def main():
     
     parser = argparse.ArgumentParser(description="Synchronize command aliases and scaffold command packages")
     parser.add_argument("--fix-file", help="Fix imports in a specific command file")
+    parser.add_argument("--force", action="store_true", help="Regenerate every group, ignoring the sync state")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report files that are out of sync; exit 1 if any (writes nothing)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker threads for scaffolding and --check")
+    install = parser.add_mutually_exclusive_group()
+    install.add_argument("--install", action="store_true", default=None,
+                         help="Always run pip install -e . after syncing")
+    install.add_argument("--no-install", dest="install", action="store_false",
+                         help="Never run pip install -e . after syncing")
     args = parser.parse_args()
     if args.fix_file:
         # Functionality for a specific file fix can be added here.
         print(f"Fixing file: {args.fix_file}")
+    elif args.check:
+        sys.exit(0 if check_sync(jobs=args.jobs) else 1)
     else:
-        sync_aliases()
+        sync_aliases(force=args.force, install=args.install, jobs=args.jobs)
 
 if __name__ == "__main__":
     main()
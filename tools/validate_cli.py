@@ -7,255 +7,151 @@
 #
 # It is licensed under the GNU Affero General Public License (AGPL) v3 or later.
 # For full details, see the LICENSE.md file in the project root.
-"""Validate CLI functionality against the command registry."""
+"""Validate CLI functionality against the command registry.
 
+The click tree is driven in-process with CliRunner: ``--all-commands``,
+``--commands-list`` and every group's ``--help`` are rendered once each,
+their output is indexed into a token set, and the per-group, per-command
+and per-alias checks then run in a thread pool as set lookups. Alias
+scripts are resolved through the manifest alias table and their help is
+rendered from the click command, without spawning any process.
+"""
+
+import importlib
+import os
+import re
 import sys
-import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import re
-import os
 
-# Add the project root to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add the package sources to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import click
+from click.testing import CliRunner
+from starshipagentic.cli import main
+from starshipagentic.utils.alias_launcher import alias_target
+from starshipagentic.utils.command_registry import command_registry
+
+ELLIPSES = ("...", "\u2026")
+
+def render(args):
+    """
+    Run the CLI in-process with wide output.
+
+    Args:
+        args (list): Arguments for ``starshipagentic``
+
+    Returns:
+        tuple: ``(exit code, output)``
+    """
+    result = CliRunner().invoke(main, args, env={"COLUMNS": "500", "STARSHIPAGENTIC_PLAIN": "1"})
+    return result.exit_code, result.output
 
-from src.starshipagentic.utils.command_registry import command_registry
-from rich.console import Console
+def index_output(output):
+    """
+    Index rendered output for membership checks.
 
-console = Console()
+    Returns:
+        tuple: ``(tokens, truncated prefixes)``; the prefixes come from tokens
+        cut short with an ellipsis by table layout
+    """
+    tokens = set(re.split(r"[\s,│┃|]+", output))
+    prefixes = tuple(token[:-len(ellipsis)] for token in tokens for ellipsis in ELLIPSES
+                     if token.endswith(ellipsis) and len(token) > len(ellipsis))
+    return tokens, prefixes
 
-def output_contains(expected, output):
+def output_contains(expected, index):
     """
-    Check if `expected` is present in `output`. If not found exactly,
-    then search for any token ending with '...' whose prefix matches `expected`.
+    Check if ``expected`` is a token of the indexed output. If not found exactly,
+    accept a token ending with an ellipsis whose prefix matches ``expected``.
     """
-    if expected in output:
-        return True
+    tokens, prefixes = index
+    return expected in tokens or expected.startswith(prefixes)
+
+def check_names(label, index, names):
+    """Return problems for the names (``(name, description)`` pairs) missing from an indexed output."""
+    return [f"{description} is missing from {label} output" for name, description in names
+            if not output_contains(name, index)]
 
-    # Look for any non-whitespace tokens ending with '...'
-    import re
-    tokens = re.findall(r'\S+\.\.\.', output)
-    for token in tokens:
-        # Remove the ellipsis
-        prefix = token[:-3]
-        if expected.startswith(prefix):
-            return True
-    return False
+def check_alias(alias, group_name, cmd_name):
+    """Return problems if an alias script does not resolve to its command or cannot render help."""
+    target = alias_target(alias)
+    if target is None:
+        return [f"Alias {alias} for {group_name} {cmd_name} is not in the manifest alias table"]
+    if target[:2] != (group_name, cmd_name):
+        return [f"Alias {alias} runs {target[0]} {target[1]} instead of {group_name} {cmd_name}"]
+    module_name, attr_name = target[2].split(":", 1)
+    try:
+        command = getattr(importlib.import_module(module_name), attr_name)
+        with click.Context(command, info_name=alias) as ctx:
+            command.get_help(ctx)
+    except Exception as e:
+        return [f"Alias {alias} for {group_name} {cmd_name} doesn't work: {type(e).__name__}: {e}"]
+    return []
 
-def validate_cli():
+def validate_cli(jobs=None):
     """Validate that the CLI correctly displays all commands and aliases."""
-    # Get all commands from the registry
-    all_groups = command_registry.get_all_groups()
-    
+    started = time.perf_counter()
     print("🔍 Validating CLI against command registry...")
-    
-    # Test --all-commands output
-    try:
-        result = subprocess.run(
-            ["starshipagentic", "--all-commands"], 
-            capture_output=True, 
-            text=True,
-            env=dict(os.environ, COLUMNS="500"),
-            check=True
-        )
-        output = result.stdout
-        
-        # Check that all commands appear in the output
-        missing_commands = []
-        for group_name in all_groups:
-            for cmd_info in command_registry.get_all_commands(group_name):
-                cmd_name = cmd_info if isinstance(cmd_info, str) else cmd_info['name']
-                full_cmd = f"{group_name} {cmd_name}"
-                
-                # More robust check - look for the command in various formats
-                cmd_found = False
-                
-                # Check for exact command name
-                if cmd_name in output:
-                    cmd_found = True
-                
-                # Check for full command (group + command)
-                if full_cmd in output:
-                    cmd_found = True
-                
-                # Check for command with spaces instead of hyphens (for display purposes)
-                cmd_display = cmd_name.replace('-', ' ')
-                if cmd_display in output:
-                    cmd_found = True
-                
-                # Check for full command with spaces instead of hyphens
-                full_cmd_display = f"{group_name} {cmd_display}"
-                if full_cmd_display in output:
-                    cmd_found = True
-                
-                if not cmd_found:
-                    missing_commands.append(full_cmd)
-        
-        if missing_commands:
-            print("❌ Some commands are missing from --all-commands output:")
-            for cmd in missing_commands:
-                print(f"  - {cmd}")
-        else:
-            print("✅ All commands appear in --all-commands output")
-        
-        # Check that all aliases appear in the output
-        missing_aliases = []
-        for group_name in all_groups:
-            for cmd_info in command_registry.get_all_commands(group_name):
-                cmd_name = cmd_info if isinstance(cmd_info, str) else cmd_info['name']
-                aliases = command_registry.get_aliases_for_command(group_name, cmd_name)
-                for alias in aliases:
-                    # Use helper function to allow for truncated output
-                    if not (output_contains(alias, output) or
-                            output_contains(f", {alias}", output) or
-                            output_contains(f"{alias},", output)):
-                        missing_aliases.append(f"{alias} (for {group_name} {cmd_name})")
-        
-        if missing_aliases:
-            print("❌ Some aliases are missing from --all-commands output:")
-            for alias in missing_aliases:
-                print(f"  - {alias}")
-        else:
-            print("✅ All aliases appear in --all-commands output")
-            
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running starshipagentic --all-commands: {e}")
-        return False
-    
-    # Test help output for each group
-    group_help_issues = False
-    for group_name in all_groups:
-        try:
-            result = subprocess.run(
-                ["starshipagentic", group_name, "--help"], 
-                capture_output=True, 
-                text=True,
-                env=dict(os.environ, COLUMNS="500"),
-                check=True
-            )
-            output = result.stdout
-            
-            # Check that all commands in this group appear in the output
-            missing_commands = []
-            for cmd_info in command_registry.get_all_commands(group_name):
-                cmd_name = cmd_info if isinstance(cmd_info, str) else cmd_info['name']
-                # Use a more robust check - look for the command name in various formats
-                # The command might appear as "group_name cmd_name" or just "cmd_name"
-                if not (cmd_name in output or f"{group_name} {cmd_name}" in output):
-                    # Try with hyphens replaced by spaces (for display purposes)
-                    cmd_display = cmd_name.replace('-', ' ')
-                    if not (cmd_display in output or f"{group_name} {cmd_display}" in output):
-                        missing_commands.append(f"{group_name} {cmd_name}")
-            
-            if missing_commands:
-                group_help_issues = True
-                print(f"❌ Some commands are missing from {group_name} --help output:")
-                for cmd in missing_commands:
-                    print(f"  - {cmd}")
-            
-            # Check that all aliases for this group appear in the output
-            missing_aliases = []
-            for cmd_info in command_registry.get_all_commands(group_name):
-                cmd_name = cmd_info if isinstance(cmd_info, str) else cmd_info['name']
-                aliases = command_registry.get_aliases_for_command(group_name, cmd_name)
-                for alias in aliases:
-                    # Aliases might be displayed in various formats or combined with others
-                    if not (output_contains(alias, output) or
-                            output_contains(f", {alias}", output) or
-                            output_contains(f"{alias},", output)):
-                        missing_aliases.append(f"{alias} (for {group_name} {cmd_name})")
-            
-            if missing_aliases:
-                group_help_issues = True
-                print(f"❌ Some aliases are missing from {group_name} --help output:")
-                for alias in missing_aliases:
-                    print(f"  - {alias}")
-                
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Error running starshipagentic {group_name} --help: {e}")
-            group_help_issues = True
-    
-    if not group_help_issues:
-        print("✅ All group help displays show correct commands and aliases")
-    
-    # Test --commands-list output
-    try:
-        result = subprocess.run(
-            ["starshipagentic", "--commands-list"], 
-            capture_output=True, 
-            text=True,
-            env=dict(os.environ, COLUMNS="500"),
-            check=True
-        )
-        output = result.stdout
-        
-        # Check that all commands appear in the output
-        missing_commands = []
-        for group_name in all_groups:
-            for cmd_info in command_registry.get_all_commands(group_name):
-                cmd_name = cmd_info if isinstance(cmd_info, str) else cmd_info['name']
-                full_cmd = f"{group_name} {cmd_name}"
-                
-                # More robust check - look for the command in various formats
-                cmd_found = False
-                
-                # Check for exact command name
-                if cmd_name in output:
-                    cmd_found = True
-                
-                # Check for full command (group + command)
-                if full_cmd in output:
-                    cmd_found = True
-                
-                # Check for command with spaces instead of hyphens (for display purposes)
-                cmd_display = cmd_name.replace('-', ' ')
-                if cmd_display in output:
-                    cmd_found = True
-                
-                # Check for full command with spaces instead of hyphens
-                full_cmd_display = f"{group_name} {cmd_display}"
-                if full_cmd_display in output:
-                    cmd_found = True
-                
-                if not cmd_found:
-                    missing_commands.append(full_cmd)
-        
-        if missing_commands:
-            print("❌ Some commands are missing from --commands-list output:")
-            for cmd in missing_commands:
-                print(f"  - {cmd}")
-        else:
-            print("✅ All commands appear in --commands-list output")
-            
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running starshipagentic --commands-list: {e}")
-    
-    # Test that all aliases work
-    alias_issues = False
-    for group_name in all_groups:
-        for cmd_name in command_registry.get_all_commands(group_name):
-            aliases = command_registry.get_aliases_for_command(group_name, cmd_name)
-            for alias in aliases:
-                try:
-                    # Just check if the alias command exists and returns a valid exit code
-                    # Use --help to avoid actually running the command
-                    result = subprocess.run(
-                        [alias, "--help"], 
-                        capture_output=True, 
-                        text=True,
-                        env=dict(os.environ, COLUMNS="500"),
-                        check=True
-                    )
-                    # Check if the help output mentions the full command name
-                    # This check is now handled by the base_command wrapper
-                    pass
-                except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                    print(f"❌ Alias {alias} for {group_name} {cmd_name} doesn't work: {e}")
-                    alias_issues = True
-    
-    if not alias_issues:
-        print("✅ All aliases are working correctly")
-    
-    return True
+
+    groups = list(command_registry.get_all_groups())
+    aliases = {group_name: command_registry.aliases_for_group(group_name) for group_name in groups}
+    commands = [(f"{group_name} {cmd_name}", cmd_name, cmd_aliases)
+                for group_name in groups for cmd_name, cmd_aliases in aliases[group_name].items()]
+    command_names = [(cmd_name, full_cmd) for full_cmd, cmd_name, _ in commands]
+    alias_names = [(alias, f"Alias {alias} (for {full_cmd})")
+                   for full_cmd, _, cmd_aliases in commands for alias in cmd_aliases]
+
+    # CliRunner swaps the process-wide streams, so rendering is sequential
+    renders = [("--all-commands", ["--all-commands"]), ("--commands-list", ["--commands-list"])]
+    renders += [(f"{group_name} --help", [group_name, "--help"]) for group_name in groups]
+    outputs, render_problems = {}, []
+    for label, args in renders:
+        exit_code, output = render(args)
+        if exit_code != 0:
+            render_problems.append(f"starshipagentic {' '.join(args)} exited with {exit_code}")
+        outputs[label] = index_output(output)
+
+    # (section, check) pairs; each check returns a list of problems
+    checks = [
+        ("--all-commands", lambda: check_names("--all-commands", outputs["--all-commands"],
+                                               command_names + alias_names)),
+        ("--commands-list", lambda: check_names("--commands-list", outputs["--commands-list"], command_names)),
+    ]
+    for group_name in groups:
+        label = f"{group_name} --help"
+        group_names = [(cmd_name, f"{group_name} {cmd_name}") for cmd_name in aliases[group_name]]
+        group_names += [(alias, f"Alias {alias} (for {group_name} {cmd_name})")
+                        for cmd_name, cmd_aliases in aliases[group_name].items() for alias in cmd_aliases]
+        checks.append(("help", lambda label=label, names=group_names: check_names(label, outputs[label], names)))
+        for cmd_name, cmd_aliases in aliases[group_name].items():
+            for alias in cmd_aliases:
+                checks.append(("aliases", lambda a=alias, g=group_name, c=cmd_name: check_alias(a, g, c)))
+
+    sections = {"render": render_problems, "--all-commands": [], "--commands-list": [], "help": [], "aliases": []}
+    with ThreadPoolExecutor(max_workers=jobs or min(8, os.cpu_count() or 1)) as pool:
+        futures = [(section, pool.submit(check)) for section, check in checks]
+        for section, future in futures:
+            sections[section].extend(future.result())
+
+    messages = {
+        "render": "All listings and help screens render",
+        "--all-commands": "All commands appear in --all-commands output",
+        "--commands-list": "All commands appear in --commands-list output",
+        "help": "All group help displays show correct commands and aliases",
+        "aliases": "All aliases are working correctly",
+    }
+    for section, problems in sections.items():
+        for problem in problems:
+            print(f"❌ {problem}")
+        if not problems:
+            print(f"✅ {messages[section]}")
+
+    print(f"⏱  Checked {len(groups)} groups, {len(commands)} commands and {len(alias_names)} aliases "
+          f"in {time.perf_counter() - started:.2f}s")
+    return not any(sections.values())
 
 def fix_cli_issues():
     """Attempt to fix any CLI issues by updating the command registry."""
@@ -19,6 +19,7 @@ import click
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.starshipagentic.utils.alias_analysis import analyze, load_pyproject_scripts, load_reserved, path_executables
 from src.starshipagentic.utils.command_registry import command_registry
 
 def get_implemented_commands():
@@ -61,47 +62,16 @@ def get_implemented_commands():
                 ]
             }
     
-    # Add aliases from pyproject.toml
-    try:
-        import tomli
-    except ImportError:
-        import tomllib as tomli
-        
-    pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-    if pyproject_path.exists():
-        with open(pyproject_path, "rb") as f:
-            pyproject = tomli.load(f)
-        
-        # Extract aliases from project.scripts
-        scripts = pyproject.get("project", {}).get("scripts", {})
-        for alias, target in scripts.items():
-            # Skip the main command
-            if alias == "starshipagentic":
-                continue
-                
-            # Parse the target to get the group and command
-            # Format is typically: "starshipagentic.commands.group_cmds:command_name_command"
-            try:
-                module_path, func_name = target.split(":")
-                group_name = module_path.split(".")[-1].replace("_cmds", "")
-                
-                # The command function name typically ends with "_command"
-                # and is derived from the actual command name
-                cmd_func_name = func_name.replace("_command", "")
-                
-                # Convert function name to command name (replace underscores with hyphens)
-                cmd_name = cmd_func_name.replace("_", "-")
-                
-                # Add the alias to the appropriate command
-                if group_name in implemented_commands:
-                    for command_name, command_data in implemented_commands[group_name]["commands"].items():
-                        # Check if this is the right command by comparing hyphenated names
-                        if command_name.replace("-", "_") == cmd_func_name:
-                            implemented_commands[group_name]["commands"][command_name]["aliases"].append(alias)
-                            break
-            except (ValueError, KeyError, IndexError):
-                # Skip entries that don't match the expected format
-                continue
+    # Add aliases from pyproject.toml: every console script named after a command's alias
+    scripts = load_pyproject_scripts()
+    targets = analyze(command_registry._commands, scripts)["targets"]
+    for alias in scripts:
+        target = targets.get(alias)
+        if target is None or len(target) != 2 or alias == target[1]:
+            continue
+        group_name, command_name = target
+        if command_name in implemented_commands.get(group_name, {}).get("commands", {}):
+            implemented_commands[group_name]["commands"][command_name]["aliases"].append(alias)
     
     return implemented_commands
 
@@ -154,8 +124,12 @@ def validate_commands():
                     f"Documented: {doc_aliases}, Implemented: {impl_aliases}"
                 )
     
+    # Check for alias conflicts (ambiguous, reserved or taken on $PATH)
+    alias_conflicts = [conflict["message"] for conflict in command_registry.alias_conflicts(
+        load_reserved(), path_executables())]
+    
     # Print results
-    if not missing_implementations and not missing_documentation and not alias_inconsistencies:
+    if not missing_implementations and not missing_documentation and not alias_inconsistencies and not alias_conflicts:
         print("✅ All commands are properly documented and implemented!")
         return True
     
@@ -174,8 +148,29 @@ def validate_commands():
         for item in alias_inconsistencies:
             print(f"  - {item}")
     
+    if alias_conflicts:
+        print("\n❌ Alias conflicts:")
+        for item in alias_conflicts:
+            print(f"  - {item}")
+    
+    return False
+
+def validate_implementations():
+    """Check that every documented command imports and accepts its documented options."""
+    report = command_registry.validate_commands()
+    print(f"\nChecked {report['checked']} command implementations "
+          f"({report['cached']} unchanged since the last passing check)")
+    if report["ok"]:
+        print("✅ All command implementations import and accept their documented options!")
+        return True
+
+    print("\n❌ Command implementations with problems:")
+    for result in report["commands"]:
+        for problem in result["problems"]:
+            print(f"  - {result['group']} {result['command']}: {problem}")
     return False
 
 if __name__ == "__main__":
     success = validate_commands()
+    success = validate_implementations() and success
     sys.exit(0 if success else 1)